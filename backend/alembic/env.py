@@ -11,6 +11,9 @@ from app.models.position import Position  # noqa: F401
 from app.models.trade import Trade  # noqa: F401
 from app.models.signal import Signal  # noqa: F401
 from app.models.nav_history import NAVHistory  # noqa: F401
+from app.models.scheduler_lease import SchedulerLease  # noqa: F401
+from app.models.social_mention import SocialMention, SocialMentionStats  # noqa: F401
+from app.models.trend_snapshot import TrendSnapshot  # noqa: F401
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.database_url)
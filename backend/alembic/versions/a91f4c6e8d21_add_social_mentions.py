@@ -0,0 +1,52 @@
+"""add social_mentions and social_mention_stats
+
+Revision ID: a91f4c6e8d21
+Revises: 7c3e1a9d2b40
+Create Date: 2026-10-19 10:31:47.902115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91f4c6e8d21'
+down_revision: Union[str, Sequence[str], None] = '7c3e1a9d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'social_mentions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('symbol', sa.String(length=20), nullable=False),
+        sa.Column('source', sa.String(length=50), nullable=False),
+        sa.Column('mention_count', sa.Float(), nullable=False),
+        sa.Column('sentiment', sa.Float(), nullable=False),
+        sa.Column('recorded_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_social_mentions_symbol_source', 'social_mentions', ['symbol', 'source', 'recorded_at'], unique=False)
+    op.create_table(
+        'social_mention_stats',
+        sa.Column('symbol', sa.String(length=20), nullable=False),
+        sa.Column('source', sa.String(length=50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('mean', sa.Float(), nullable=False),
+        sa.Column('m2', sa.Float(), nullable=False),
+        sa.Column('last_zscore', sa.Float(), nullable=False),
+        sa.Column('last_observed', sa.String(length=40), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('symbol', 'source'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('social_mention_stats')
+    op.drop_index('ix_social_mentions_symbol_source', table_name='social_mentions')
+    op.drop_table('social_mentions')
@@ -0,0 +1,35 @@
+"""add trend_snapshots
+
+Revision ID: d4b8e2f17a63
+Revises: a91f4c6e8d21
+Create Date: 2026-10-19 14:05:22.417390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8e2f17a63'
+down_revision: Union[str, Sequence[str], None] = 'a91f4c6e8d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'trend_snapshots',
+        sa.Column('keyword', sa.String(length=50), nullable=False),
+        sa.Column('timeframe', sa.String(length=20), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('fetched_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('keyword', 'timeframe'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('trend_snapshots')
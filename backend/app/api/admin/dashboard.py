@@ -44,3 +44,17 @@ async def get_activity_feed(limit: int = 30, db: Session = Depends(get_db)):
             }
         )
     return {"items": items}
+
+
+@router.get("/dashboard/snapshot")
+async def get_dashboard_snapshot(nav_limit: int = 90, trade_limit: int = 50, db: Session = Depends(get_db)):
+    """
+    대시보드 첫 로드용 단일 응답 — stats, pms, pm-performance, nav history, exposure,
+    heatmap, risk overview, scheduler status, recent trades를 한 번의 DB 읽기로 구성
+    """
+    from datetime import datetime, timezone
+    from app.services.dashboard import load_snapshot
+
+    snapshot = load_snapshot(db, nav_limit=nav_limit, trade_limit=trade_limit)
+    snapshot["generated_at"] = datetime.now(timezone.utc).isoformat()
+    return snapshot
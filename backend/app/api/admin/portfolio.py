@@ -5,23 +5,16 @@ from app.db.base import get_db
 from app.models.position import Position
 from app.models.trade import Trade
 from app.models.pm import PM
+from app.services.dashboard import (
+    SYMBOL_SECTORS,
+    PositionAggregate,
+    build_exposure,
+    build_heatmap,
+    build_trades,
+)
 
 router = APIRouter(prefix="/api/fund", tags=["admin-portfolio"])
 
-# 섹터 분류 (간소화)
-SYMBOL_SECTORS = {
-    "AAPL": "Technology", "MSFT": "Technology", "GOOGL": "Technology",
-    "AMZN": "Consumer", "META": "Technology", "NVDA": "Technology",
-    "TSLA": "Automotive", "COIN": "Crypto", "MSTR": "Crypto",
-    "BTC-USD": "Crypto", "ETH-USD": "Crypto", "SOL-USD": "Crypto",
-    "SPY": "Index ETF", "QQQ": "Index ETF", "IWM": "Index ETF",
-    "TLT": "Bonds", "GLD": "Commodities", "UUP": "Currencies",
-    "VIX": "Volatility", "UVXY": "Volatility", "SQQQ": "Inverse ETF",
-    "EWJ": "Asia ETF", "EWY": "Asia ETF", "FXI": "Asia ETF",
-    "GME": "Meme", "AMC": "Meme",
-}
-
-
 @router.get("/positions/breakdown")
 async def get_positions_breakdown(db: Session = Depends(get_db)):
     positions = db.query(Position).all()
@@ -60,99 +53,21 @@ async def get_positions_breakdown(db: Session = Depends(get_db)):
 @router.get("/trades")
 async def get_trades(limit: int = 50, db: Session = Depends(get_db)):
     trades = db.query(Trade).order_by(Trade.executed_at.desc()).limit(limit).all()
-    pms = {pm.id: pm for pm in db.query(PM).all()}
-
-    return {
-        "trades": [
-            {
-                "id": t.id,
-                "pm_id": t.pm_id,
-                "pm_name": pms.get(t.pm_id, PM(name=t.pm_id, emoji="🤖")).name,
-                "pm_emoji": pms.get(t.pm_id, PM(name=t.pm_id, emoji="🤖")).emoji,
-                "symbol": t.symbol,
-                "action": t.action,
-                "quantity": round(t.quantity, 4),
-                "price": round(t.price, 2),
-                "value": round(t.quantity * t.price, 2),
-                "conviction": round(t.conviction_score, 3),
-                "reasoning": t.reasoning,
-                "sector": SYMBOL_SECTORS.get(t.symbol, "Other"),
-                "executed_at": (t.executed_at.isoformat() + "Z") if t.executed_at else None,
-            }
-            for t in trades
-        ]
-    }
+    return build_trades(trades, db.query(PM).all())
 
 
 @router.get("/heatmap")
 async def get_heatmap(db: Session = Depends(get_db)):
     positions = db.query(Position).all()
     pms = db.query(PM).filter(PM.is_active == True).all()
-    total_nav = sum(pm.current_capital for pm in pms)
-
-    sectors: dict[str, dict] = {}
-    for p in positions:
-        sector = SYMBOL_SECTORS.get(p.symbol, "Other")
-        val = p.quantity * p.avg_cost
-        if sector not in sectors:
-            sectors[sector] = {"sector": sector, "symbols": [], "total_value": 0.0, "pct": 0.0}
-        if p.symbol not in sectors[sector]["symbols"]:
-            sectors[sector]["symbols"].append(p.symbol)
-        sectors[sector]["total_value"] += val
-
-    for s in sectors.values():
-        s["total_value"] = round(s["total_value"], 2)
-        s["pct"] = round(s["total_value"] / total_nav * 100, 2) if total_nav > 0 else 0
-
-    return {
-        "sectors": sorted(sectors.values(), key=lambda x: x["total_value"], reverse=True),
-        "total_nav": round(total_nav, 2),
-    }
+    return build_heatmap(pms, PositionAggregate.build(positions))
 
 
 @router.get("/exposure")
 async def get_exposure(db: Session = Depends(get_db)):
     pms = db.query(PM).filter(PM.is_active == True).all()
     positions = db.query(Position).all()
-    total_nav = sum(pm.current_capital for pm in pms)
-
-    long_value = sum(p.quantity * p.avg_cost for p in positions if p.quantity > 0)
-    short_value = sum(abs(p.quantity) * p.avg_cost for p in positions if p.quantity < 0)
-    net = long_value - short_value
-    gross = long_value + short_value
-
-    # PM별 익스포저
-    pm_map = {pm.id: pm for pm in pms}
-    pm_exposure = {}
-    for p in positions:
-        val = abs(p.quantity * p.avg_cost)
-        if p.pm_id not in pm_exposure:
-            pm = pm_map.get(p.pm_id)
-            pm_exposure[p.pm_id] = {
-                "pm_id": p.pm_id,
-                "pm_name": pm.name if pm else p.pm_id,
-                "pm_emoji": pm.emoji if pm else "🤖",
-                "value": 0.0,
-                "pct": 0.0,
-            }
-        pm_exposure[p.pm_id]["value"] += val
-
-    for exp in pm_exposure.values():
-        exp["value"] = round(exp["value"], 2)
-        exp["pct"] = round(exp["value"] / total_nav * 100, 2) if total_nav > 0 else 0
-
-    return {
-        "net_exposure": {
-            "long": round(long_value, 2),
-            "short": round(short_value, 2),
-            "net": round(net, 2),
-            "gross": round(gross, 2),
-            "net_pct": round(net / total_nav * 100, 1) if total_nav > 0 else 0,
-            "gross_pct": round(gross / total_nav * 100, 1) if total_nav > 0 else 0,
-        },
-        "pm_exposure": sorted(pm_exposure.values(), key=lambda x: x["value"], reverse=True),
-        "conflicts": [],
-    }
+    return build_exposure(pms, PositionAggregate.build(positions))
 
 
 @router.get("/pm-performance")  # pragma: no cover
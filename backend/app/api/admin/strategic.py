@@ -5,10 +5,18 @@ from datetime import datetime, timezone
 from app.db.base import get_db
 from app.models.pm import PM
 from app.models.nav_history import NAVHistory
-from app.engines.social import SocialEngine
 
 router = APIRouter(prefix="/api/fund/strategic", tags=["admin-strategic"])
-social_engine = SocialEngine()
+_social_engine = None
+
+
+def get_social_engine():
+    """SocialEngine 싱글톤 (첫 사용 시 생성 — import 시점에 소셜 엔진/의존성 로드 X)"""
+    global _social_engine
+    if _social_engine is None:
+        from app.engines.social import SocialEngine
+        _social_engine = SocialEngine()
+    return _social_engine
 
 
 @router.get("/overview")
@@ -101,9 +109,9 @@ async def get_rebalance_status(db: Session = Depends(get_db)):
 
 
 @router.get("/social-signals")
-async def get_social_signals():
-    """소셜 티핑포인트 시그널 (Vox Populi용)"""
-    signals = social_engine.get_voxpopuli_signals()
+async def get_social_signals(db: Session = Depends(get_db)):
+    """소셜 티핑포인트 시그널 (Vox Populi용) — 언급량은 시계열에 기록해 누적 z-score로 판단"""
+    signals = await get_social_engine().aget_voxpopuli_signals(db=db)
     return {
         "signals": signals,
         "tipping_points": [s for s in signals if s["is_tipping_point"]],
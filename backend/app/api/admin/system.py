@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -7,6 +9,19 @@ from app.db.base import get_db
 router = APIRouter(prefix="/api/fund", tags=["admin-system"])
 
 
+def _leader_only(db: Session) -> dict:
+    """
+    리더 워커의 프로세스 로컬 상태를 다루는 엔드포인트용 — 다른 워커면 409 (워커/리더 식별 포함)
+    uvicorn --workers N 에서는 요청이 임의 워커로 가므로 리더가 아닌 워커의 값은 의미 없음
+    """
+    from app.core.leader import identity
+
+    worker = identity(db)
+    if not worker["is_leader"]:
+        raise HTTPException(status_code=409, detail={"reason": "not_leader", **worker})
+    return worker
+
+
 @router.get("/system/overview")
 async def get_system_overview(db: Session = Depends(get_db)):
     from app.core.scheduler import get_status
@@ -36,23 +51,166 @@ async def get_system_overview(db: Session = Depends(get_db)):
 
 @router.get("/order-pipeline/stats")
 async def get_order_pipeline_stats(db: Session = Depends(get_db)):
+    """
+    주문 파이프라인 현황 — 대기/실행 중은 사이클 계측 게이지, 완료는 체결 기록(DB),
+    거절(리스크 차단·브로커 거절/오류)은 프로세스 내 24h 카운트. 단계별 지연은 p50/p95/p99
+    게이지/카운트/지연은 응답한 워커 프로세스 값 — 사이클은 리더에서만 돌므로 worker_id/leader로 구분
+    """
+    from datetime import datetime, timedelta
+
+    from app.core.leader import identity
+    from app.core.metrics import metrics
+    from app.models.trade import Trade
+
+    since = datetime.utcnow() - timedelta(hours=24)
+    completed = db.query(func.count(Trade.id)).filter(Trade.executed_at >= since).scalar() or 0
     return {
-        "pending": 0,
-        "executing": 0,
-        "completed_24h": 0,
-        "rejected_24h": 0,
+        "pending": int(metrics.gauge("orders_pending")),
+        "executing": int(metrics.gauge("orders_executing")),
+        "completed_24h": completed,
+        "rejected_24h": metrics.count_24h("orders_rejected"),
+        "stages": metrics.stage_summaries(),
+        "cycle": metrics.summary("cycle_seconds"),
+        **identity(db),
     }
 
 
 @router.get("/soq/status")
 async def get_soq_status(db: Session = Depends(get_db)):
+    """
+    Smart Order Queue — 큐 깊이(대기 + 실행 중), 브로커 주문 지연, 오늘 체결 수
+    큐 깊이/지연은 응답한 워커 프로세스 값 (worker_id/leader 포함)
+    """
+    from datetime import datetime
+
+    from app.core.leader import identity
+    from app.core.metrics import metrics
+    from app.models.trade import Trade
+
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    orders_today = db.query(func.count(Trade.id)).filter(Trade.executed_at >= today_start).scalar() or 0
+    latency = metrics.summary("cycle_stage_seconds", stage="broker_order")
+    return {
+        "queue_depth": int(metrics.gauge("orders_pending") + metrics.gauge("orders_executing")),
+        "avg_latency_ms": latency["mean_ms"],
+        "p50_latency_ms": latency["p50_ms"],
+        "p95_latency_ms": latency["p95_ms"],
+        "p99_latency_ms": latency["p99_ms"],
+        "orders_today": orders_today,
+        **identity(db),
+    }
+
+
+@router.get("/llm/usage")
+async def get_llm_usage(hours: float | None = None):
+    """
+    LLM 호출 토큰/비용/지연 집계 — 프로바이더별·PM별 (최근 LLM_USAGE_CAPACITY건 중)
+    hours: 최근 N시간으로 제한 (없으면 보관 중인 전체)
+    """
+    import time
+
+    from app.engines.llm_usage import usage_ledger
+
+    since = time.time() - hours * 3600 if hours else None
     return {
-        "queue_depth": 0,
-        "avg_latency_ms": 0,
-        "orders_today": 0,
+        "totals": usage_ledger.totals(since),
+        "by_provider": usage_ledger.aggregate("provider", since),
+        "by_pm": usage_ledger.aggregate("pm", since),
     }
 
 
+@router.get("/llm/providers")
+async def get_llm_providers(db: Session = Depends(get_db)):
+    """
+    LLM 백엔드별 설정 여부 + 서킷 브레이커 상태 (closed / open / half_open)
+    서킷은 워커 프로세스별 — 트레이딩 사이클을 돌리는 리더 워커에서만 응답 (아니면 409)
+    """
+    from app.engines.trading_cycle import llm_engine
+
+    worker = _leader_only(db)
+    return {"providers": llm_engine.provider_status(), **worker}
+
+
+@router.post("/llm/providers/{backend}/reset")
+async def reset_llm_provider(backend: str, db: Session = Depends(get_db)):
+    """서킷 수동 close + 미설정 캐시 삭제 (키 설정/장애 복구 직후) — 리더 워커에서만 (아니면 409)"""
+    from app.engines.trading_cycle import llm_engine
+
+    worker = _leader_only(db)
+    try:
+        llm_engine.reset_provider(backend)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Unknown LLM backend")
+    return {**llm_engine.provider_status()[backend], **worker}
+
+
+@router.get("/profile/settings")
+async def get_profile_settings():
+    """사이클 프로파일러 설정 + 보관 중인 리포트 목록"""
+    from app.core.profiling import cycle_profiler
+
+    return cycle_profiler.status()
+
+
+@router.put("/profile/settings")
+async def update_profile_settings(payload: dict):
+    """런타임 토글: every_n (0 = 끔), keep, format"""
+    from app.core.profiling import cycle_profiler
+
+    try:
+        cycle_profiler.configure(
+            every_n=payload.get("every_n"), keep=payload.get("keep"), fmt=payload.get("format"),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return cycle_profiler.status()
+
+
+@router.post("/profile/cycle")
+async def profile_cycle(pm_id: str | None = None, format: str = "html", db: Session = Depends(get_db)):
+    """
+    사이클 1회를 프로파일러 아래에서 실행 (실제 사이클 — 주문/기록 포함)
+    pm_id 지정 시 해당 PM의 run_pm_cycle, 없으면 틱 전체(run_all_pm_cycles)
+    응답: HTML 플레임그래프 / collapsed stack / 텍스트 (cProfile 폴백 시 pstats 텍스트)
+    실제 주문이 나가므로 리더 워커에서만 실행 (아니면 409) — 팔로워가 리더와 별개로 틱을 돌리지 않도록
+    """
+    from app.core.profiling import FORMATS, ProfilerBusy, cycle_profiler, profile_call
+    from app.engines.trading_cycle import run_all_pm_cycles, run_pm_cycle
+    from app.models.pm import PM
+
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(FORMATS)}")
+    _leader_only(db)
+    if pm_id:
+        pm = db.query(PM).filter(PM.id == pm_id).first()
+        if pm is None:
+            raise HTTPException(status_code=404, detail="PM not found")
+        fn, args, target = run_pm_cycle, (pm, db), f"pm:{pm_id}"
+    else:
+        fn, args, target = run_all_pm_cycles, (db,), "tick"
+
+    try:
+        _, report = await profile_call(fn, *args, target=target, fmt=format)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    cycle_profiler.add(report)
+    return Response(
+        report.content,
+        media_type=report.media_type,
+        headers={"X-Profile-Id": str(report.id), "X-Profile-Engine": report.engine},
+    )
+
+
+@router.get("/profile/reports/{report_id}")
+async def get_profile_report(report_id: int):
+    from app.core.profiling import cycle_profiler
+
+    report = cycle_profiler.get(report_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return Response(report.content, media_type=report.media_type)
+
+
 @router.get("/executions/recent")
 async def get_recent_executions(limit: int = 20, db: Session = Depends(get_db)):
     from app.models.trade import Trade
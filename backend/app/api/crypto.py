@@ -13,7 +13,9 @@ import math
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
+from app.core.responses import FastJSONResponse
 from app.db.base import get_db
+from app.services.crypto_quotes import CryptoQuoteService
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,7 @@ _crypto_ws_clients: list[WebSocket] = []
 router = APIRouter(prefix="/api/crypto", tags=["crypto"])
 
 CRYPTO_SYMBOLS = ["BTC-USD", "ETH-USD", "SOL-USD", "BNB-USD", "XRP-USD", "ADA-USD", "DOGE-USD"]
+crypto_quotes = CryptoQuoteService(CRYPTO_SYMBOLS)
 
 
 def _get_crypto_pms(db: Session):
@@ -49,25 +52,9 @@ def _pm_to_dict(pm) -> dict:
 
 @router.get("/prices")
 async def get_crypto_prices():
-    """전체 암호화폐 현재가 조회"""
-    from app.engines.market_data import get_current_price
-
-    prices = []
-    for symbol in CRYPTO_SYMBOLS:
-        price = get_current_price(symbol)
-        import random
-        random.seed(hash(symbol + __import__("datetime").datetime.now().strftime("%Y%m%d%H")))
-        change_24h = round(random.uniform(-8.0, 8.0), 2)
-
-        coin = symbol.replace("-USD", "")
-        prices.append({
-            "symbol": symbol,
-            "coin": coin,
-            "price": round(price, 2) if price > 10 else round(price, 4),
-            "change_24h": change_24h,
-        })
-
-    return {"prices": prices}
+    """전체 암호화폐 현재가 + 24시간 변동 (Bybit 티커 1회 조회, 짧은 TTL 캐시)"""
+    quotes = await crypto_quotes.get_quotes()
+    return {"prices": [crypto_quotes.to_response(q) for q in quotes]}
 
 
 @router.get("/fear-greed")
@@ -76,7 +63,7 @@ async def get_fear_greed():
     from app.engines.social import SocialEngine
 
     engine = SocialEngine()
-    data = engine.fetch_fear_greed_index()
+    data = await engine.afetch_fear_greed_index()
     return data
 
 
@@ -164,7 +151,7 @@ async def get_crypto_portfolio(pm_id: str | None = None, db: Session = Depends(g
         .all()
     )
 
-    return {
+    return FastJSONResponse({
         "pms": [_pm_to_dict(pm) for pm in pms],
         "positions": [
             {
@@ -201,7 +188,7 @@ async def get_crypto_portfolio(pm_id: str | None = None, db: Session = Depends(g
                 ) / len(pms), 2
             ) if pms else 0.0,
         },
-    }
+    })
 
 
 @router.post("/agents/{pm_id}/trade")
@@ -243,7 +230,9 @@ async def run_satoshi_cycle(db: Session = Depends(get_db)):
 @router.post("/trade-all")
 async def run_all_crypto_cycles(db: Session = Depends(get_db)):
     """모든 크립토 PM 사이클 병렬 실행"""
-    from app.engines.trading_cycle import run_pm_cycle, record_nav
+    from app.engines.signal_matrix import SignalMatrix
+    from app.engines.trading_cycle import run_pm_cycle, record_nav, revalue_tick, signal_matrix
+    from app.services.cycle_writer import CycleWriteBuffer
 
     pms = _get_crypto_pms(db)
     active_pms = [pm for pm in pms if pm.is_active]
@@ -251,14 +240,17 @@ async def run_all_crypto_cycles(db: Session = Depends(get_db)):
     if not active_pms:
         return {"error": "no_active_crypto_pms"}
 
+    await signal_matrix.refresh(SignalMatrix.universe(pm.id for pm in active_pms))
+    buffer = CycleWriteBuffer()
     results = {}
     for pm in active_pms:
         try:
-            result = await run_pm_cycle(pm, db)
+            result = await run_pm_cycle(pm, db, matrix=signal_matrix, revalue=False, buffer=buffer)
             results[pm.id] = {"status": "completed", "result": result}
         except Exception as e:
             results[pm.id] = {"status": "error", "error": str(e)}
 
+    revalue_tick(db, [r["result"] for r in results.values() if r.get("result")], buffer=buffer)
     record_nav(db)
 
     # Broadcast trade results via WebSocket
@@ -454,7 +446,9 @@ _crypto_scheduler_interval: int = 300  # default 5 min
 async def _crypto_trading_loop(interval_seconds: int) -> None:
     """크립토 전용 자동 트레이딩 루프"""
     from app.db.base import get_db
-    from app.engines.trading_cycle import run_pm_cycle, record_nav
+    from app.engines.signal_matrix import SignalMatrix
+    from app.engines.trading_cycle import run_pm_cycle, record_nav, revalue_tick, signal_matrix
+    from app.services.cycle_writer import CycleWriteBuffer
 
     logger.info(f"Crypto scheduler started — interval={interval_seconds}s")
     while True:
@@ -464,9 +458,14 @@ async def _crypto_trading_loop(interval_seconds: int) -> None:
             try:
                 pms = _get_crypto_pms(db)
                 active_pms = [pm for pm in pms if pm.is_active]
+                # 크립토 PM 관심 종목은 대부분 겹침 → 종목당 1회만 시그널 계산
+                await signal_matrix.refresh(SignalMatrix.universe(pm.id for pm in active_pms))
+                buffer = CycleWriteBuffer()
+                results = []
                 for pm in active_pms:
                     try:
-                        result = await run_pm_cycle(pm, db)
+                        result = await run_pm_cycle(pm, db, matrix=signal_matrix, revalue=False, buffer=buffer)
+                        results.append(result)
                         await _broadcast_trade_event({
                             "type": "auto_trade",
                             "pm_id": pm.id,
@@ -474,6 +473,7 @@ async def _crypto_trading_loop(interval_seconds: int) -> None:
                         })
                     except Exception as e:
                         logger.error(f"Crypto scheduler error for {pm.id}: {e}")
+                revalue_tick(db, results, buffer=buffer)
                 record_nav(db)
                 logger.info(f"Crypto scheduler cycle done — {len(active_pms)} agents")
             finally:
@@ -486,8 +486,13 @@ async def _crypto_trading_loop(interval_seconds: int) -> None:
 async def start_crypto_scheduler(interval: int = 300):
     """크립토 자동매매 스케줄러 시작"""
     global _crypto_scheduler_task, _crypto_scheduler_interval
+    from app.core.leader import is_leader
+
     if _crypto_scheduler_task and not _crypto_scheduler_task.done():
         return {"status": "already_running", "interval": _crypto_scheduler_interval}
+    if not is_leader():
+        # 리더가 아닌 워커에서 시작하면 사이클이 중복 실행됨
+        return {"status": "not_leader", "interval": _crypto_scheduler_interval}
 
     _crypto_scheduler_interval = max(60, interval)  # minimum 60s
     loop = asyncio.get_event_loop()
@@ -1,13 +1,21 @@
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 import asyncio
 import json
 
+from app.core.responses import FastJSONResponse
 from app.db.base import get_db
 from app.models.pm import PM
 from app.models.position import Position
 from app.models.nav_history import NAVHistory
 from app.schemas.fund import FundStats, PMSummary
+from app.services.dashboard import (
+    build_fund_stats,
+    build_nav_history,
+    build_pm_list,
+    build_pm_performance,
+)
 
 router = APIRouter(prefix="/api/fund", tags=["fund"])
 
@@ -15,56 +23,16 @@ router = APIRouter(prefix="/api/fund", tags=["fund"])
 @router.get("/stats", response_model=FundStats)
 async def get_fund_stats(db: Session = Depends(get_db)):
     pms = db.query(PM).filter(PM.is_active == True).all()
-    total_capital = sum(pm.current_capital for pm in pms)
-    initial_total = sum(pm.initial_capital for pm in pms)
-
     # 오늘 return: 마지막 두 NAV 기록 비교
     last_two = db.query(NAVHistory).order_by(NAVHistory.id.desc()).limit(2).all()
-    today_return = 0.0
-    prior_day_return = 0.0
-    if len(last_two) >= 1:
-        today_return = last_two[0].daily_return * 100
-    if len(last_two) >= 2:
-        prior_day_return = last_two[1].daily_return * 100
-
-    itd_return = (
-        ((total_capital - initial_total) / initial_total * 100)
-        if initial_total > 0
-        else 0.0
-    )
     total_positions = db.query(Position).count()
-    return FundStats(
-        nav=round(total_capital, 2),
-        today_return=round(today_return, 4),
-        prior_day_return=round(prior_day_return, 4),
-        itd_return=round(itd_return, 2),
-        active_pms=len(pms),
-        total_positions=total_positions,
-    )
+    return FundStats(**build_fund_stats(pms, last_two, total_positions))
 
 
 @router.get("/pms", response_model=list[PMSummary])
 async def get_pms(db: Session = Depends(get_db)):
-    pms = db.query(PM).filter(PM.is_active == True).order_by(PM.id).all()
-    result = []
-    for pm in pms:
-        itd = (
-            (pm.current_capital - pm.initial_capital) / pm.initial_capital * 100
-            if pm.initial_capital > 0 else 0.0
-        )
-        result.append(
-            PMSummary(
-                id=pm.id,
-                name=pm.name,
-                emoji=pm.emoji,
-                strategy=pm.strategy,
-                llm_provider=pm.llm_provider,
-                broker_type=pm.broker_type,
-                current_capital=round(pm.current_capital, 2),
-                itd_return=round(itd, 2),
-            )
-        )
-    return result
+    pms = db.query(PM).filter(PM.is_active == True).all()
+    return [PMSummary(**row) for row in build_pm_list(pms)]
 
 
 @router.get("/nav/history")
@@ -77,21 +45,7 @@ async def get_nav_history(limit: int = 90, db: Session = Depends(get_db)):
         .all()
     )
     records.reverse()
-
-    data = []
-    initial_nav = None
-    for r in records:
-        if initial_nav is None:
-            initial_nav = r.nav
-        cum_return = ((r.nav - initial_nav) / initial_nav * 100) if initial_nav and initial_nav > 0 else 0.0
-        data.append({
-            "date": r.recorded_at.strftime("%Y-%m-%d") if r.recorded_at else "",
-            "nav": round(r.nav, 2),
-            "daily_return_pct": round(r.daily_return * 100, 4),
-            "cumulative_return_pct": round(cum_return, 4),
-        })
-
-    return {"history": data, "count": len(data)}
+    return FastJSONResponse(build_nav_history(records))
 
 
 # --- WebSocket 실시간 ---
@@ -155,22 +109,5 @@ async def get_pm_performance(db: Session = Depends(get_db)):
     """PM별 성과 순위 (DashboardTab용)"""
     from app.models.trade import Trade
     pms = db.query(PM).filter(PM.is_active == True).all()
-    result = []
-    for pm in pms:
-        itd = (
-            (pm.current_capital - pm.initial_capital) / pm.initial_capital * 100
-            if pm.initial_capital > 0 else 0.0
-        )
-        trade_count = db.query(Trade).filter(Trade.pm_id == pm.id).count()
-        result.append({
-            "id": pm.id,
-            "name": pm.name,
-            "emoji": pm.emoji,
-            "strategy": pm.strategy,
-            "llm_provider": pm.llm_provider,
-            "current_capital": round(pm.current_capital, 2),
-            "itd_return": round(itd, 2),
-            "trade_count": trade_count,
-        })
-    result.sort(key=lambda x: x["itd_return"], reverse=True)
-    return {"pms": result}
+    trade_counts = dict(db.query(Trade.pm_id, func.count(Trade.id)).group_by(Trade.pm_id).all())
+    return build_pm_performance(pms, trade_counts)
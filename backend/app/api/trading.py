@@ -5,6 +5,7 @@ Trading API: 시그널 실행, NAV 히스토리, 트레이딩 사이클 실행
 from fastapi import APIRouter, Depends, BackgroundTasks
 from sqlalchemy.orm import Session
 
+from app.core.responses import FastJSONResponse
 from app.db.base import get_db
 from app.models.nav_history import NAVHistory
 from app.models.signal import Signal
@@ -40,7 +41,7 @@ async def get_nav_history(limit: int = 90, db: Session = Depends(get_db)):
         for d in data:
             d["cumulative_return"] = round((d["nav"] - initial) / initial * 100, 4) if initial > 0 else 0.0
 
-    return {"history": data, "count": len(data)}
+    return FastJSONResponse({"history": data, "count": len(data)})
 
 
 @router.get("/nav/summary")
@@ -145,6 +146,13 @@ async def get_recent_signals(limit: int = 50, db: Session = Depends(get_db)):
     }
 
 
+@router.get("/signals/matrix")
+async def get_signal_matrix():
+    """마지막 틱에 계산된 유니버스 시그널 매트릭스 (종목별)"""
+    from app.engines.trading_cycle import signal_matrix
+    return signal_matrix.to_dict()
+
+
 @router.get("/positions/all")
 async def get_all_positions(db: Session = Depends(get_db)):
     """전체 포지션 목록"""
@@ -180,7 +188,7 @@ async def get_recent_trades(limit: int = 50, db: Session = Depends(get_db)):
     )
     pms = {pm.id: pm for pm in db.query(PM).all()}
 
-    return {
+    return FastJSONResponse({
         "trades": [
             {
                 "id": t.id,
@@ -198,15 +206,15 @@ async def get_recent_trades(limit: int = 50, db: Session = Depends(get_db)):
             }
             for t in trades
         ]
-    }
+    })
 
 
 @router.post("/backtest")
 async def run_backtest(payload: dict, db: Session = Depends(get_db)):
-    """백테스트 실행: 특정 종목/전략의 과거 성과 시뮬레이션"""
-    import numpy as np
+    """백테스트 실행: 특정 종목/전략의 과거 성과 시뮬레이션 (워커 풀 설정 시 다른 코어에서 실행)"""
+    from app.core.workers import run_cpu_with_array
+    from app.engines.backtest import simulate
     from app.engines.market_data import get_price_history
-    from app.engines.quant import QuantEngine
 
     symbol = payload.get("symbol", "SPY")
     strategy = payload.get("strategy", "rsi_momentum")
@@ -217,110 +225,24 @@ async def run_backtest(payload: dict, db: Session = Depends(get_db)):
         return {"error": "insufficient_data"}
 
     prices = prices.iloc[-(period + 20):]
-    qe = QuantEngine()
-
-    # 전략별 포지션 시뮬레이션
-    portfolio_value = 100.0
-    benchmark_value = 100.0
-    initial_price = float(prices.iloc[0])
+    result = await run_cpu_with_array(simulate, prices.to_numpy(dtype=float), strategy, symbol)
 
     chart_data = []
-    trades = 0
-    wins = 0
-    position = 0.0  # 0=현금, 1=롱
-
-    for i in range(20, len(prices)):
-        window = prices.iloc[:i]
-        sig = qe.generate_signals(window, symbol)
-        score = sig["composite_score"]
-        rsi = sig["rsi"]
-
-        # 전략별 진입/청산 로직
-        if strategy == "buy_hold":
-            new_pos = 1.0
-        elif strategy == "rsi_momentum":
-            if score > 0.2 or rsi < 38:
-                new_pos = 1.0
-            elif score < -0.2 or rsi > 62:
-                new_pos = 0.0
-            else:
-                new_pos = position
-        elif strategy == "mean_reversion":
-            if rsi < 32:
-                new_pos = 1.0
-            elif rsi > 68:
-                new_pos = 0.0
-            else:
-                new_pos = position
-        elif strategy == "trend_follow":
-            new_pos = 1.0 if score > 0.15 else (0.0 if score < -0.15 else position)
-        else:  # quant_king
-            new_pos = 1.0 if score > 0.1 else (0.0 if score < -0.1 else position)
-
-        # 수익률 계산
-        day_return = float(prices.iloc[i]) / float(prices.iloc[i - 1]) - 1
-        bench_return = day_return
-        strat_return = day_return if position == 1.0 else 0.0
-
-        if new_pos != position:
-            trades += 1
-            if new_pos == 0.0 and strat_return > 0:
-                wins += 1
-            cost = 0.001  # 0.1% 거래비용
-            portfolio_value *= (1 + strat_return - cost)
-        else:
-            portfolio_value *= (1 + strat_return)
-
-        benchmark_value *= (1 + bench_return)
-        position = new_pos
-
-        if i % 3 == 0:
-            from datetime import timedelta
-            idx = prices.index[i]
-            date_str = idx.strftime("%b %d") if hasattr(idx, "strftime") else str(idx)[:10]
-            chart_data.append({
-                "date": date_str,
-                "strategy": round(portfolio_value, 3),
-                "benchmark": round(benchmark_value, 3),
-            })
-
-    total_return = portfolio_value - 100.0
-    bench_return_total = benchmark_value - 100.0
-
-    # 수익률 시계열로 Sharpe/Sortino/MDD 계산
-    if len(chart_data) > 1:
-        strat_vals = [d["strategy"] for d in chart_data]
-        daily_rets = np.array([(strat_vals[i] - strat_vals[i-1]) / strat_vals[i-1] for i in range(1, len(strat_vals))])
-        sharpe = float(np.mean(daily_rets) / np.std(daily_rets) * np.sqrt(252)) if np.std(daily_rets) > 0 else 0.0
-        neg = daily_rets[daily_rets < 0]
-        sortino = float(np.mean(daily_rets) / np.std(neg) * np.sqrt(252)) if len(neg) > 0 and np.std(neg) > 0 else 0.0
-        peak = strat_vals[0]
-        mdd = 0.0
-        for v in strat_vals:
-            if v > peak:
-                peak = v
-            dd = (peak - v) / peak
-            if dd > mdd:
-                mdd = dd
-        calmar = (total_return / 100) / mdd if mdd > 0 else 0.0
-    else:
-        sharpe = sortino = mdd = calmar = 0.0
-
-    win_rate = (wins / trades * 100) if trades > 0 else 0.0
+    for i, strategy_value, benchmark_value in result.pop("chart_points"):
+        idx = prices.index[i]
+        date_str = idx.strftime("%b %d") if hasattr(idx, "strftime") else str(idx)[:10]
+        chart_data.append({
+            "date": date_str,
+            "strategy": strategy_value,
+            "benchmark": benchmark_value,
+        })
 
-    return {
+    return FastJSONResponse({
         "symbol": symbol,
         "strategy": strategy,
-        "total_return_pct": round(total_return, 3),
-        "benchmark_return_pct": round(bench_return_total, 3),
-        "sharpe_ratio": round(sharpe, 3),
-        "sortino_ratio": round(sortino, 3),
-        "max_drawdown_pct": round(mdd * 100, 3),
-        "calmar_ratio": round(calmar, 3),
-        "win_rate_pct": round(win_rate, 1),
-        "total_trades": trades,
+        **result,
         "chart_data": chart_data,
-    }
+    })
 
 
 @router.get("/risk/concentration")
@@ -38,6 +38,83 @@ class Settings(BaseSettings):
     cash_reserve_pct: float = 0.95         # 현금 사용 비율 (5% 여유)
     scheduler_interval: int = 300          # 트레이딩 사이클 주기 (초)
     min_conviction: float = 0.4            # 최소 확신도 (이하 거래 안함)
+    llm_batch_decisions: bool = False      # True = PM당 관심 종목 전체를 LLM 1회 호출로 판단 (랜덤 1종목 대신)
+
+    # Scheduler leader election (멀티 워커)
+    scheduler_leader_election: bool = True  # False = 모든 워커가 스케줄러 실행 (단일 워커용)
+    scheduler_lease_ttl: int = 30          # lease 만료 시간 (초) — 리더 사망 후 인수까지 최대 대기
+    scheduler_heartbeat: int = 10          # lease 갱신 주기 (초), TTL보다 충분히 짧게
+
+    # CPU worker pool (퀀트 / 백테스트 / 성과 계산 오프로드)
+    worker_processes: int = 0              # 0 = 이벤트 루프에서 직접 실행
+    shared_memory_min_length: int = 5_000  # 이 길이 이상 가격 배열은 공유 메모리로 전달
+
+    # Social data cache (stale-while-revalidate)
+    social_news_ttl: int = 300             # 뉴스 감성 캐시 TTL (초)
+    social_fear_greed_ttl: int = 600       # Fear & Greed 캐시 TTL (초)
+    social_stale_ttl: int = 1800           # TTL 만료 후 이전 값을 반환하며 백그라운드 갱신하는 구간 (초)
+    social_zscore_window: int = 500        # 언급량 z-score 지수가중 기간 (관측치 수, alpha = 2/(N+1))
+
+    # Google Trends background collector
+    trends_anchor: str = "stock market"    # 배치 간 정규화용 공통 앵커 키워드
+    trends_refresh_interval: int = 3600    # 백그라운드 갱신 주기 (초), 0 = 비활성
+    trends_initial_delay: int = 30         # 서버 시작 후 첫 수집까지 대기 (초)
+
+    # Crypto quotes (/api/crypto/prices)
+    crypto_quote_ttl: float = 5.0          # 시세 캐시 TTL (초)
+    crypto_quote_stale_ttl: float = 60.0   # TTL 만료 후 이전 시세 반환 + 백그라운드 갱신 구간 (초)
+    crypto_quote_timeout: float = 5.0      # Bybit 티커 요청 타임아웃 (초)
+
+    # Dashboard response cache (데이터 버전 + ETag/304)
+    response_cache_enabled: bool = True
+    response_cache_ttl: float = 10.0       # 다른 워커 쓰기 반영 최대 지연 (초)
+    response_cache_paths: str = (          # 읽기 전용 엔드포인트 ("/"로 끝나면 prefix)
+        "/api/fund/stats,/api/fund/pms,/api/fund/pm-performance,/api/fund/nav/history,"
+        "/api/fund/heatmap,/api/fund/exposure,/api/fund/positions/breakdown,/api/fund/analytics/"
+    )
+
+    # Response encoding (orjson 직렬화 + gzip 압축)
+    fast_json_enabled: bool = True         # 기본 응답 클래스를 FastJSONResponse로 (orjson 없으면 표준 json)
+    gzip_enabled: bool = True
+    gzip_min_size: int = 1024              # 이 크기(bytes) 미만 응답은 압축하지 않음
+    gzip_level: int = 5                    # 1(빠름) ~ 9(작음)
+
+    # Synthetic market (오프라인 mock 시세 시뮬레이터)
+    synthetic_market_seed: int = 0         # 같은 시드 + 같은 날짜 → 같은 가격 경로
+
+    # Cycle profiling (pyinstrument, 없으면 cProfile)
+    profile_every_n: int = 0               # 스케줄 틱 N번째마다 프로파일 (0 = 끔)
+    profile_keep: int = 10                 # 보관할 최근 리포트 수
+    profile_format: str = "html"           # html | collapsed | text
+
+    # LLM providers (비우면 공식 엔드포인트, 로컬 stand-in 서버로 부하/지연 테스트 시 지정)
+    anthropic_base_url: str = ""           # 예: http://localhost:8900
+    openai_base_url: str = ""              # 예: http://localhost:8900/v1
+    gemini_base_url: str = ""              # 예: http://localhost:8900
+    grok_base_url: str = ""                # 비우면 https://api.x.ai/v1
+    llm_timeout: float = 30.0              # LLM 요청 타임아웃 (초)
+    llm_usage_capacity: int = 10_000       # 토큰/지연 ledger에 보관할 최근 호출 수
+    llm_breaker_failure_threshold: int = 3  # 연속 실패 N회 → 서킷 open (호출 없이 규칙 기반 폴백)
+    llm_breaker_cooldown: float = 30.0     # open 유지 시간 (초), 이후 probe 1건 허용
+    llm_breaker_max_cooldown: float = 300.0  # probe 실패마다 cooldown 2배, 상한 (초)
+    llm_availability_ttl: float = 300.0    # API 키 미설정 결과 캐시 (초)
+
+    # LLM hedging (꼬리 지연이 틱 전체를 늘리지 않도록)
+    llm_hedge_enabled: bool = False        # primary가 deadline까지 무응답이면 hedge 시작, 먼저 끝난 결과 사용
+    llm_hedge_percentile: float = 95.0     # deadline = 프로바이더 최근 지연의 이 퍼센타일
+    llm_hedge_min_samples: int = 20        # 지연 표본이 이보다 적으면 기본 deadline
+    llm_hedge_default_delay: float = 5.0   # 기본 deadline (초)
+    llm_hedge_min_delay: float = 0.5       # deadline 하한 (초)
+    llm_hedge_secondary: str = ""          # hedge 프로바이더 (비우면 규칙 기반 결정)
+    llm_decision_budget: float = 0.0       # PM당 결정 시간 상한 (초), 초과 시 규칙 기반 (0 = 무제한)
+
+    # LLM stand-in server (python -m app.services.llm_standin)
+    llm_standin_latency: str = "lognormal"  # fixed | uniform | lognormal | exponential
+    llm_standin_latency_ms: float = 800.0   # 지연 중앙값 (uniform은 0~2배 구간)
+    llm_standin_latency_sigma: float = 0.5  # lognormal 꼬리 두께
+    llm_standin_error_rate: float = 0.0     # 429/500/503(529) 응답 비율
+    llm_standin_timeout_rate: float = 0.0   # 응답 없이 hang하는 비율 (클라이언트 타임아웃 테스트)
+    llm_standin_seed: int = 0
 
     # Risk management
     max_daily_loss_pct: float = 0.05       # 일일 최대 손실률 (5%)
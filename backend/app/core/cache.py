@@ -0,0 +1,73 @@
+"""
+TTL Cache: stale-while-revalidate 방식의 비동기 인메모리 캐시
+
+- fresh (age < ttl): 캐시 값 바로 반환
+- stale (ttl <= age < ttl + stale_ttl): 캐시 값 바로 반환 + 백그라운드 갱신 1회 예약
+- 만료/없음: 호출자가 직접 조회 (같은 키 동시 요청은 한 번만 조회)
+
+대시보드 폴링은 메모리에서 응답하고, 외부 API 지연은 백그라운드로 숨김
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key: Hashable) -> Any:
+        """만료 여부와 무관하게 마지막 값 (없으면 None)"""
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (self._clock(), value)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry[0]
+            if age < self.ttl:
+                return entry[1]
+            if age < self.ttl + self.stale_ttl:
+                if key not in self._inflight:
+                    self._start(key, fetch).add_done_callback(_log_refresh_error)
+                return entry[1]
+        task = self._inflight.get(key) or self._start(key, fetch)
+        return await asyncio.shield(task)
+
+    def _start(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        async def _run():
+            try:
+                value = await fetch()
+                self.set(key, value)
+                return value
+            finally:
+                self._inflight.pop(key, None)
+
+        task = asyncio.ensure_future(_run())
+        self._inflight[key] = task
+        return task
+
+
+def _log_refresh_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background cache refresh failed: %s", task.exception())
@@ -0,0 +1,106 @@
+"""
+Circuit breaker: 외부 의존성(LLM 프로바이더 등) 장애 시 호출을 건너뛰어 타임아웃 비용 제거
+
+- closed: 정상 호출, 연속 실패 failure_threshold회 → open
+- open: cooldown 동안 즉시 거절 (호출자는 바로 폴백)
+- half_open: cooldown 경과 후 probe 1건만 허용 → 성공 시 closed, 실패 시 open (cooldown 2배, 상한 max_cooldown)
+  결과 없이 취소된 probe는 release_probe → 다음 호출이 다시 probe
+"""
+
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        max_cooldown: float = 300.0,
+        clock=time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(failure_threshold, 1)
+        self.base_cooldown = cooldown
+        self.max_cooldown = max(max_cooldown, cooldown)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._cooldown = cooldown
+        self._opened_at = 0.0
+        self._probing = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self._cooldown:
+            self._state = HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부 — half_open이면 probe 1건만 True"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._cooldown = self.base_cooldown
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            if state == HALF_OPEN:
+                # probe 실패 → 더 길게 차단
+                self._cooldown = min(self._cooldown * 2, self.max_cooldown)
+                self._open()
+                return
+            self._failures += 1
+            if state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def release_probe(self) -> None:
+        """결과 없이 끝난 호출(취소) — 상태는 그대로, half_open이면 다음 호출이 다시 probe"""
+        with self._lock:
+            self._probing = False
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probing = False
+
+    def reset(self) -> None:
+        self.record_success()
+        self.rejected = 0
+
+    def status(self) -> dict:
+        with self._lock:
+            state = self._current_state()
+            retry_in = max(self._cooldown - (self._clock() - self._opened_at), 0.0) if state == OPEN else 0.0
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "cooldown_s": self._cooldown,
+                "retry_in_s": round(retry_in, 1),
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,80 @@
+"""
+Data Version: DB 쓰기 커밋마다 증가하는 전역 버전 카운터
+
+SQLAlchemy 세션 이벤트로 쓰기(flush / ORM bulk insert·update·delete)를 감지해
+커밋 시점에 버전을 올림 → 응답 캐시는 (경로, 쿼리, 버전)으로 키를 잡아 쓰기 이후 자동 무효화
+스케줄러 lease 갱신, 소셜 시계열 기록처럼 대시보드 데이터와 무관한 테이블은 제외
+버전은 프로세스 로컬 — 멀티 워커에서는 응답 캐시 TTL이 다른 워커 쓰기의 최대 지연을 제한
+"""
+
+import itertools
+import logging
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+IGNORED_TABLES = {"scheduler_leases", "social_mentions", "social_mention_stats"}
+
+_WRITE_FLAG = "data_version_dirty"
+
+_counter = itertools.count(1)
+_lock = threading.Lock()
+_version = 0
+_installed = False
+
+
+def current() -> int:
+    return _version
+
+
+def bump() -> int:
+    global _version
+    with _lock:
+        _version = next(_counter)
+    return _version
+
+
+def _tracked(table_name: str | None) -> bool:
+    return table_name is not None and table_name not in IGNORED_TABLES
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__table__", None)
+        if _tracked(getattr(table, "name", None)):
+            session.info[_WRITE_FLAG] = True
+            return
+
+
+def _do_orm_execute(state) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    table = getattr(mapper, "local_table", None) if mapper is not None else None
+    # 매퍼를 알 수 없는 쓰기는 보수적으로 변경으로 간주
+    if table is None or _tracked(table.name):
+        state.session.info[_WRITE_FLAG] = True
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop(_WRITE_FLAG, False):
+        bump()
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_WRITE_FLAG, None)
+
+
+def install() -> None:
+    """모든 Session에 이벤트 등록 (중복 호출 무시)"""
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "do_orm_execute", _do_orm_execute)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
+    _installed = True
@@ -0,0 +1,51 @@
+"""
+Lazy imports — 무거운 선택적 의존성(yfinance, pytrends 등)을 첫 사용 시점에 import
+
+- module_available(name): import 없이 설치 여부만 확인 (find_spec)
+- LazyImport("yfinance") / LazyImport("pytrends.request", "TrendReq"):
+  속성 접근·호출 시 실제 import. 모듈 전역에 두므로 테스트는 기존처럼 patch 가능
+"""
+
+import importlib
+import importlib.util
+import threading
+from typing import Any
+
+
+def module_available(name: str) -> bool:
+    """최상위 패키지가 설치되어 있는지 (import하지 않음)"""
+    try:
+        return importlib.util.find_spec(name.split(".")[0]) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyImport:
+    """모듈 또는 모듈 속성을 첫 사용 시 import하는 프록시"""
+
+    def __init__(self, module: str, attr: str | None = None):
+        self._module = module
+        self._attr = attr
+        self._target: Any = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Any:
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    target = importlib.import_module(self._module)
+                    self._target = getattr(target, self._attr) if self._attr else target
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        name = f"{self._module}.{self._attr}" if self._attr else self._module
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {name} ({state})>"
@@ -0,0 +1,192 @@
+"""
+스케줄러 리더 선출 — lease row + heartbeat
+uvicorn --workers N 으로 API를 수평 확장해도 트레이딩 사이클은 정확히 한 워커에서만 실행
+
+- 각 워커는 고유 WORKER_ID (hostname:pid:랜덤) 를 가짐
+- scheduler_leases 테이블의 row 하나를 조건부 UPDATE로 획득/갱신 (SQLite / Postgres 공통)
+- 리더는 heartbeat마다 만료 시각을 연장, 나머지 워커는 HTTP만 처리
+- 리더가 죽으면 lease가 만료되고 다음 heartbeat에서 다른 워커가 자동 인수
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.scheduler_lease import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "trading_scheduler"
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+_election_task: asyncio.Task | None = None
+_is_leader: bool = False
+
+
+def try_acquire_lease(
+    db: Session,
+    holder: str = WORKER_ID,
+    ttl_seconds: int | None = None,
+    name: str = LEASE_NAME,
+    now: datetime | None = None,
+) -> bool:
+    """
+    lease 획득 또는 갱신 시도.
+    내가 이미 보유 중이거나 기존 lease가 만료된 경우에만 UPDATE가 적용됨 → 원자적.
+    Returns True if this holder owns the lease after the call.
+    """
+    if ttl_seconds is None:
+        ttl_seconds = settings.scheduler_lease_ttl
+    now = now or datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+
+    result = db.execute(
+        update(SchedulerLease)
+        .where(
+            SchedulerLease.name == name,
+            or_(SchedulerLease.holder == holder, SchedulerLease.expires_at < now),
+        )
+        .values(holder=holder, expires_at=expires_at)
+    )
+    if result.rowcount == 1:
+        db.commit()
+        return True
+
+    # row 자체가 없으면 insert — 동시 insert는 PK 충돌로 한 워커만 성공
+    exists = db.query(SchedulerLease.name).filter(SchedulerLease.name == name).first()
+    if exists is not None:
+        db.commit()
+        return False
+    try:
+        db.add(SchedulerLease(name=name, holder=holder, expires_at=expires_at))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def release_lease(db: Session, holder: str = WORKER_ID, name: str = LEASE_NAME) -> None:
+    """보유 중인 lease 즉시 만료 (정상 종료 시 다른 워커가 바로 인수하도록)"""
+    db.execute(
+        update(SchedulerLease)
+        .where(SchedulerLease.name == name, SchedulerLease.holder == holder)
+        .values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+    )
+    db.commit()
+
+
+def _heartbeat() -> bool:
+    from app.db.base import get_db
+
+    db = next(get_db())
+    try:
+        return try_acquire_lease(db)
+    finally:
+        db.close()
+
+
+async def _election_loop(
+    on_elected: Callable[[], None],
+    on_demoted: Callable[[], None],
+    heartbeat_seconds: int,
+) -> None:
+    """heartbeat마다 lease 획득/갱신, 리더 상태 변화 시 콜백 호출"""
+    global _is_leader
+    logger.info(f"Leader election started — worker={WORKER_ID}")
+    try:
+        while True:
+            try:
+                acquired = _heartbeat()
+            except SQLAlchemyError as e:
+                # DB에 닿지 못하면 lease 갱신 불가 → 중복 실행 방지를 위해 강등
+                logger.error(f"Leader heartbeat error: {e}")
+                acquired = False
+
+            if acquired and not _is_leader:
+                _is_leader = True
+                logger.info(f"Elected scheduler leader — worker={WORKER_ID}")
+                on_elected()
+            elif not acquired and _is_leader:
+                _is_leader = False
+                logger.warning(f"Lost scheduler leadership — worker={WORKER_ID}")
+                on_demoted()
+
+            await asyncio.sleep(heartbeat_seconds)
+    finally:
+        if _is_leader:
+            _is_leader = False
+            on_demoted()
+            try:
+                from app.db.base import get_db
+                db = next(get_db())
+                try:
+                    release_lease(db)
+                finally:
+                    db.close()
+            except SQLAlchemyError as e:
+                logger.error(f"Lease release error: {e}")
+
+
+def start_leader_election(
+    on_elected: Callable[[], None],
+    on_demoted: Callable[[], None],
+    heartbeat_seconds: int | None = None,
+) -> None:
+    """리더 선출 루프 시작 (lifespan에서 호출)"""
+    global _election_task
+    if heartbeat_seconds is None:
+        heartbeat_seconds = settings.scheduler_heartbeat
+    loop = asyncio.get_event_loop()
+    _election_task = loop.create_task(
+        _election_loop(on_elected, on_demoted, heartbeat_seconds)
+    )
+
+
+def stop_leader_election() -> None:
+    """리더 선출 루프 중지 — 리더였다면 finally에서 lease 반납"""
+    global _election_task
+    if _election_task and not _election_task.done():
+        _election_task.cancel()
+    _election_task = None
+
+
+def is_leader() -> bool:
+    """리더 선출 비활성화 시 모든 워커가 리더로 간주"""
+    if not settings.scheduler_leader_election:
+        return True
+    return _is_leader
+
+
+def current_leader(db: Session, name: str = LEASE_NAME, now: datetime | None = None) -> str | None:
+    """유효한 lease를 보유한 워커 ID (없거나 만료됐으면 None). 리더 선출 비활성화 시 이 워커"""
+    if not settings.scheduler_leader_election:
+        return WORKER_ID
+    row = (
+        db.query(SchedulerLease.holder)
+        .filter(SchedulerLease.name == name, SchedulerLease.expires_at >= (now or datetime.utcnow()))
+        .first()
+    )
+    return row[0] if row else None
+
+
+def identity(db: Session) -> dict:
+    """응답용 워커 식별 — 프로세스 로컬 상태(서킷, 메트릭)를 보여주는 엔드포인트가 어느 워커 값인지 표시"""
+    return {"worker_id": WORKER_ID, "is_leader": is_leader(), "leader": current_leader(db)}
+
+
+def get_status() -> dict:
+    return {
+        "enabled": settings.scheduler_leader_election,
+        "worker_id": WORKER_ID,
+        "is_leader": is_leader(),
+    }
@@ -0,0 +1,216 @@
+"""
+In-process metrics: 트레이딩 사이클 단계별 타이머 + 주문 파이프라인 카운터
+
+- Histogram: Prometheus 누적 버킷 + 최근 샘플 링버퍼 (p50/p95/p99 계산용)
+- 라벨 조합(stage, pm, provider, broker)마다 히스토그램 1개
+- 주문 파이프라인: pending/executing 게이지, 거절 이벤트 타임스탬프 (24h 윈도우)
+- render_prometheus(): /metrics 텍스트 포맷 (text/plain; version=0.0.4)
+
+프로세스 로컬 — 리더 워커(사이클 실행 워커)의 값이 의미 있음
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+# 초 단위 버킷 (5ms ~ 60s: 캐시된 시세 조회부터 LLM 호출까지)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SAMPLE_WINDOW = 1024          # 퍼센타일 계산용 최근 샘플 수
+EVENT_WINDOW_SECONDS = 86_400  # 24h 카운트 윈도우
+
+CYCLE_STAGES = ("price_fetch", "signal_generation", "llm_decision", "risk_check", "broker_order", "db_commit")
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(**labels) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """nearest-rank 퍼센타일 (q: 0~100)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, window: int = SAMPLE_WINDOW):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # 마지막 = +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.samples: deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.samples.append(value)
+
+    def summary(self) -> dict:
+        return summarize(self.count, self.sum, list(self.samples))
+
+
+def summarize(count: int, total: float, samples: list[float]) -> dict:
+    """count/mean + 최근 샘플 기준 p50/p95/p99 (ms)"""
+    values = sorted(samples)
+    return {
+        "count": count,
+        "mean_ms": round(total / count * 1000, 2) if count else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+    }
+
+
+class MetricsRegistry:
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[Labels, Histogram]] = {}
+        self._help: dict[str, str] = {}
+        self._gauges: dict[str, dict[Labels, float]] = {}
+        self._events: dict[str, deque[float]] = {}
+
+    # ── 기록 ────────────────────────────────────────────
+    def observe(self, name: str, value: float, description: str = "", **labels) -> None:
+        with self._lock:
+            if description:
+                self._help.setdefault(name, description)
+            series = self._histograms.setdefault(name, {})
+            key = _labels(**labels)
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = Histogram()
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, description: str = "", **labels) -> Iterator[None]:
+        """블록 실행 시간(초)을 히스토그램에 기록 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, description=description, **labels)
+
+    def stage(self, stage: str, pm: str | None = None, provider: str | None = None,
+              broker: str | None = None):
+        """트레이딩 사이클 단계 타이머"""
+        return self.timer(
+            "cycle_stage_seconds", description="Trading cycle stage latency",
+            stage=stage, pm=pm, provider=provider, broker=broker,
+        )
+
+    def gauge_add(self, name: str, delta: float, **labels) -> None:
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            key = _labels(**labels)
+            series[key] = series.get(key, 0.0) + delta
+
+    @contextmanager
+    def in_progress(self, name: str, **labels) -> Iterator[None]:
+        self.gauge_add(name, 1, **labels)
+        try:
+            yield
+        finally:
+            self.gauge_add(name, -1, **labels)
+
+    def event(self, name: str) -> None:
+        """24h 윈도우 카운트용 이벤트 (예: 주문 거절)"""
+        now = self._clock()
+        with self._lock:
+            events = self._events.setdefault(name, deque())
+            events.append(now)
+            self._prune(events, now)
+
+    # ── 조회 ────────────────────────────────────────────
+    def _prune(self, events: deque[float], now: float) -> None:
+        cutoff = now - EVENT_WINDOW_SECONDS
+        while events and events[0] < cutoff:
+            events.popleft()
+
+    def count_since(self, name: str, since: float) -> int:
+        with self._lock:
+            events = self._events.get(name)
+            if not events:
+                return 0
+            self._prune(events, self._clock())
+            return sum(1 for t in events if t >= since)
+
+    def count_24h(self, name: str) -> int:
+        return self.count_since(name, self._clock() - EVENT_WINDOW_SECONDS)
+
+    def gauge(self, name: str, **labels) -> float:
+        """라벨 지정 시 해당 시리즈, 없으면 전체 합"""
+        with self._lock:
+            series = self._gauges.get(name, {})
+            if labels:
+                return series.get(_labels(**labels), 0.0)
+            return sum(series.values())
+
+    def summary(self, name: str, **match) -> dict:
+        """match 라벨이 일치하는 시리즈를 합쳐 count/mean/p50/p95/p99 (ms)"""
+        wanted = set(_labels(**match))
+        count, total, samples = 0, 0.0, []
+        with self._lock:
+            for key, hist in self._histograms.get(name, {}).items():
+                if wanted <= set(key):
+                    count += hist.count
+                    total += hist.sum
+                    samples.extend(hist.samples)
+        return summarize(count, total, samples)
+
+    def stage_summaries(self, **match) -> dict[str, dict]:
+        return {stage: self.summary("cycle_stage_seconds", stage=stage, **match) for stage in CYCLE_STAGES}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._gauges.clear()
+            self._events.clear()
+
+    # ── Prometheus 텍스트 포맷 ───────────────────────────────
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                if self._help.get(name):
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, hist in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip((*hist.buckets, math.inf), hist.bucket_counts):
+                        cumulative += count
+                        le = "+Inf" if bound == math.inf else repr(bound)
+                        lines.append(f"{name}_bucket{_fmt(key + (('le', le),))} {cumulative}")
+                    lines.append(f"{name}_sum{_fmt(key)} {hist.sum}")
+                    lines.append(f"{name}_count{_fmt(key)} {hist.count}")
+            for name, series in sorted(self._gauges.items()):
+                lines.append(f"# TYPE {name} gauge")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_fmt(key)} {value:g}")
+            now = self._clock()
+            for name, events in sorted(self._events.items()):
+                self._prune(events, now)
+                lines.append(f"# TYPE {name}_24h gauge")
+                lines.append(f"{name}_24h {len(events)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+metrics = MetricsRegistry()
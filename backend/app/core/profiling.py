@@ -0,0 +1,201 @@
+"""
+Cycle profiling: 트레이딩 사이클 1회(또는 틱 전체)를 프로파일러로 실행
+
+- pyinstrument(샘플링, 선택적 의존성) → HTML 플레임그래프 / collapsed stack (flamegraph.pl·speedscope 입력)
+- 없으면 cProfile 폴백 → pstats 텍스트 (cumulative 정렬)
+- CycleProfiler: 스케줄 사이클 N번째마다 프로파일 + 최근 K개 보관
+  every_n=0(기본)이면 정수 비교 한 번 후 원래 코루틴을 그대로 await → 오버헤드 없음
+- 프로파일러는 프로세스당 하나만 (동시 실행 시 두 번째는 건너뜀)
+"""
+
+import asyncio
+import io
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.core.lazy import module_available
+
+logger = logging.getLogger(__name__)
+
+PYINSTRUMENT_AVAILABLE = module_available("pyinstrument")
+FORMATS = ("html", "collapsed", "text")
+
+_ids = itertools.count(1)
+
+
+class ProfilerBusy(RuntimeError):
+    """다른 프로파일이 이미 실행 중"""
+
+
+@dataclass
+class ProfileReport:
+    target: str
+    engine: str          # pyinstrument | cprofile
+    format: str          # html | collapsed | text | pstats
+    duration_s: float
+    content: str
+    id: int = field(default_factory=lambda: next(_ids))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def media_type(self) -> str:
+        return "text/html" if self.format == "html" else "text/plain"
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "target": self.target,
+            "engine": self.engine,
+            "format": self.format,
+            "duration_ms": round(self.duration_s * 1000, 1),
+            "size": len(self.content),
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+# ── 렌더링 ───────────────────────────────────────────
+
+def _collapsed_from_frame(root) -> str:
+    """pyinstrument 프레임 트리 → collapsed stack ("a;b;c <µs>" 한 줄씩)"""
+    lines: list[str] = []
+
+    def walk(frame, stack: tuple[str, ...]) -> None:
+        name = f"{frame.function} ({frame.file_path_short}:{frame.line_no})"
+        path = stack + (name.replace(";", ":"),)
+        self_us = int(frame.self_time * 1_000_000)
+        if self_us > 0:
+            lines.append(f"{';'.join(path)} {self_us}")
+        for child in frame.children:
+            walk(child, path)
+
+    if root is not None:
+        walk(root, ())
+    return "\n".join(lines) + "\n"
+
+
+def _pstats_text(profiler, limit: int = 60) -> str:
+    import pstats
+
+    buf = io.StringIO()
+    pstats.Stats(profiler, stream=buf).sort_stats("cumulative").print_stats(limit)
+    return buf.getvalue()
+
+
+# ── 실행 ────────────────────────────────────────────
+
+_lock = asyncio.Lock()
+
+
+async def profile_call(
+    fn: Callable[..., Awaitable[Any]],
+    *args,
+    target: str = "cycle",
+    fmt: str = "html",
+    engine: str | None = None,
+    **kwargs,
+) -> tuple[Any, ProfileReport]:
+    """
+    코루틴 함수를 프로파일러 아래에서 실행 → (결과, 리포트)
+    engine: None이면 pyinstrument 우선, 없으면 cProfile
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown profile format: {fmt}")
+    if engine is None:
+        engine = "pyinstrument" if PYINSTRUMENT_AVAILABLE else "cprofile"
+    if _lock.locked():
+        raise ProfilerBusy("another profile is running")
+
+    async with _lock:
+        start = time.perf_counter()
+        if engine == "pyinstrument":
+            from pyinstrument import Profiler
+
+            profiler = Profiler(async_mode="enabled")
+            profiler.start()
+            try:
+                result = await fn(*args, **kwargs)
+            finally:
+                session = profiler.stop()
+            if fmt == "html":
+                content = profiler.output_html()
+            elif fmt == "collapsed":
+                content = _collapsed_from_frame(session.root_frame())
+            else:
+                content = profiler.output_text(unicode=True, color=False)
+            out_fmt = fmt
+        else:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                result = await fn(*args, **kwargs)
+            finally:
+                profiler.disable()
+            # cProfile은 호출 스택 전체를 남기지 않음 → 포맷과 무관하게 pstats 텍스트
+            content = _pstats_text(profiler)
+            out_fmt = "pstats"
+        duration = time.perf_counter() - start
+
+    return result, ProfileReport(target=target, engine=engine, format=out_fmt, duration_s=duration, content=content)
+
+
+class CycleProfiler:
+    """스케줄 사이클 N번째마다 프로파일, 최근 K개 리포트 보관 (런타임 토글)"""
+
+    def __init__(self, every_n: int = 0, keep: int = 10, fmt: str = "html"):
+        self.every_n = every_n
+        self.fmt = fmt
+        self.reports: deque[ProfileReport] = deque(maxlen=max(keep, 1))
+        self._calls = 0
+
+    def configure(self, every_n: int | None = None, keep: int | None = None, fmt: str | None = None) -> None:
+        if every_n is not None:
+            self.every_n = max(every_n, 0)
+            self._calls = 0
+        if keep is not None:
+            self.reports = deque(self.reports, maxlen=max(keep, 1))
+        if fmt is not None:
+            if fmt not in FORMATS:
+                raise ValueError(f"Unknown profile format: {fmt}")
+            self.fmt = fmt
+
+    def add(self, report: ProfileReport) -> None:
+        self.reports.append(report)
+
+    def get(self, report_id: int) -> ProfileReport | None:
+        return next((r for r in self.reports if r.id == report_id), None)
+
+    async def run(self, fn: Callable[..., Awaitable[Any]], *args, target: str = "tick", **kwargs) -> Any:
+        """every_n번째 호출만 프로파일 — 꺼져 있으면 그대로 await"""
+        if not self.every_n:
+            return await fn(*args, **kwargs)
+        self._calls += 1
+        if self._calls % self.every_n or _lock.locked():
+            return await fn(*args, **kwargs)
+        result, report = await profile_call(fn, *args, target=target, fmt=self.fmt, **kwargs)
+        self.add(report)
+        logger.info("Profiled %s in %.0f ms (report #%d)", target, report.duration_s * 1000, report.id)
+        return result
+
+    def status(self) -> dict:
+        return {
+            "every_n": self.every_n,
+            "keep": self.reports.maxlen,
+            "format": self.fmt,
+            "engine": "pyinstrument" if PYINSTRUMENT_AVAILABLE else "cprofile",
+            "reports": [r.to_dict() for r in reversed(self.reports)],
+        }
+
+
+cycle_profiler = CycleProfiler(
+    every_n=settings.profile_every_n,
+    keep=settings.profile_keep,
+    fmt=settings.profile_format,
+)
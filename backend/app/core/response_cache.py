@@ -0,0 +1,123 @@
+"""
+Response Cache Middleware: 읽기 전용 대시보드 엔드포인트용 read-through 응답 캐시
+
+- 키: (경로, 정렬된 쿼리 문자열, 데이터 버전) — 쓰기 커밋 후 버전이 바뀌면 자동 미스
+- 값: 직렬화된 응답 본문 + 헤더, 본문 해시 기반 weak ETag
+  (바깥 GZipMiddleware가 같은 ETag로 압축 본문을 보내므로 바이트 단위 동일성을 보장하는 strong ETag 불가)
+- If-None-Match 일치 시 304 (본문 없음, weak 비교)
+- TTL: 다른 워커의 쓰기는 버전에 반영되지 않으므로 최대 지연을 TTL로 제한
+순수 ASGI 미들웨어 — 캐시 히트는 라우팅/SQL/집계 없이 딕셔너리 조회 1회
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Iterable
+from urllib.parse import parse_qsl, urlencode
+
+from app.core import data_version
+
+logger = logging.getLogger(__name__)
+
+
+def _etag(body: bytes) -> str:
+    return 'W/"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match는 weak 비교 (W/ 접두사 무시)"""
+    candidates = [c.strip() for c in header.split(",")]
+    return "*" in candidates or _opaque(etag) in {_opaque(c) for c in candidates}
+
+
+class ResponseCacheMiddleware:
+    def __init__(self, app, paths: Iterable[str], ttl: float = 10.0, max_entries: int = 512):
+        self.app = app
+        # "/"로 끝나면 prefix, 아니면 정확히 일치
+        self.exact = {p for p in paths if p and not p.endswith("/")}
+        self.prefixes = tuple(p for p in paths if p.endswith("/"))
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, int, list, bytes, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _cacheable(self, scope) -> bool:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return False
+        path = scope["path"]
+        return path in self.exact or (bool(self.prefixes) and path.startswith(self.prefixes))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def __call__(self, scope, receive, send):
+        if not self._cacheable(scope):
+            await self.app(scope, receive, send)
+            return
+
+        version = data_version.current()
+        query = urlencode(sorted(parse_qsl(scope.get("query_string", b"").decode("latin-1"))))
+        key = (scope["path"], query, version)
+        if_none_match = ""
+        for name, value in scope.get("headers", []):
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+                break
+
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            _, status, headers, body, etag = entry
+            await self._send_cached(send, status, headers, body, etag, if_none_match)
+            return
+
+        self.misses += 1
+        start_message: dict = {}
+        chunks: list[bytes] = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start_message.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        status = start_message.get("status", 500)
+        headers = [
+            (k, v) for k, v in start_message.get("headers", [])
+            if k.lower() not in (b"content-length", b"etag")
+        ]
+        body = b"".join(chunks)
+        etag = _etag(body)
+        if status == 200:
+            self._entries[key] = (time.monotonic(), status, headers, body, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            await self._send_cached(send, status, headers, body, etag, if_none_match)
+        else:
+            await send({**start_message, "headers": headers + [(b"content-length", str(len(body)).encode())]})
+            await send({"type": "http.response.body", "body": body})
+
+    async def _send_cached(self, send, status, headers, body, etag, if_none_match) -> None:
+        if if_none_match and _etag_matches(if_none_match, etag):
+            await send({"type": "http.response.start", "status": 304, "headers": [(b"etag", etag.encode())]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers + [
+                (b"etag", etag.encode()),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,36 @@
+"""
+Fast JSON responses — orjson 직렬화 (선택적 의존성: pip install -e ".[fast]")
+
+- FastJSONResponse: 앱 기본 응답 클래스 (orjson 없으면 표준 json으로 동작)
+- 큰 리스트를 반환하는 엔드포인트는 FastJSONResponse를 직접 반환 →
+  FastAPI의 jsonable_encoder 재귀 순회를 건너뛰고 orjson이 dict/list/datetime/numpy를 바로 직렬화
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+_ORJSON_OPTIONS = (
+    (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if ORJSON_AVAILABLE else 0
+)
+
+
+def dumps(content: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -16,6 +16,7 @@ _scheduler_task: asyncio.Task | None = None
 
 async def _trading_loop(interval_seconds: int) -> None:
     """주기적으로 거래 사이클 실행"""
+    from app.core.profiling import cycle_profiler
     from app.db.base import get_db
     from app.engines.trading_cycle import run_all_pm_cycles, record_nav
 
@@ -25,7 +26,7 @@ async def _trading_loop(interval_seconds: int) -> None:
         try:
             db = next(get_db())
             try:
-                results = await run_all_pm_cycles(db)
+                results = await cycle_profiler.run(run_all_pm_cycles, db, target="tick")
                 nav = record_nav(db)
                 executed = sum(1 for r in results if r.get("trade_executed"))
                 logger.info(
@@ -63,11 +64,43 @@ def stop_scheduler() -> None:
     _scheduler_task = None
 
 
+def start_trading_schedulers() -> None:
+    """주식 + 크립토 스케줄러 + Google Trends 갱신 시작 (리더로 선출된 워커에서만 호출)"""
+    import app.api.crypto as crypto_mod
+    from app.api.admin.strategic import get_social_engine
+
+    start_scheduler(interval_seconds=settings.scheduler_interval)
+    if crypto_mod._crypto_scheduler_task is None or crypto_mod._crypto_scheduler_task.done():
+        loop = asyncio.get_event_loop()
+        crypto_mod._crypto_scheduler_interval = settings.scheduler_interval
+        crypto_mod._crypto_scheduler_task = loop.create_task(
+            crypto_mod._crypto_trading_loop(settings.scheduler_interval)
+        )
+    # Trends는 레이트 리밋이 있어 워커 수만큼 늘어나지 않도록 리더만 수집
+    get_social_engine().start_trends_refresh()
+
+
+def stop_trading_schedulers() -> None:
+    """주식 + 크립토 스케줄러 + Google Trends 갱신 모두 중지 (리더십 상실 / 종료 시)"""
+    import app.api.crypto as crypto_mod
+    from app.api.admin.strategic import get_social_engine
+
+    stop_scheduler()
+    if crypto_mod._crypto_scheduler_task and not crypto_mod._crypto_scheduler_task.done():
+        crypto_mod._crypto_scheduler_task.cancel()
+        logger.info("Crypto scheduler stopped")
+    crypto_mod._crypto_scheduler_task = None
+    get_social_engine().trends.stop()
+
+
 def get_status() -> dict:
     """스케줄러 상태 반환"""
+    from app.core.leader import get_status as get_leader_status
+
+    leader = get_leader_status()
     if _scheduler_task is None:
-        return {"running": False, "status": "not_started"}
+        return {"running": False, "status": "not_started", "leader": leader}
     if _scheduler_task.done():
         exc = _scheduler_task.exception() if not _scheduler_task.cancelled() else None
-        return {"running": False, "status": "stopped", "error": str(exc) if exc else None}
-    return {"running": True, "status": "active"}
+        return {"running": False, "status": "stopped", "error": str(exc) if exc else None, "leader": leader}
+    return {"running": True, "status": "active", "leader": leader}
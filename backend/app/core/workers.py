@@ -0,0 +1,106 @@
+"""
+CPU 워커 풀 — 퀀트 시그널 / 백테스트를 이벤트 루프 밖에서 실행
+외부 의존성 없음 (concurrent.futures + multiprocessing.shared_memory)
+
+settings.worker_processes == 0 이면 호출 스레드에서 그대로 실행 (기존 동작).
+큰 가격 배열은 SharedArray로 공유 메모리에 한 번 복사해 넘기므로 pickling 비용이 없음.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Any, Callable
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """공유 메모리에 올라간 1차원 float64 배열 핸들 (pickle 시 이름/길이만 전달)"""
+    name: str
+    length: int
+
+    def attach(self) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+        """워커에서 복사 없이 배열 view 획득. 사용 후 shm.close() 필요"""
+        # 풀 워커는 부모의 resource_tracker를 공유 → attach 시 중복 등록은 무해, 해제는 소유자(unlink)만
+        shm = shared_memory.SharedMemory(name=self.name)
+        return shm, np.ndarray((self.length,), dtype=np.float64, buffer=shm.buf)
+
+
+def share_array(values) -> tuple[shared_memory.SharedMemory, SharedArray]:
+    """numpy 배열을 공유 메모리에 복사. 호출자가 작업 후 release_array()로 해제"""
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=np.float64, buffer=shm.buf)[:] = arr
+    return shm, SharedArray(name=shm.name, length=len(arr))
+
+
+def release_array(shm: shared_memory.SharedMemory) -> None:
+    shm.close()
+    shm.unlink()
+
+
+def load_array(values) -> tuple[shared_memory.SharedMemory | None, np.ndarray]:
+    """워커 함수용: SharedArray면 attach, 아니면 그대로 numpy 변환"""
+    if isinstance(values, SharedArray):
+        return values.attach()
+    return None, np.asarray(values, dtype=np.float64)
+
+
+def get_pool() -> ProcessPoolExecutor | None:
+    """워커 풀 (lazy 생성). worker_processes == 0 이면 None"""
+    global _pool
+    if _pool is None and settings.worker_processes > 0:
+        # fork는 스레드가 떠 있는 서버 프로세스에서 워커가 비정상 종료될 수 있어 spawn 사용
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.worker_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(f"CPU worker pool started — {settings.worker_processes} processes")
+    return _pool
+
+
+def shutdown_pool() -> None:
+    """워커 풀 종료 (lifespan 종료 시)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("CPU worker pool stopped")
+    _pool = None
+
+
+async def run_cpu(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    CPU 바운드 함수 실행. 풀이 있으면 다른 프로세스에서 실행하고 결과를 await.
+    fn은 pickle 가능한 모듈 최상위 함수여야 함.
+    """
+    pool = get_pool()
+    if pool is None:
+        return fn(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, partial(fn, *args, **kwargs))
+
+
+async def run_cpu_with_array(fn: Callable[..., Any], values, *args, **kwargs) -> Any:
+    """
+    큰 float 배열을 첫 인자로 받는 함수 실행.
+    풀 사용 + 배열이 충분히 크면 공유 메모리로 전달, 아니면 값을 그대로 전달.
+    """
+    pool = get_pool()
+    if pool is None or len(values) < settings.shared_memory_min_length:
+        return await run_cpu(fn, np.asarray(values, dtype=np.float64), *args, **kwargs)
+    shm, handle = share_array(values)
+    try:
+        return await run_cpu(fn, handle, *args, **kwargs)
+    finally:
+        release_array(shm)
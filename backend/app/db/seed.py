@@ -19,11 +19,32 @@ PM_SEEDS = [
 ]
 
 
+def _insert_ignore(db, model, rows: list[dict]) -> None:
+    """기존 PK는 건너뛰는 단일 INSERT (PostgreSQL/SQLite: ON CONFLICT DO NOTHING)"""
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        db.execute(insert(model).on_conflict_do_nothing(index_elements=["id"]), rows)
+        return
+
+    # 기타 DB: 기존 id 1회 조회 후 없는 행만 bulk INSERT
+    from sqlalchemy import insert, select
+
+    existing = set(db.scalars(select(model.id).where(model.id.in_([r["id"] for r in rows]))))
+    missing = [r for r in rows if r["id"] not in existing]
+    if missing:
+        db.execute(insert(model), missing)
+
+
 def seed_pms(db):
     from app.models.pm import PM
 
-    for seed in PM_SEEDS:
-        existing = db.query(PM).filter(PM.id == seed["id"]).first()
-        if not existing:
-            db.add(PM(**seed, initial_capital=100_000.0, current_capital=100_000.0))
+    _insert_ignore(
+        db,
+        PM,
+        [{**seed, "initial_capital": 100_000.0, "current_capital": 100_000.0} for seed in PM_SEEDS],
+    )
     db.commit()
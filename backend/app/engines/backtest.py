@@ -0,0 +1,108 @@
+"""
+Backtest Engine: 종목/전략별 과거 성과 시뮬레이션
+가격 배열만 받는 순수 함수 — 워커 프로세스에서 실행 가능 (app.core.workers)
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.core.workers import load_array
+from app.engines.quant import QuantEngine
+
+WARMUP = 20          # 시그널 계산에 필요한 최소 구간
+CHART_EVERY = 3      # 차트 포인트 간격
+TRADE_COST = 0.001   # 0.1% 거래비용
+
+
+def _next_position(strategy: str, score: float, rsi: float, position: float) -> float:
+    """전략별 진입/청산 로직"""
+    if strategy == "buy_hold":
+        return 1.0
+    if strategy == "rsi_momentum":
+        if score > 0.2 or rsi < 38:
+            return 1.0
+        if score < -0.2 or rsi > 62:
+            return 0.0
+        return position
+    if strategy == "mean_reversion":
+        if rsi < 32:
+            return 1.0
+        if rsi > 68:
+            return 0.0
+        return position
+    if strategy == "trend_follow":
+        return 1.0 if score > 0.15 else (0.0 if score < -0.15 else position)
+    # quant_king
+    return 1.0 if score > 0.1 else (0.0 if score < -0.1 else position)
+
+
+def simulate(values, strategy: str, symbol: str = "") -> dict:
+    """
+    전략 시뮬레이션. values: 종가 배열 (numpy / SharedArray)
+    chart_points의 index는 입력 배열 기준 위치 — 날짜 라벨은 호출자가 붙임
+    """
+    shm, arr = load_array(values)
+    try:
+        prices = pd.Series(arr, copy=False)
+        qe = QuantEngine()
+
+        portfolio_value = 100.0
+        benchmark_value = 100.0
+        chart_points = []
+        trades = 0
+        wins = 0
+        position = 0.0  # 0=현금, 1=롱
+
+        for i in range(WARMUP, len(prices)):
+            sig = qe.generate_signals(prices.iloc[:i], symbol)
+            new_pos = _next_position(strategy, sig["composite_score"], sig["rsi"], position)
+
+            day_return = float(arr[i]) / float(arr[i - 1]) - 1
+            strat_return = day_return if position == 1.0 else 0.0
+
+            if new_pos != position:
+                trades += 1
+                if new_pos == 0.0 and strat_return > 0:
+                    wins += 1
+                portfolio_value *= (1 + strat_return - TRADE_COST)
+            else:
+                portfolio_value *= (1 + strat_return)
+
+            benchmark_value *= (1 + day_return)
+            position = new_pos
+
+            if i % CHART_EVERY == 0:
+                chart_points.append((i, round(portfolio_value, 3), round(benchmark_value, 3)))
+    finally:
+        if shm is not None:
+            shm.close()
+
+    total_return = portfolio_value - 100.0
+    bench_return_total = benchmark_value - 100.0
+
+    # 수익률 시계열로 Sharpe/Sortino/MDD 계산
+    if len(chart_points) > 1:
+        strat_vals = np.array([p[1] for p in chart_points])
+        daily_rets = np.diff(strat_vals) / strat_vals[:-1]
+        sharpe = float(np.mean(daily_rets) / np.std(daily_rets) * np.sqrt(252)) if np.std(daily_rets) > 0 else 0.0
+        neg = daily_rets[daily_rets < 0]
+        sortino = float(np.mean(daily_rets) / np.std(neg) * np.sqrt(252)) if len(neg) > 0 and np.std(neg) > 0 else 0.0
+        peaks = np.maximum.accumulate(strat_vals)
+        mdd = float(((peaks - strat_vals) / peaks).max())
+        calmar = (total_return / 100) / mdd if mdd > 0 else 0.0
+    else:
+        sharpe = sortino = mdd = calmar = 0.0
+
+    win_rate = (wins / trades * 100) if trades > 0 else 0.0
+
+    return {
+        "total_return_pct": round(total_return, 3),
+        "benchmark_return_pct": round(bench_return_total, 3),
+        "sharpe_ratio": round(sharpe, 3),
+        "sortino_ratio": round(sortino, 3),
+        "max_drawdown_pct": round(mdd * 100, 3),
+        "calmar_ratio": round(calmar, 3),
+        "win_rate_pct": round(win_rate, 1),
+        "total_trades": trades,
+        "chart_points": chart_points,
+    }
@@ -1,7 +1,35 @@
+import asyncio
 import json
 import re
+import time
+from typing import Any, Awaitable, Callable
 
 from app.config import settings
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.metrics import metrics
+from app.engines.llm_usage import usage_ledger
+
+CLAUDE_MODEL = "claude-haiku-4-5-20251001"
+OPENAI_MODEL = "gpt-4o-mini"
+GEMINI_MODEL = "gemini-2.0-flash"
+GROK_MODEL = "grok-3-mini-fast"
+
+# PM 설정 provider → 실제 호출 백엔드 (서킷 브레이커 단위)
+PROVIDER_BACKENDS = {
+    "claude": "claude",
+    "openai": "openai",
+    "gemini": "gemini",
+    "grok": "grok",
+    "deepseek": "claude",  # fallback to claude if deepseek key missing
+}
+
+
+class ProviderNotConfigured(RuntimeError):
+    """API 키 없음 — 가용성 캐시에 기록되어 TTL 동안 재시도하지 않음"""
+
+
+class ProviderUnavailable(RuntimeError):
+    """서킷 open 또는 미설정 캐시 적중 — 프롬프트 생성/호출 없이 즉시 폴백"""
 
 SYSTEM_PROMPTS = {
     "atlas": "You are Atlas, a macro regime trading AI. You analyze interest rates, VIX, and currency trends to make directional bets on broad market regimes.",
@@ -30,6 +58,22 @@ DECISION_SCHEMA = {
 
 JSON_INSTRUCTION = "\n\nRespond ONLY with valid JSON matching this schema (no markdown, no code fences): " + json.dumps(DECISION_SCHEMA)
 
+# 배치 모드: 관심 종목 전체를 한 프롬프트로 → 종목별 결정 배열
+BATCH_DECISION_SCHEMA = {"symbol": "ticker from the request", **DECISION_SCHEMA}
+BATCH_INSTRUCTION = (
+    "\n\nRespond ONLY with a valid JSON array containing exactly one object per requested symbol "
+    "(no markdown, no code fences). Each object must match this schema: " + json.dumps(BATCH_DECISION_SCHEMA)
+)
+# Chat Completions JSON 모드는 최상위 객체만 허용 → {"decisions": [...]}로 감쌈
+BATCH_OBJECT_INSTRUCTION = (
+    '\n\nRespond ONLY with a valid JSON object of the form {"decisions": [...]} where the array contains '
+    "exactly one object per requested symbol. Each object must match this schema: " + json.dumps(BATCH_DECISION_SCHEMA)
+)
+JSON_OBJECT_PROVIDERS = ("openai", "grok")
+
+# 헤징/결정 예산이 느린 호출을 버릴 때의 취소 메시지 — _invoke가 서킷 실패로 집계
+SLOW_CALL_CANCELLED = "llm call abandoned: too slow"
+
 
 def _parse_json(text: str) -> dict:
     """Parse JSON from LLM response, stripping markdown code fences if present."""
@@ -38,6 +82,103 @@ def _parse_json(text: str) -> dict:
     return json.loads(cleaned)
 
 
+def _parse_batch(payload: dict | list, symbols: list[str]) -> dict[str, dict]:
+    """배치 응답(배열 또는 {"decisions": 배열}) → {symbol: 결정}, 요청하지 않은 종목은 무시"""
+    if isinstance(payload, dict):
+        payload = payload.get("decisions", [])
+    if not isinstance(payload, list):
+        raise ValueError("Batch decision response is not a JSON array")
+    wanted = {s.upper(): s for s in symbols}
+    decisions: dict[str, dict] = {}
+    for item in payload:
+        if not isinstance(item, dict):
+            continue
+        symbol = wanted.get(str(item.get("symbol", "")).upper())
+        if symbol is not None and symbol not in decisions:
+            decisions[symbol] = item
+    return decisions
+
+
+def _normalize_decision(result: dict) -> dict:
+    """스키마 정규화 + 최소 확신도 미만은 HOLD"""
+    if result.get("conviction", 0) < settings.min_conviction:
+        result["action"] = "HOLD"
+    return {
+        "action": result.get("action", "HOLD"),
+        "conviction": float(result.get("conviction", 0.0)),
+        "reasoning": result.get("reasoning", ""),
+        "position_size": float(result.get("position_size", 0.0)),
+    }
+
+
+def _tokens(value) -> int:
+    return value if isinstance(value, int) else 0
+
+
+def _anthropic_usage(message) -> dict:
+    """Anthropic: input_tokens는 캐시 미적중분만 (읽기/생성은 별도 필드)"""
+    usage = getattr(message, "usage", None)
+    return {
+        "input_tokens": _tokens(getattr(usage, "input_tokens", 0)),
+        "cached_tokens": _tokens(getattr(usage, "cache_read_input_tokens", 0)),
+        "cache_write_tokens": _tokens(getattr(usage, "cache_creation_input_tokens", 0)),
+        "output_tokens": _tokens(getattr(usage, "output_tokens", 0)),
+    }
+
+
+def _openai_usage(response) -> dict:
+    """OpenAI/Grok: prompt_tokens에 캐시분 포함 → 미적중분 = prompt - cached"""
+    usage = getattr(response, "usage", None)
+    prompt = _tokens(getattr(usage, "prompt_tokens", 0))
+    cached = _tokens(getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", 0))
+    return {
+        "input_tokens": max(prompt - cached, 0),
+        "cached_tokens": cached,
+        "output_tokens": _tokens(getattr(usage, "completion_tokens", 0)),
+    }
+
+
+def _gemini_usage(response) -> dict:
+    usage = getattr(response, "usage_metadata", None)
+    prompt = _tokens(getattr(usage, "prompt_token_count", 0))
+    cached = _tokens(getattr(usage, "cached_content_token_count", 0))
+    return {
+        "input_tokens": max(prompt - cached, 0),
+        "cached_tokens": cached,
+        "output_tokens": _tokens(getattr(usage, "candidates_token_count", 0)),
+    }
+
+
+def _tag(decision: Any, source: str) -> Any:
+    """헤징 결과 출처 표시 (단일 결정 dict 또는 {symbol: 결정})"""
+    if isinstance(decision, dict) and "action" in decision:
+        return {**decision, "decided_by": source}
+    if isinstance(decision, dict):
+        return {sym: {**d, "decided_by": source} for sym, d in decision.items()}
+    return decision
+
+
+async def _first_success(tasks: dict[asyncio.Task, str]) -> Any:
+    """먼저 성공한 태스크 결과 (출처 표시). 모두 실패하면 primary 예외를 다시 발생"""
+    pending = set(tasks)
+    errors: dict[str, BaseException] = {}
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return _tag(task.result(), tasks[task])
+            errors[tasks[task]] = task.exception()
+    raise errors.get("primary") or next(iter(errors.values()))
+
+
+def _client_kwargs(api_key: str, base_url: str) -> dict:
+    """SDK 클라이언트 생성 인자 — base_url이 설정된 경우만 전달 (로컬 stand-in 서버 등)"""
+    kwargs = {"api_key": api_key}
+    if base_url:
+        kwargs["base_url"] = base_url
+    return kwargs
+
+
 class LLMEngine:
     def __init__(self):
         self._claude_client = None
@@ -45,6 +186,16 @@ class LLMEngine:
         self._grok_client = None
         self._gemini_client = None
         self._gemini_model = None
+        self.breakers = {
+            backend: CircuitBreaker(
+                backend,
+                failure_threshold=settings.llm_breaker_failure_threshold,
+                cooldown=settings.llm_breaker_cooldown,
+                max_cooldown=settings.llm_breaker_max_cooldown,
+            )
+            for backend in set(PROVIDER_BACKENDS.values())
+        }
+        self._unconfigured_until: dict[str, float] = {}  # 가용성 캐시: backend → 재확인 시각
 
     # --- Lazy client init ---
 
@@ -52,23 +203,26 @@ class LLMEngine:
     def claude_client(self):
         if self._claude_client is None and settings.anthropic_api_key:
             import anthropic
-            self._claude_client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+            self._claude_client = anthropic.AsyncAnthropic(
+                **_client_kwargs(settings.anthropic_api_key, settings.anthropic_base_url)
+            )
         return self._claude_client
 
     @property
     def openai_client(self):
         if self._openai_client is None and settings.openai_api_key:
             import openai
-            self._openai_client = openai.OpenAI(api_key=settings.openai_api_key)
+            self._openai_client = openai.AsyncOpenAI(
+                **_client_kwargs(settings.openai_api_key, settings.openai_base_url)
+            )
         return self._openai_client
 
     @property
     def grok_client(self):
         if self._grok_client is None and settings.grok_api_key:
             import openai
-            self._grok_client = openai.OpenAI(
-                api_key=settings.grok_api_key,
-                base_url="https://api.x.ai/v1",
+            self._grok_client = openai.AsyncOpenAI(
+                **_client_kwargs(settings.grok_api_key, settings.grok_base_url or "https://api.x.ai/v1")
             )
         return self._grok_client
 
@@ -76,67 +230,106 @@ class LLMEngine:
     def gemini_model(self):
         if self._gemini_model is None and settings.gemini_api_key:
             from google import genai
-            self._gemini_client = genai.Client(api_key=settings.gemini_api_key)
-            self._gemini_model = "gemini-2.0-flash"
+            from google.genai import types
+            self._gemini_client = genai.Client(
+                api_key=settings.gemini_api_key,
+                http_options=types.HttpOptions(
+                    base_url=settings.gemini_base_url or None,
+                    timeout=int(settings.llm_timeout * 1000),  # ms
+                ),
+            )
+            self._gemini_model = GEMINI_MODEL
         return self._gemini_model
 
     # --- Provider calls ---
+    # 고정 prefix(SYSTEM_PROMPTS[pm_id] + instruction)를 항상 맨 앞에 → 프로바이더 프롬프트 캐시 적중
+    # Anthropic: system 블록에 cache_control, OpenAI/Grok/Gemini: prefix 자동 캐시
+
+    async def _timed_call(self, provider: str, pm_id: str, model: str, create, usage_fn, /, **kwargs):
+        """
+        비동기 SDK 호출 + 토큰/지연을 usage ledger에 기록 (실패·취소도 기록)
+        스레드 풀을 거치지 않음 → 동시 호출 수가 풀 크기에 묶이지 않고, 헤징/예산 취소 시 HTTP 요청도 중단
+        취소된 호출은 취소 시점까지의 지연(실제 지연의 하한)을 실패로 기록 → hedge deadline 표본
+        """
+        started = time.perf_counter()
+        try:
+            response = await create(**kwargs)
+        except (Exception, asyncio.CancelledError):
+            usage_ledger.record(provider, pm_id, model, latency=time.perf_counter() - started, ok=False)
+            raise
+        usage_ledger.record(provider, pm_id, model, latency=time.perf_counter() - started, **usage_fn(response))
+        return response
 
-    async def _call_claude(self, pm_id: str, prompt: str) -> dict:
+    async def _call_claude(
+        self, pm_id: str, prompt: str, instruction: str = JSON_INSTRUCTION, max_tokens: int = 512
+    ) -> dict | list:
         if not self.claude_client:
-            raise RuntimeError("Anthropic API key not configured")
+            raise ProviderNotConfigured("Anthropic API key not configured")
         system = SYSTEM_PROMPTS.get(pm_id, SYSTEM_PROMPTS["atlas"])
-        message = self.claude_client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=512,
-            system=system + JSON_INSTRUCTION,
+        message = await self._timed_call(
+            "claude", pm_id, CLAUDE_MODEL, self.claude_client.messages.create, _anthropic_usage,
+            model=CLAUDE_MODEL,
+            max_tokens=max_tokens,
+            system=[{"type": "text", "text": system + instruction, "cache_control": {"type": "ephemeral"}}],
             messages=[{"role": "user", "content": prompt}],
+            timeout=settings.llm_timeout,
         )
         return _parse_json(message.content[0].text)
 
-    async def _call_openai(self, pm_id: str, prompt: str) -> dict:
+    async def _call_openai(
+        self, pm_id: str, prompt: str, instruction: str = JSON_INSTRUCTION, max_tokens: int = 512
+    ) -> dict | list:
         if not self.openai_client:
-            raise RuntimeError("OpenAI API key not configured")
+            raise ProviderNotConfigured("OpenAI API key not configured")
         system = SYSTEM_PROMPTS.get(pm_id, SYSTEM_PROMPTS["atlas"])
-        response = self.openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=512,
+        response = await self._timed_call(
+            "openai", pm_id, OPENAI_MODEL, self.openai_client.chat.completions.create, _openai_usage,
+            model=OPENAI_MODEL,
+            max_tokens=max_tokens,
             messages=[
-                {"role": "system", "content": system + JSON_INSTRUCTION},
+                {"role": "system", "content": system + instruction},
                 {"role": "user", "content": prompt},
             ],
             response_format={"type": "json_object"},
+            timeout=settings.llm_timeout,
         )
         return _parse_json(response.choices[0].message.content)
 
-    async def _call_gemini(self, pm_id: str, prompt: str) -> dict:
+    async def _call_gemini(
+        self, pm_id: str, prompt: str, instruction: str = JSON_INSTRUCTION, max_tokens: int = 512
+    ) -> dict | list:
         if not self.gemini_model:
-            raise RuntimeError("Gemini API key not configured")
+            raise ProviderNotConfigured("Gemini API key not configured")
         from google.genai import types
         system = SYSTEM_PROMPTS.get(pm_id, SYSTEM_PROMPTS["atlas"])
-        full_prompt = f"{system}{JSON_INSTRUCTION}\n\n{prompt}"
-        response = self._gemini_client.models.generate_content(
+        full_prompt = f"{system}{instruction}\n\n{prompt}"
+        response = await self._timed_call(
+            "gemini", pm_id, self._gemini_model, self._gemini_client.aio.models.generate_content, _gemini_usage,
             model=self._gemini_model,
             contents=full_prompt,
             config=types.GenerateContentConfig(
-                max_output_tokens=512,
+                max_output_tokens=max_tokens,
                 response_mime_type="application/json",
             ),
         )
         return _parse_json(response.text)
 
-    async def _call_grok(self, pm_id: str, prompt: str) -> dict:
+    async def _call_grok(
+        self, pm_id: str, prompt: str, instruction: str = JSON_INSTRUCTION, max_tokens: int = 512
+    ) -> dict | list:
         if not self.grok_client:
-            raise RuntimeError("Grok API key not configured")
+            raise ProviderNotConfigured("Grok API key not configured")
         system = SYSTEM_PROMPTS.get(pm_id, SYSTEM_PROMPTS["atlas"])
-        response = self.grok_client.chat.completions.create(
-            model="grok-3-mini-fast",
-            max_tokens=512,
+        response = await self._timed_call(
+            "grok", pm_id, GROK_MODEL, self.grok_client.chat.completions.create, _openai_usage,
+            model=GROK_MODEL,
+            max_tokens=max_tokens,
             messages=[
-                {"role": "system", "content": system + JSON_INSTRUCTION},
+                {"role": "system", "content": system + instruction},
                 {"role": "user", "content": prompt},
             ],
             response_format={"type": "json_object"},
+            timeout=settings.llm_timeout,
         )
         return _parse_json(response.choices[0].message.content)
 
@@ -149,7 +342,21 @@ class LLMEngine:
         quant_signals: dict,
         market_context: dict,
         llm_provider: str = "claude",
+        fallback: Callable[[], dict] | None = None,
+    ) -> dict:
+        """
+        fallback: 헤징/예산 초과 시 사용할 즉시 결정 (보통 규칙 기반)
+        LLM_HEDGE_ENABLED / LLM_DECISION_BUDGET 이 꺼져 있으면 단일 호출 그대로
+        """
+        run = lambda provider: self._decide(pm_id, symbol, quant_signals, market_context, provider)
+        if settings.llm_hedge_enabled or settings.llm_decision_budget > 0:
+            return await self._hedged(llm_provider, run, fallback)
+        return await run(llm_provider)
+
+    async def _decide(
+        self, pm_id: str, symbol: str, quant_signals: dict, market_context: dict, llm_provider: str
     ) -> dict:
+        backend = self._acquire(llm_provider)
         prompt = f"""Analyze this trading opportunity:
 Symbol: {symbol}
 Quant Signals: {json.dumps(quant_signals)}
@@ -157,26 +364,191 @@ Market Context: {json.dumps(market_context)}
 
 Make a trading decision. If conviction < 0.3, use HOLD. Be willing to take positions when signals are mildly favorable."""
 
+        result = await self._invoke(backend, pm_id, prompt)
+        return _normalize_decision(result)
+
+    async def make_batch_decision(
+        self,
+        pm_id: str,
+        quant_signals: dict[str, dict],
+        market_context: dict,
+        llm_provider: str = "claude",
+        current_prices: dict[str, float] | None = None,
+        fallback: Callable[[], dict[str, dict]] | None = None,
+    ) -> dict[str, dict]:
+        """
+        관심 종목 전체를 한 번의 호출로 판단 → {symbol: 결정}
+        quant_signals: {symbol: 퀀트 시그널}. 응답에 없는 종목은 HOLD (conviction 0)
+        fallback: 헤징/예산 초과 시 사용할 종목별 즉시 결정
+        """
+        run = lambda provider: self._decide_batch(pm_id, quant_signals, market_context, provider, current_prices)
+        if settings.llm_hedge_enabled or settings.llm_decision_budget > 0:
+            return await self._hedged(llm_provider, run, fallback)
+        return await run(llm_provider)
+
+    async def _decide_batch(
+        self,
+        pm_id: str,
+        quant_signals: dict[str, dict],
+        market_context: dict,
+        llm_provider: str,
+        current_prices: dict[str, float] | None,
+    ) -> dict[str, dict]:
+        backend = self._acquire(llm_provider)
+        symbols = list(quant_signals)
+        current_prices = current_prices or {}
+        lines = "\n".join(
+            f"- {sym}: {json.dumps({**signals, 'current_price': current_prices.get(sym)})}"
+            for sym, signals in quant_signals.items()
+        )
+        prompt = f"""Analyze these trading opportunities on your watchlist:
+Market Context: {json.dumps(market_context)}
+Symbols (quant signals):
+{lines}
+
+Make one trading decision per symbol. If conviction < 0.3, use HOLD. Be willing to take positions when signals are mildly favorable."""
+
+        instruction = BATCH_OBJECT_INSTRUCTION if llm_provider in JSON_OBJECT_PROVIDERS else BATCH_INSTRUCTION
+        payload = await self._invoke(
+            backend, pm_id, prompt, instruction=instruction, max_tokens=min(256 + 160 * len(symbols), 4096),
+        )
+        parsed = _parse_batch(payload, symbols)
+        return {
+            sym: _normalize_decision(parsed.get(sym, {"action": "HOLD", "reasoning": "No decision returned"}))
+            for sym in symbols
+        }
+
+    # --- Hedging / decision budget ---
+
+    def hedge_deadline(self, llm_provider: str) -> float:
+        """
+        primary 대기 시간 = 최근 호출 시도 전체(취소된 호출·실패 포함) 지연의 LLM_HEDGE_PERCENTILE 퍼센타일
+        (표본 부족 시 기본값). 마감 전에 끝난 호출만 보면 deadline이 계속 줄어드는 편향이 생김
+        """
+        backend = PROVIDER_BACKENDS.get(llm_provider, llm_provider)
+        observed = usage_ledger.latency_percentile(
+            backend, settings.llm_hedge_percentile, min_samples=settings.llm_hedge_min_samples,
+        )
+        deadline = settings.llm_hedge_default_delay if observed is None else observed
+        deadline = max(deadline, settings.llm_hedge_min_delay)
+        if settings.llm_decision_budget > 0:
+            deadline = min(deadline, settings.llm_decision_budget)
+        return deadline
+
+    async def _hedged(
+        self,
+        llm_provider: str,
+        run: Callable[[str], Awaitable[Any]],
+        fallback: Callable[[], Any] | None,
+    ) -> Any:
+        """
+        primary 호출이 deadline 안에 끝나지 않으면 hedge 시작 → 먼저 성공한 결과 사용
+        hedge: LLM_HEDGE_SECONDARY 프로바이더, 없으면 fallback (즉시 결정)
+        전체는 LLM_DECISION_BUDGET(초)로 상한 — 초과 시 fallback (없으면 TimeoutError)
+        deadline을 넘긴 primary, 예산 만료 시 남은 호출은 SLOW_CALL_CANCELLED로 취소 → 서킷 실패로 집계
+        (응답 없이 멈춘 프로바이더도 서킷이 열림). primary에 진 secondary는 결과 없음으로 취소
+        취소된 호출은 HTTP 요청이 중단되고 취소 시점까지의 지연이 usage ledger에 기록됨 (_timed_call)
+        """
+        budget = settings.llm_decision_budget if settings.llm_decision_budget > 0 else None
+        primary = asyncio.create_task(run(llm_provider))
+        tasks: dict[asyncio.Task, str] = {primary: "primary"}
+        slow: set[asyncio.Task] = set()
+        timeout = asyncio.timeout(budget)
+        try:
+            async with timeout:
+                if settings.llm_hedge_enabled:
+                    done, _ = await asyncio.wait(set(tasks), timeout=self.hedge_deadline(llm_provider))
+                    if not done:
+                        slow.add(primary)
+                        metrics.event("llm_hedged")
+                        secondary = settings.llm_hedge_secondary
+                        if secondary and PROVIDER_BACKENDS.get(secondary) not in (None, PROVIDER_BACKENDS.get(llm_provider)):
+                            tasks[asyncio.create_task(run(secondary))] = f"secondary:{secondary}"
+                        elif fallback is not None:
+                            return _tag(fallback(), "fallback")
+                return await _first_success(tasks)
+        except TimeoutError:
+            if not timeout.expired():
+                raise
+            slow.update(tasks)
+            metrics.event("llm_budget_exceeded")
+            if fallback is None:
+                raise
+            return _tag(fallback(), "fallback")
+        finally:
+            for task in tasks:
+                task.cancel(SLOW_CALL_CANCELLED if task in slow else None)
+
+    # --- Availability / circuit breaker ---
+
+    def _acquire(self, llm_provider: str) -> str:
+        """
+        호출 가능한 백엔드 반환 — 미설정 캐시 적중이나 서킷 open이면 ProviderUnavailable
+        (프롬프트 생성 전에 확인 → 장애 중에는 사이클당 비용이 거의 0)
+        """
+        backend = PROVIDER_BACKENDS.get(llm_provider)
+        if backend is None:
+            raise ValueError(f"Unknown LLM provider: {llm_provider}")
+        if self._unconfigured_until.get(backend, 0.0) > time.monotonic():
+            raise ProviderUnavailable(f"{backend} not configured")
+        if not self.breakers[backend].allow():
+            raise ProviderUnavailable(f"{backend} circuit open")
+        return backend
+
+    async def _invoke(self, backend: str, pm_id: str, prompt: str, **kwargs) -> dict | list:
+        caller = self._caller(backend)
+        breaker = self.breakers[backend]
+        try:
+            result = await caller(pm_id, prompt, **kwargs)
+        except asyncio.CancelledError as exc:
+            if SLOW_CALL_CANCELLED in exc.args:
+                # deadline/예산 초과로 버려짐 → 타임아웃과 같은 실패
+                breaker.record_failure()
+            else:
+                # 결과 없이 취소 (secondary가 primary에 짐, 종료 등) — half_open probe를 잡고 있으면 풀어줌
+                breaker.release_probe()
+            raise
+        except ProviderNotConfigured:
+            self._unconfigured_until[backend] = time.monotonic() + settings.llm_availability_ttl
+            breaker.record_failure()
+            raise
+        except ValueError:
+            # 응답은 왔지만 JSON 파싱 실패 → 프로바이더는 살아 있음
+            breaker.record_success()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return result
+
+    def reset_provider(self, backend: str) -> None:
+        """서킷 수동 close + 미설정 캐시 삭제 (키 설정/장애 복구 직후)"""
+        if backend not in self.breakers:
+            raise KeyError(backend)
+        self.breakers[backend].reset()
+        self._unconfigured_until.pop(backend, None)
+
+    def provider_status(self) -> dict[str, dict]:
+        """백엔드별 설정 여부 + 서킷 상태"""
+        now = time.monotonic()
+        return {
+            backend: {
+                "configured": self._unconfigured_until.get(backend, 0.0) <= now,
+                **breaker.status(),
+            }
+            for backend, breaker in sorted(self.breakers.items())
+        }
+
+    def _caller(self, llm_provider: str):
         call_map = {
             "claude": self._call_claude,
             "openai": self._call_openai,
             "gemini": self._call_gemini,
             "grok": self._call_grok,
-            "deepseek": self._call_claude,  # fallback to claude if deepseek key missing
         }
 
         caller = call_map.get(llm_provider)
         if caller is None:
             raise ValueError(f"Unknown LLM provider: {llm_provider}")
-
-        result = await caller(pm_id, prompt)
-
-        if result.get("conviction", 0) < settings.min_conviction:
-            result["action"] = "HOLD"
-
-        return {
-            "action": result.get("action", "HOLD"),
-            "conviction": float(result.get("conviction", 0.0)),
-            "reasoning": result.get("reasoning", ""),
-            "position_size": float(result.get("position_size", 0.0)),
-        }
+        return caller
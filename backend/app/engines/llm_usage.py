@@ -0,0 +1,164 @@
+"""
+LLM Usage Ledger: 호출별 토큰/지연 기록 + 프로바이더·PM별 비용/지연 집계
+
+- 고정 크기 컬럼형 링버퍼 (numpy 배열, 호출당 ~40 bytes) — 최근 N건만 보관
+- provider / pm / model 은 정수 코드로 인턴
+- 토큰: input(캐시 미적중 입력), cached(캐시 읽기), cache_write(캐시 생성), output
+- 비용은 MODEL_PRICING (USD / 1M tokens, 공개 정가 근사치) 기준 추정
+
+프로세스 로컬 — 리더 워커(사이클 실행 워커)의 값이 의미 있음
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from app.config import settings
+from app.core.metrics import percentile
+
+# (input, cached_input, cache_write, output) USD / 1M tokens
+MODEL_PRICING: dict[str, tuple[float, float, float, float]] = {
+    "claude-haiku-4-5-20251001": (1.00, 0.10, 1.25, 5.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.15, 0.60),
+    "gemini-2.0-flash": (0.10, 0.025, 0.10, 0.40),
+    "grok-3-mini-fast": (0.60, 0.15, 0.60, 4.00),
+}
+
+GROUP_BY = ("provider", "pm", "model")
+
+_DTYPE = np.dtype([
+    ("ts", "f8"),
+    ("provider", "u2"),
+    ("pm", "u2"),
+    ("model", "u2"),
+    ("ok", "?"),
+    ("input", "u4"),
+    ("cached", "u4"),
+    ("cache_write", "u4"),
+    ("output", "u4"),
+    ("latency", "f4"),
+])
+
+
+class UsageLedger:
+    def __init__(self, capacity: int = 10_000, clock=time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rows = np.zeros(max(capacity, 1), dtype=_DTYPE)
+        self._next = 0
+        self._size = 0
+        self._codes: dict[str, dict[str, int]] = {k: {} for k in GROUP_BY}
+        self._names: dict[str, list[str]] = {k: [] for k in GROUP_BY}
+
+    def _code(self, kind: str, name: str) -> int:
+        codes = self._codes[kind]
+        if name not in codes:
+            codes[name] = len(self._names[kind])
+            self._names[kind].append(name)
+        return codes[name]
+
+    def record(
+        self,
+        provider: str,
+        pm_id: str,
+        model: str,
+        *,
+        input_tokens: int = 0,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        output_tokens: int = 0,
+        latency: float = 0.0,
+        ok: bool = True,
+    ) -> None:
+        with self._lock:
+            self._rows[self._next] = (
+                self._clock(),
+                self._code("provider", provider),
+                self._code("pm", pm_id),
+                self._code("model", model),
+                ok,
+                input_tokens,
+                cached_tokens,
+                cache_write_tokens,
+                output_tokens,
+                latency,
+            )
+            self._next = (self._next + 1) % len(self._rows)
+            self._size = min(self._size + 1, len(self._rows))
+
+    def _snapshot(self, since: float | None) -> np.ndarray:
+        with self._lock:
+            rows = self._rows[:self._size].copy()
+        if since is not None:
+            rows = rows[rows["ts"] >= since]
+        return rows
+
+    def _cost(self, rows: np.ndarray) -> float:
+        total = 0.0
+        for code, model in enumerate(self._names["model"]):
+            price = MODEL_PRICING.get(model)
+            if price is None:
+                continue
+            sel = rows[rows["model"] == code]
+            if len(sel):
+                tokens = (sel["input"].sum(), sel["cached"].sum(), sel["cache_write"].sum(), sel["output"].sum())
+                total += sum(float(t) * p for t, p in zip(tokens, price)) / 1_000_000
+        return total
+
+    def _summarize(self, rows: np.ndarray) -> dict:
+        ok = rows[rows["ok"]]
+        latencies = sorted(ok["latency"].tolist())
+        input_tokens = int(ok["input"].sum())
+        cached = int(ok["cached"].sum())
+        prompt_total = input_tokens + cached + int(ok["cache_write"].sum())
+        return {
+            "calls": int(len(rows)),
+            "errors": int(len(rows) - len(ok)),
+            "input_tokens": input_tokens,
+            "cached_tokens": cached,
+            "cache_write_tokens": int(ok["cache_write"].sum()),
+            "output_tokens": int(ok["output"].sum()),
+            "cache_hit_ratio": round(cached / prompt_total, 4) if prompt_total else 0.0,
+            "cost_usd": round(self._cost(ok), 6),
+            "mean_ms": round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        }
+
+    def aggregate(self, group_by: str = "provider", since: float | None = None) -> dict[str, dict]:
+        """group_by(provider | pm | model)별 호출 수/토큰/캐시 적중률/비용/지연"""
+        if group_by not in GROUP_BY:
+            raise ValueError(f"group_by must be one of {', '.join(GROUP_BY)}")
+        rows = self._snapshot(since)
+        return {
+            name: self._summarize(rows[rows[group_by] == code])
+            for code, name in enumerate(self._names[group_by])
+            if (rows[group_by] == code).any()
+        }
+
+    def totals(self, since: float | None = None) -> dict:
+        return self._summarize(self._snapshot(since))
+
+    def latency_percentile(self, provider: str, q: float, window: int = 200, min_samples: int = 1) -> float | None:
+        """
+        프로바이더 최근 호출 시도 window건(성공·실패 모두)의 지연 퍼센타일 (초) — 표본이 min_samples 미만이면 None
+        타임아웃으로 끝난 시도도 꼬리 지연이므로 포함
+        """
+        code = self._codes["provider"].get(provider)
+        if code is None:
+            return None
+        rows = self._snapshot(None)
+        rows = rows[rows["provider"] == code]
+        if len(rows) < max(min_samples, 1):
+            return None
+        latest = np.sort(rows, order="ts")[-window:]
+        return percentile(sorted(latest["latency"].tolist()), q)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._next = 0
+            self._size = 0
+
+
+usage_ledger = UsageLedger(capacity=settings.llm_usage_capacity)
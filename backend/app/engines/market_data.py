@@ -4,15 +4,33 @@ Market Data Engine: yfinance 기반 실시간/히스토리 가격 데이터 수
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterable, Optional, Protocol
 import pandas as pd
 
-# yfinance 사용 (pip install yfinance)
-try:
-    import yfinance as yf
-    YFINANCE_AVAILABLE = True
-except ImportError:  # pragma: no cover
-    YFINANCE_AVAILABLE = False  # pragma: no cover
+from app.core.lazy import LazyImport, module_available
+
+# yfinance 사용 (pip install yfinance) — import 비용이 커서 첫 호출 시 로드
+YFINANCE_AVAILABLE = module_available("yfinance")
+yf = LazyImport("yfinance")
+
+
+class PriceSource(Protocol):
+    """외부 가격 소스 (리플레이 하네스 등) — 설정되면 yfinance/mock 대신 사용"""
+
+    def history(self, symbol: str, days: int) -> Optional[pd.Series]: ...
+
+    def current(self, symbol: str) -> float: ...
+
+
+_price_source: Optional[PriceSource] = None
+
+
+def set_price_source(source: Optional[PriceSource]) -> Optional[PriceSource]:
+    """가격 소스 교체 (None = 기본 yfinance/mock). 이전 소스를 반환"""
+    global _price_source
+    previous, _price_source = _price_source, source
+    return previous
+
 
 # PM별 관심 종목
 PM_WATCHLISTS: dict[str, list[str]] = {
@@ -49,6 +67,8 @@ MOCK_PRICES: dict[str, float] = {
 
 def get_price_history(symbol: str, days: int = 60) -> Optional[pd.Series]:
     """종목의 가격 히스토리 반환"""
+    if _price_source is not None:
+        return _price_source.history(symbol, days)
     if not YFINANCE_AVAILABLE:  # pragma: no cover
         return _mock_price_history(symbol, days)  # pragma: no cover
 
@@ -66,6 +86,8 @@ def get_price_history(symbol: str, days: int = 60) -> Optional[pd.Series]:
 
 def get_current_price(symbol: str) -> float:
     """현재가 반환"""
+    if _price_source is not None:
+        return _price_source.current(symbol)
     if not YFINANCE_AVAILABLE:  # pragma: no cover
         return _mock_current_price(symbol)  # pragma: no cover
 
@@ -80,6 +102,35 @@ def get_current_price(symbol: str) -> float:
         return _mock_current_price(symbol)
 
 
+def get_current_prices(symbols: Iterable[str]) -> dict[str, float]:
+    """여러 종목 현재가 일괄 조회 (yfinance 배치 다운로드 1회, 실패 종목은 mock)"""
+    unique = sorted(set(symbols))
+    if not unique:
+        return {}
+    if _price_source is not None:
+        return {sym: _price_source.current(sym) for sym in unique}
+    if not YFINANCE_AVAILABLE:  # pragma: no cover
+        return {sym: _mock_current_price(sym) for sym in unique}  # pragma: no cover
+
+    prices: dict[str, float] = {}
+    try:
+        data = yf.download(unique, period="5d", progress=False, threads=True)
+        close = data["Close"]
+        if isinstance(close, pd.Series):
+            close = close.to_frame(unique[0])
+        last = close.ffill().iloc[-1]
+        for sym in unique:
+            value = last.get(sym)
+            if value is not None and pd.notna(value) and value > 0:
+                prices[sym] = float(value)
+    except (ValueError, KeyError, TypeError, IndexError, OSError):
+        pass
+    for sym in unique:
+        if sym not in prices:
+            prices[sym] = _mock_current_price(sym)
+    return prices
+
+
 def get_prices_for_pm(pm_id: str) -> dict[str, float]:
     """PM 관심 종목들의 현재가 반환"""
     symbols = PM_WATCHLISTS.get(pm_id, ["SPY"])
@@ -90,18 +141,9 @@ def get_prices_for_pm(pm_id: str) -> dict[str, float]:
 
 
 def _mock_price_history(symbol: str, days: int) -> pd.Series:
-    """Mock 가격 히스토리 생성 (yfinance 없을 때)"""
-    import numpy as np
-    base_price = MOCK_PRICES.get(symbol, 100.0)
-    # 날짜 기반 시드: 같은 날 같은 종목은 일관성 유지, 다른 날엔 다른 시그널
-    day_seed = (hash(symbol) + datetime.now().toordinal()) % 100000
-    np.random.seed(day_seed)
-    returns = np.random.normal(0.0003, 0.015, days)
-    prices = [base_price]
-    for r in returns:
-        prices.append(prices[-1] * (1 + r))
-    idx = pd.date_range(end=datetime.now(), periods=days + 1, freq="D")
-    return pd.Series(prices, index=idx)
+    """Mock 가격 히스토리 (yfinance 없을 때) — 합성 시장 시뮬레이터 경로 (같은 날 같은 종목은 동일)"""
+    from app.engines.synthetic_market import synthetic_market
+    return synthetic_market.history(symbol, days)
 
 
 def _mock_current_price(symbol: str) -> float:
@@ -75,3 +75,19 @@ class QuantEngine:
             "rsi_signal": round(rsi_signal, 3),
             "momentum_signal": round(momentum_signal, 3),
         }
+
+    async def generate_signals_async(self, prices: pd.Series, symbol: str) -> dict:
+        """generate_signals를 CPU 워커 풀에서 실행 (풀 비활성 시 인라인)"""
+        from app.core.workers import run_cpu_with_array
+        return await run_cpu_with_array(_generate_signals_worker, prices.to_numpy(dtype=float), symbol)
+
+
+def _generate_signals_worker(values, symbol: str) -> dict:
+    """워커 프로세스 진입점 — 가격 배열(또는 SharedArray)로 시그널 계산"""
+    from app.core.workers import load_array
+    shm, arr = load_array(values)
+    try:
+        return QuantEngine().generate_signals(pd.Series(arr, copy=False), symbol)
+    finally:
+        if shm is not None:
+            shm.close()
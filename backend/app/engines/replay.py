@@ -0,0 +1,262 @@
+"""
+Replay Harness: 기록된/합성 바 데이터로 run_all_pm_cycles + record_nav를 가상 시계로 가속 재생
+
+- VirtualClock: 바 타임스탬프를 한 칸씩 전진 (실제 대기 없음)
+- BarReplaySource: market_data 가격 소스 훅 — 가상 시각까지의 바만 노출 (look-ahead 없음)
+- StandInLLM: 퀀트 종합 점수 기반 결정 (API 호출 없음), PaperAdapter 강제
+- 전역 random 시드 고정 → 같은 바 + 같은 시드 = 같은 결과 (전략 평가 재현)
+- 처리량(ticks/sec) 리포트 — 5분봉 한 달(≈8,600틱) 재생 벤치마크
+
+사용: python -m app.engines.replay --days 30 --interval-minutes 5
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKBACK_BARS = 390   # 시그널 계산에 넘길 최대 바 수 (틱당 비용 상한)
+WARMUP_BARS = 30              # 첫 틱 전에 필요한 바 수 (signal_matrix.MIN_HISTORY 이상)
+
+
+class VirtualClock:
+    def __init__(self, start: datetime):
+        self.now = start
+
+    def set(self, now: datetime) -> None:
+        self.now = now
+
+
+class BarReplaySource:
+    """bars: index = 타임스탬프(오름차순), columns = 종목 — 가상 시각 이하의 바만 반환"""
+
+    def __init__(self, bars: pd.DataFrame, clock: VirtualClock, lookback_bars: int = DEFAULT_LOOKBACK_BARS):
+        self.bars = bars
+        self.clock = clock
+        self.lookback_bars = lookback_bars
+        self._times = bars.index.values
+        self._columns = {sym: bars[sym].to_numpy(dtype=float) for sym in bars.columns}
+
+    def _position(self) -> int:
+        return int(np.searchsorted(self._times, np.datetime64(self.clock.now), side="right")) - 1
+
+    def history(self, symbol: str, days: int) -> Optional[pd.Series]:
+        values = self._columns.get(symbol)
+        end = self._position()
+        if values is None or end < 0:
+            return None
+        start = int(np.searchsorted(self._times, np.datetime64(self.clock.now - timedelta(days=days)), side="left"))
+        start = max(start, end + 1 - self.lookback_bars)
+        return pd.Series(values[start:end + 1], index=self.bars.index[start:end + 1])
+
+    def current(self, symbol: str) -> float:
+        values = self._columns.get(symbol)
+        end = self._position()
+        if values is None or end < 0:
+            return 0.0
+        return float(values[end])
+
+
+class StandInLLM:
+    """LLM 대역: 퀀트 종합 점수로 결정 (결정적, 네트워크 없음)"""
+
+    def __init__(self, threshold: float = 0.2, latency: float = 0.0):
+        self.threshold = threshold
+        self.latency = latency
+        self.calls = 0
+
+    async def make_decision(
+        self, pm_id: str, symbol: str, quant_signals: dict, market_context: dict, llm_provider: str = "claude",
+        fallback=None,
+    ) -> dict:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._decide(quant_signals, llm_provider)
+
+    async def make_batch_decision(
+        self, pm_id: str, quant_signals: dict[str, dict], market_context: dict, llm_provider: str = "claude",
+        current_prices: dict[str, float] | None = None, fallback=None,
+    ) -> dict[str, dict]:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return {sym: self._decide(signals, llm_provider) for sym, signals in quant_signals.items()}
+
+    def _decide(self, quant_signals: dict, llm_provider: str) -> dict:
+        score = float(quant_signals.get("composite_score", 0.0))
+        if score > self.threshold:
+            action = "BUY"
+        elif score < -self.threshold:
+            action = "SELL"
+        else:
+            action = "HOLD"
+        return {
+            "action": action,
+            "conviction": round(min(abs(score) + 0.3, 1.0), 3),
+            "reasoning": f"stand-in ({llm_provider}): composite {score:+.2f}",
+            "position_size": 0.03,
+        }
+
+
+@dataclass
+class ReplayReport:
+    ticks: int
+    elapsed_s: float
+    trades: int
+    start_nav: float
+    end_nav: float
+    nav: list[tuple[datetime, float]] = field(default_factory=list)
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.ticks / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def return_pct(self) -> float:
+        return (self.end_nav - self.start_nav) / self.start_nav * 100 if self.start_nav else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "ticks": self.ticks,
+            "elapsed_s": round(self.elapsed_s, 2),
+            "ticks_per_sec": round(self.ticks_per_sec, 1),
+            "trades": self.trades,
+            "start_nav": round(self.start_nav, 2),
+            "end_nav": round(self.end_nav, 2),
+            "return_pct": round(self.return_pct, 4),
+        }
+
+
+def _memory_session_factory() -> sessionmaker:
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    from app.db.base import Base
+    from app.models import nav_history, pm, position, scheduler_lease, signal, social_mention, trade, trend_snapshot  # noqa: F401
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class ReplayHarness:
+    def __init__(
+        self,
+        bars: pd.DataFrame,
+        session_factory: sessionmaker | None = None,
+        *,
+        seed: int = 42,
+        lookback_bars: int = DEFAULT_LOOKBACK_BARS,
+        include_crypto: bool = True,
+        llm: StandInLLM | None = None,
+    ):
+        if len(bars) <= WARMUP_BARS:
+            raise ValueError(f"Need more than {WARMUP_BARS} bars to replay")
+        self.bars = bars.sort_index()
+        self.session_factory = session_factory or _memory_session_factory()
+        self.seed = seed
+        self.include_crypto = include_crypto
+        self.llm = llm or StandInLLM()
+        self.clock = VirtualClock(self.bars.index[WARMUP_BARS - 1].to_pydatetime())
+        self.source = BarReplaySource(self.bars, self.clock, lookback_bars=lookback_bars)
+
+    @classmethod
+    def synthetic(
+        cls, days: int = 30, interval: timedelta = timedelta(minutes=5), *, seed: int = 42, **kwargs
+    ) -> "ReplayHarness":
+        """합성 시장 바 (PM 관심 종목 전체, 고정 시드 → 실행마다 동일)"""
+        from app.engines.market_data import PM_WATCHLISTS
+        from app.engines.synthetic_market import SyntheticMarket
+
+        universe = sorted({s for symbols in PM_WATCHLISTS.values() for s in symbols})
+        periods = int(timedelta(days=days) / interval) + WARMUP_BARS
+        frame = SyntheticMarket(seed=seed).frame(universe, periods, interval, day=1)
+        return cls(frame, seed=seed, **kwargs)
+
+    @classmethod
+    def from_csv(cls, path: str, **kwargs) -> "ReplayHarness":
+        """기록된 바: 첫 열 = 타임스탬프, 나머지 열 = 종목별 종가"""
+        return cls(pd.read_csv(path, index_col=0, parse_dates=True), **kwargs)
+
+    async def run(self, ticks: int | None = None) -> ReplayReport:
+        """가상 시계를 바 단위로 전진하며 틱 실행 (ticks: 최대 틱 수, 없으면 전체)"""
+        import app.engines.broker as broker_mod
+        import app.engines.trading_cycle as cycle_mod
+        from app.db.seed import seed_pms
+        from app.engines.market_data import set_price_source
+        from app.models.trade import Trade
+
+        timestamps = self.bars.index[WARMUP_BARS - 1:]
+        if ticks is not None:
+            timestamps = timestamps[:ticks + 1]
+
+        db: Session = self.session_factory()
+        random.seed(self.seed)
+        previous_source = set_price_source(self.source)
+        previous_llm = cycle_mod.llm_engine
+        previous_broker = broker_mod.get_broker_for_pm
+        cycle_mod.llm_engine = self.llm
+        broker_mod.get_broker_for_pm = lambda broker_type: broker_mod.PaperAdapter()
+        cycle_mod.signal_matrix.entries.clear()
+        try:
+            seed_pms(db)
+            self.clock.set(timestamps[0].to_pydatetime())
+            nav = [(self.clock.now, cycle_mod.record_nav(db, recorded_at=self.clock.now)["nav"])]
+            trades_before = db.query(Trade).count()
+
+            started = time.perf_counter()
+            for ts in timestamps[1:]:
+                self.clock.set(ts.to_pydatetime())
+                await cycle_mod.run_all_pm_cycles(db, exclude_crypto=not self.include_crypto)
+                nav.append((self.clock.now, cycle_mod.record_nav(db, recorded_at=self.clock.now)["nav"]))
+            elapsed = time.perf_counter() - started
+
+            return ReplayReport(
+                ticks=len(timestamps) - 1,
+                elapsed_s=elapsed,
+                trades=db.query(Trade).count() - trades_before,
+                start_nav=nav[0][1],
+                end_nav=nav[-1][1],
+                nav=nav,
+            )
+        finally:
+            set_price_source(previous_source)
+            cycle_mod.llm_engine = previous_llm
+            broker_mod.get_broker_for_pm = previous_broker
+            cycle_mod.signal_matrix.entries.clear()
+            db.close()
+
+
+def main() -> None:  # pragma: no cover
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Replay trading cycles on synthetic or recorded bars")
+    parser.add_argument("--csv", help="recorded bars CSV (timestamp index, one close column per symbol)")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--interval-minutes", type=int, default=5)
+    parser.add_argument("--ticks", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.csv:
+        harness = ReplayHarness.from_csv(args.csv, seed=args.seed)
+    else:
+        harness = ReplayHarness.synthetic(args.days, timedelta(minutes=args.interval_minutes), seed=args.seed)
+    report = asyncio.run(harness.run(ticks=args.ticks))
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -17,16 +17,32 @@ from app.models.trade import Trade
 logger = logging.getLogger(__name__)
 
 
+def _trade_pnl(reasoning: str) -> float | None:
+    """거래 사유 문자열의 "P&L: $+12.34" → 12.34 (없거나 파싱 실패 시 None)"""
+    if "P&L:" not in reasoning:
+        return None
+    try:
+        pnl_str = reasoning.split("P&L:")[1].strip().rstrip(")")
+        return float(pnl_str.split(",")[0].replace("$", "").replace("+", ""))
+    except (ValueError, IndexError):
+        return None
+
+
 def check_risk(
     pm: PM,
     action: str,
     trade_amount: float,
     db: Session,
+    staged_trades: list[dict] | None = None,
 ) -> tuple[bool, str]:
     """
     거래 전 리스크 체크.
+    staged_trades: 같은 틱에서 이미 체결됐지만 아직 커밋 전인 거래 (오래된 순, action/reasoning)
+    — 배치 모드에서 한 틱에 여러 주문이 나가도 일일 손실/연속 손실 한도에 반영
     Returns (allowed: bool, reason: str)
     """
+    staged_sells = [t for t in staged_trades or [] if t.get("action") == "SELL"]
+
     # 1. 단일 주문 금액 한도 (크립토 소액 계좌는 95%까지 허용)
     is_crypto = getattr(pm, "broker_type", "paper") == "bybit"
     limit_pct = 0.95 if is_crypto else settings.position_limit_pct
@@ -34,7 +50,7 @@ def check_risk(
     if trade_amount > max_trade:
         return False, f"Trade amount ${trade_amount:.2f} exceeds limit ${max_trade:.2f}"
 
-    # 2. 일일 손실 한도 (오늘 실현 손실 합산)
+    # 2. 일일 손실 한도 (오늘 실현 손실 합산 + 틱 내 미커밋 매도)
     today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
     today_trades = (
         db.query(Trade)
@@ -46,14 +62,8 @@ def check_risk(
         .all()
     )
 
-    daily_pnl = 0.0
-    for t in today_trades:
-        if "P&L:" in t.reasoning:
-            try:
-                pnl_str = t.reasoning.split("P&L:")[1].strip().rstrip(")")
-                daily_pnl += float(pnl_str.replace("$", "").replace("+", ""))
-            except (ValueError, IndexError):
-                pass
+    reasonings = [t.reasoning for t in today_trades] + [t.get("reasoning", "") for t in staged_sells]
+    daily_pnl = sum(pnl for pnl in map(_trade_pnl, reasonings) if pnl is not None)
 
     max_daily_loss = pm.initial_capital * settings.max_daily_loss_pct
     if daily_pnl < -max_daily_loss:
@@ -61,7 +71,7 @@ def check_risk(
         logger.warning("RISK HALT %s: %s", pm.id, msg)
         return False, msg
 
-    # 3. 연속 손실 횟수
+    # 3. 연속 손실 횟수 (최신순: 틱 내 미커밋 매도 → DB 매도)
     recent_sells = (
         db.query(Trade)
         .filter(Trade.pm_id == pm.id, Trade.action == "SELL")
@@ -69,24 +79,11 @@ def check_risk(
         .limit(settings.max_consecutive_losses)
         .all()
     )
+    recent = [t.get("reasoning", "") for t in reversed(staged_sells)] + [t.reasoning for t in recent_sells]
+    recent = recent[:settings.max_consecutive_losses]
 
-    if len(recent_sells) >= settings.max_consecutive_losses:
-        all_losses = True
-        for t in recent_sells:
-            if "P&L:" in t.reasoning:
-                try:
-                    pnl_str = t.reasoning.split("P&L:")[1].strip().rstrip(")")
-                    pnl_val = float(pnl_str.replace("$", "").replace("+", ""))
-                    if pnl_val >= 0:
-                        all_losses = False
-                        break
-                except (ValueError, IndexError):
-                    all_losses = False
-                    break
-            else:
-                all_losses = False
-                break
-
+    if len(recent) >= settings.max_consecutive_losses:
+        all_losses = all((pnl := _trade_pnl(r)) is not None and pnl < 0 for r in recent)
         if all_losses:
             msg = f"{settings.max_consecutive_losses} consecutive losses — trading paused"
             logger.warning("RISK PAUSE %s: %s", pm.id, msg)
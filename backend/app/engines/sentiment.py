@@ -0,0 +1,110 @@
+"""
+감성 스코어러: 가중치 렉시콘 기반 헤드라인 감성 분석
+
+- 렉시콘 전체를 단어 경계(\\b) 정규식 하나로 컴파일 → "buyback"의 "buy", "belong"의 "long" 오탐 제거
+- 여러 단어 구문 지원 (예: "short squeeze"는 short(-) + squeeze(+)가 아닌 하나의 강세 표현)
+- 배치: 헤드라인을 이어붙여 finditer 한 번 → bisect로 헤드라인 매핑 → numpy bincount로 집계
+헤드라인 점수 = (강세 가중합 - 약세 가중합) / (강세 + 약세), 매칭 없으면 0.0
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+import numpy as np
+
+# 양수 = 강세, 음수 = 약세
+DEFAULT_LEXICON: dict[str, float] = {
+    # 강세
+    "moon": 1.0, "buy": 1.0, "long": 1.0, "bullish": 1.0, "squeeze": 1.0,
+    "gamma": 1.0, "yolo": 1.0, "calls": 1.0,
+    "short squeeze": 1.5, "all time high": 1.0, "upgrade": 1.0, "upgraded": 1.0,
+    "beats": 0.8, "surge": 0.8, "surges": 0.8, "rally": 0.8, "rallies": 0.8,
+    # 약세
+    "crash": -1.0, "sell": -1.0, "short": -1.0, "bearish": -1.0, "puts": -1.0,
+    "dump": -1.0, "bubble": -1.0, "overvalued": -1.0,
+    "downgrade": -1.0, "downgraded": -1.0, "misses": -0.8, "plunge": -0.8,
+    "plunges": -0.8, "lawsuit": -0.8, "bankruptcy": -1.5,
+}
+
+
+@dataclass
+class BatchSentiment:
+    scores: list[float]     # 헤드라인별 점수 (-1.0 ~ 1.0)
+    hits: list[int]         # 헤드라인별 매칭 수
+    aggregate: float        # 헤드라인 점수 평균
+
+    def to_dict(self) -> dict:
+        return {"scores": self.scores, "hits": self.hits, "aggregate": self.aggregate}
+
+
+def _normalize(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+class SentimentScorer:
+    def __init__(self, lexicon: Mapping[str, float] = DEFAULT_LEXICON):
+        self.lexicon = {_normalize(k): float(w) for k, w in lexicon.items() if k.strip()}
+        # 긴 구문 우선 매칭, 구문 내부 공백은 줄바꿈을 넘지 않도록 [ \t]+
+        alternation = "|".join(
+            r"[ \t]+".join(re.escape(word) for word in term.split())
+            for term in sorted(self.lexicon, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE) if alternation else None
+
+    def extend(self, terms: Mapping[str, float]) -> "SentimentScorer":
+        """렉시콘을 확장/덮어쓴 새 스코어러"""
+        return SentimentScorer({**self.lexicon, **terms})
+
+    def terms(self, bullish: bool = True) -> list[str]:
+        return [k for k, w in self.lexicon.items() if (w > 0) == bullish and w != 0]
+
+    def score(self, text: str) -> float:
+        return self.score_batch([text]).scores[0]
+
+    def score_batch(self, texts: Iterable[str]) -> BatchSentiment:
+        texts = [(t or "").replace("\n", " ") for t in texts]
+        n = len(texts)
+        if n == 0:
+            return BatchSentiment(scores=[], hits=[], aggregate=0.0)
+
+        starts = []
+        offset = 0
+        for t in texts:
+            starts.append(offset)
+            offset += len(t) + 1
+        joined = "\n".join(texts)
+
+        idx: list[int] = []
+        weights: list[float] = []
+        if self._pattern is not None:
+            for m in self._pattern.finditer(joined):
+                idx.append(bisect_right(starts, m.start()) - 1)
+                weights.append(self.lexicon[_normalize(m.group(0))])
+
+        if idx:
+            codes = np.array(idx)
+            w = np.array(weights)
+            bull = np.bincount(codes, weights=np.clip(w, 0, None), minlength=n)
+            bear = np.bincount(codes, weights=np.clip(-w, 0, None), minlength=n)
+            hits = np.bincount(codes, minlength=n)
+        else:
+            bull = bear = np.zeros(n)
+            hits = np.zeros(n, dtype=int)
+
+        total = bull + bear
+        scores = np.divide(bull - bear, total, out=np.zeros(n), where=total > 0)
+        return BatchSentiment(
+            scores=[float(s) for s in scores],
+            hits=[int(h) for h in hits],
+            aggregate=float(scores.mean()),
+        )
+
+
+default_scorer = SentimentScorer()
+
+
+def score_headlines(texts: Iterable[str]) -> BatchSentiment:
+    """기본 렉시콘으로 헤드라인 배치 점수"""
+    return default_scorer.score_batch(texts)
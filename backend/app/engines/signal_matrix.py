@@ -0,0 +1,104 @@
+"""
+Signal Matrix: 틱마다 전체 유니버스(PM 관심 종목 합집합) 시그널을 한 번만 계산해 메모리에 보관
+여러 PM이 같은 종목을 공유해도 가격 히스토리 조회 / 퀀트 계산은 종목당 1회 → O(unique symbols)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+import pandas as pd
+
+from app.core.metrics import metrics
+from app.engines import market_data
+from app.engines.market_data import PM_WATCHLISTS, get_market_context
+from app.engines.quant import QuantEngine
+
+logger = logging.getLogger(__name__)
+
+FETCH_CONCURRENCY = 8  # 동시 가격 조회 수 (yfinance 스레드)
+MIN_HISTORY = 20       # 시그널 계산 최소 데이터 수
+
+
+@dataclass
+class SymbolSignals:
+    symbol: str
+    prices: pd.Series
+    signals: dict
+    current_price: float
+
+
+@dataclass
+class SignalMatrix:
+    quant_engine: QuantEngine = field(default_factory=QuantEngine)
+    entries: dict[str, SymbolSignals] = field(default_factory=dict)
+    market_context: dict = field(default_factory=dict)
+    refreshed_at: Optional[datetime] = None
+
+    @staticmethod
+    def universe(pm_ids: Iterable[str]) -> list[str]:
+        """PM들의 관심 종목 합집합"""
+        symbols: set[str] = set()
+        for pm_id in pm_ids:
+            symbols.update(PM_WATCHLISTS.get(pm_id, ["SPY"]))
+        return sorted(symbols)
+
+    async def refresh(
+        self,
+        symbols: Iterable[str],
+        days: int = 60,
+        history_fn: Optional[Callable[[str, int], Optional[pd.Series]]] = None,
+        price_fn: Optional[Callable[[str], float]] = None,
+    ) -> None:
+        """
+        주어진 종목들의 히스토리/현재가/시그널을 갱신 (다른 종목 항목은 유지)
+        history_fn/price_fn 기본값은 호출 시점에 market_data에서 조회 (패치/교체된 가격 소스 반영)
+        """
+        history_fn = history_fn or market_data.get_price_history
+        price_fn = price_fn or market_data.get_current_price
+        unique = sorted(set(symbols))
+        sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def _fetch(sym: str):
+            async with sem:
+                try:
+                    prices = await asyncio.to_thread(history_fn, sym, days)
+                    current = await asyncio.to_thread(price_fn, sym)
+                except Exception as e:
+                    # 종목 하나의 실패가 gather 전체를 깨지 않도록 종목 단위로 격리
+                    logger.warning("Signal matrix fetch error for %s: %s", sym, e)
+                    return sym, None, 0.0
+            return sym, prices, current
+
+        with metrics.stage("price_fetch"):
+            fetched = await asyncio.gather(*[_fetch(s) for s in unique])
+
+        with metrics.stage("signal_generation"):
+            for sym, prices, current in fetched:
+                # 이전 틱 값이 남아 stale 시그널로 거래하지 않도록 실패 종목은 제거
+                if prices is None or len(prices) < MIN_HISTORY:
+                    self.entries.pop(sym, None)
+                    continue
+                signals = await self.quant_engine.generate_signals_async(prices, sym)
+                self.entries[sym] = SymbolSignals(
+                    symbol=sym,
+                    prices=prices,
+                    signals=signals,
+                    current_price=current if current and current > 0 else float(prices.iloc[-1]),
+                )
+
+        self.market_context = await asyncio.to_thread(get_market_context)
+        self.refreshed_at = datetime.now()
+        logger.info("Signal matrix refreshed — %d/%d symbols", len(self.entries), len(unique))
+
+    def get(self, symbol: str) -> Optional[SymbolSignals]:
+        return self.entries.get(symbol)
+
+    def to_dict(self) -> dict:
+        """API 노출용 요약 (symbol → 시그널)"""
+        return {
+            "refreshed_at": self.refreshed_at.isoformat() if self.refreshed_at else None,
+            "signals": {sym: e.signals for sym, e in sorted(self.entries.items())},
+        }
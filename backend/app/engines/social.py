@@ -2,6 +2,7 @@
 소셜 시그널 엔진: Yahoo Finance 뉴스, Fear & Greed Index, Google Trends 기반 티핑포인트 감지
 """
 
+import asyncio
 import logging
 import numpy as np
 import random
@@ -10,18 +11,18 @@ from datetime import datetime
 
 import httpx
 
-# 선택적 의존성
-try:
-    import yfinance as yf  # pragma: no cover
-    YFINANCE_AVAILABLE = True  # pragma: no cover
-except ImportError:
-    YFINANCE_AVAILABLE = False
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.lazy import LazyImport, module_available
+from app.engines.sentiment import default_scorer
+from app.engines.trends import TrendsCollector
 
-try:
-    from pytrends.request import TrendReq  # pragma: no cover
-    PYTRENDS_AVAILABLE = True  # pragma: no cover
-except ImportError:
-    PYTRENDS_AVAILABLE = False
+# 선택적 의존성 (첫 사용 시 import)
+YFINANCE_AVAILABLE = module_available("yfinance")
+yf = LazyImport("yfinance")
+
+PYTRENDS_AVAILABLE = module_available("pytrends")
+TrendReq = LazyImport("pytrends.request", "TrendReq")
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +37,31 @@ class SocialSignal:
     sources: list[str]
 
 
+FEAR_GREED_URL = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
+DEFAULT_VOXPOPULI_SYMBOLS = ["GME", "AMC", "TSLA", "NVDA", "SPY", "BTC-USD"]
+
+
+def _open_db():
+    from app.db.base import get_db
+    return next(get_db())
+
+
 class SocialEngine:
     TIPPING_THRESHOLD = 3.0
-    BULLISH_KEYWORDS = ["moon", "buy", "long", "bullish", "squeeze", "gamma", "yolo", "calls"]
-    BEARISH_KEYWORDS = ["crash", "sell", "short", "bearish", "puts", "dump", "bubble", "overvalued"]
+    BULLISH_KEYWORDS = default_scorer.terms(bullish=True)
+    BEARISH_KEYWORDS = default_scorer.terms(bullish=False)
+
+    def __init__(self):
+        self.scorer = default_scorer
+        # Google Trends: 세션 1개 재사용, 키워드 4개 + 앵커 배치, 백그라운드 갱신 (결과는 DB로 워커 간 공유)
+        self.trends = TrendsCollector(
+            session_factory=lambda: TrendReq(hl="en-US", tz=360),
+            fallback=self._mock_trends,
+            db_factory=_open_db,
+        )
+        # 소스별 TTL 캐시 (stale-while-revalidate) — 비동기 경로(a*)에서만 사용
+        self._news_cache = TTLCache(settings.social_news_ttl, settings.social_stale_ttl)
+        self._fear_greed_cache = TTLCache(settings.social_fear_greed_ttl, settings.social_stale_ttl)
 
     def calculate_zscore(self, history: list[float]) -> float:
         if len(history) < 3:
@@ -57,8 +79,10 @@ class SocialEngine:
         mention_history: list[float],
         sentiment: float,  # -1.0 ~ 1.0
         sources: list[str] | None = None,
+        zscore: float | None = None,  # 누적 통계로 미리 계산한 z-score (있으면 history 무시)
     ) -> dict:
-        zscore = self.calculate_zscore(mention_history)
+        if zscore is None:
+            zscore = self.calculate_zscore(mention_history)
         is_tipping = zscore >= self.TIPPING_THRESHOLD
 
         if sentiment > 0.3:
@@ -82,14 +106,8 @@ class SocialEngine:
         }
 
     def _simple_sentiment(self, text: str) -> float:
-        """단순 키워드 기반 감성 분석"""
-        text_lower = text.lower()
-        bull_score = sum(1 for w in self.BULLISH_KEYWORDS if w in text_lower)
-        bear_score = sum(1 for w in self.BEARISH_KEYWORDS if w in text_lower)
-        total = bull_score + bear_score
-        if total == 0:
-            return 0.0
-        return (bull_score - bear_score) / total
+        """가중치 렉시콘 기반 감성 분석 (단어 경계 매칭)"""
+        return self.scorer.score(text)
 
     def fetch_yahoo_news(self, symbol: str) -> dict:
         """Yahoo Finance 뉴스 헤드라인 기반 감성 분석 (API 키 불필요)"""
@@ -103,12 +121,8 @@ class SocialEngine:
                 return self._mock_yahoo_news(symbol)
 
             mention_count = len(news)
-            sentiment_sum = 0.0
-            for item in news:
-                title = item.get("title", "")
-                sentiment_sum += self._simple_sentiment(title)
-
-            avg_sentiment = sentiment_sum / mention_count if mention_count > 0 else 0.0
+            # 헤드라인 전체를 한 번에 스코어링
+            avg_sentiment = self.scorer.score_batch(item.get("title", "") for item in news).aggregate
             return {
                 "symbol": symbol,
                 "mention_count": mention_count,
@@ -136,26 +150,38 @@ class SocialEngine:
     def fetch_fear_greed_index(self) -> dict:
         """CNN Fear & Greed Index (API 키 불필요)"""
         try:
-            resp = httpx.get(
-                "https://production.dataviz.cnn.io/index/fearandgreed/graphdata",
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=10,
-            )
+            resp = httpx.get(FEAR_GREED_URL, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
             if resp.status_code == 200:
-                data = resp.json()
-                fgi = data.get("fear_and_greed", {})
-                score = fgi.get("score", 50)
-                rating = fgi.get("rating", "Neutral")
-                return {
-                    "score": round(score, 1),
-                    "rating": rating,
-                    "source": "cnn_fear_greed",
-                    "timestamp": datetime.now().isoformat(),
-                }
+                return self._parse_fear_greed(resp.json())
         except (httpx.HTTPError, KeyError, ValueError, Exception) as e:
             logger.warning("Fear & Greed Index error: %s", e)
+        return self._mock_fear_greed()
 
-        # Fallback
+    async def afetch_fear_greed_index(self, client: httpx.AsyncClient | None = None) -> dict:
+        """CNN Fear & Greed Index — 비동기 클라이언트 버전"""
+        try:
+            if client is None:
+                async with httpx.AsyncClient(timeout=10) as own_client:
+                    resp = await own_client.get(FEAR_GREED_URL, headers={"User-Agent": "Mozilla/5.0"})
+            else:
+                resp = await client.get(FEAR_GREED_URL, headers={"User-Agent": "Mozilla/5.0"})
+            if resp.status_code == 200:
+                return self._parse_fear_greed(resp.json())
+        except (httpx.HTTPError, KeyError, ValueError, Exception) as e:
+            logger.warning("Fear & Greed Index error: %s", e)
+        return self._mock_fear_greed()
+
+    def _parse_fear_greed(self, data: dict) -> dict:
+        fgi = data.get("fear_and_greed", {})
+        return {
+            "score": round(fgi.get("score", 50), 1),
+            "rating": fgi.get("rating", "Neutral"),
+            "source": "cnn_fear_greed",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    def _mock_fear_greed(self) -> dict:
+        """Fear & Greed 조회 실패 시 Fallback"""
         return {
             "score": 50.0,
             "rating": "Neutral",
@@ -163,34 +189,48 @@ class SocialEngine:
             "timestamp": datetime.now().isoformat(),
         }
 
+    async def cached_fear_greed_index(self) -> dict:
+        """TTL 캐시된 Fear & Greed Index (만료 직후엔 이전 값 반환 + 백그라운드 갱신)"""
+        return await self._fear_greed_cache.get("fear_greed", self.afetch_fear_greed_index)
+
+    async def cached_yahoo_news(self, symbol: str) -> dict:
+        """TTL 캐시된 뉴스 감성 — yfinance는 동기 API라 스레드에서 실행"""
+        return await self._news_cache.get(
+            symbol, lambda: asyncio.to_thread(self.fetch_yahoo_news, symbol)
+        )
+
     def fetch_google_trends(self, keyword: str, timeframe: str = "now 7-d") -> dict:
-        """Google Trends 검색량 데이터"""
+        """Google Trends 검색량 데이터 (공유 세션 + 앵커 배치 수집기 경유, 블로킹)"""
         if not PYTRENDS_AVAILABLE:
             return self._mock_trends(keyword)
+        return self.trends.fetch([keyword], timeframe).get(keyword) or self._mock_trends(keyword)
+
+    def cached_google_trends(self, keyword: str, timeframe: str = "now 7-d", stored: dict | None = None) -> dict:
+        """
+        요청 경로용: 백그라운드 수집 결과만 읽음 (없으면 Mock) — 네트워크 호출 없음
+        stored: stored_google_trends() 결과 — 프로세스 캐시와 DB 중 더 최근 수집을 사용
+        """
+        candidates = [r for r in (self.trends.cached(keyword, timeframe), (stored or {}).get(keyword)) if r]
+        if not candidates:
+            return self._mock_trends(keyword)
+        return max(candidates, key=lambda r: r.get("timestamp", ""))
 
-        try:
-            pytrends = TrendReq(hl="en-US", tz=360)
-            pytrends.build_payload([keyword], cat=0, timeframe=timeframe, geo="US")
-            data = pytrends.interest_over_time()
-            if data.empty:
-                return self._mock_trends(keyword)
-
-            values = data[keyword].tolist()
-            current = values[-1] if values else 50
-            avg_prev = np.mean(values[:-1]) if len(values) > 1 else current
-            trend = (current - avg_prev) / max(avg_prev, 1) * 100
+    def stored_google_trends(self, db, keywords: list[str], timeframe: str = "now 7-d") -> dict[str, dict]:
+        """리더 워커가 DB에 기록한 Trends 수집 결과 (DB 오류 시 빈 dict → 프로세스 캐시/Mock)"""
+        from sqlalchemy.exc import SQLAlchemyError
 
-            return {
-                "keyword": keyword,
-                "current_interest": int(current),
-                "avg_interest": round(float(avg_prev), 1),
-                "trend_pct": round(trend, 2),
-                "is_trending": trend > 50,
-                "source": "google_trends",
-                "timestamp": datetime.now().isoformat(),
-            }
-        except (ConnectionError, OSError, ValueError) as e:
-            return {**self._mock_trends(keyword), "error": str(e)}
+        try:
+            return self.trends.snapshots(db, keywords, timeframe)
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning("Google Trends snapshot read error: %s", e)
+            return {}
+
+    def start_trends_refresh(self, keywords: list[str] | None = None) -> bool:
+        """Google Trends 백그라운드 갱신 시작 (pytrends 없거나 주기 0이면 시작 안 함)"""
+        if not PYTRENDS_AVAILABLE or settings.trends_refresh_interval <= 0:
+            return False
+        return self.trends.start(keywords or DEFAULT_VOXPOPULI_SYMBOLS)
 
     def _mock_trends(self, keyword: str) -> dict:
         """Google Trends 없을 때 Mock 데이터"""
@@ -208,30 +248,84 @@ class SocialEngine:
             "timestamp": datetime.now().isoformat(),
         }
 
-    def get_voxpopuli_signals(self, symbols: list[str] | None = None) -> list[dict]:
-        """Vox Populi PM을 위한 소셜 시그널 종합"""
-        target_symbols = symbols or ["GME", "AMC", "TSLA", "NVDA", "SPY", "BTC-USD"]
-        results = []
+    def get_voxpopuli_signals(self, symbols: list[str] | None = None, db=None) -> list[dict]:
+        """
+        Vox Populi PM을 위한 소셜 시그널 종합
+        db: 있으면 언급량을 시계열에 기록해 z-score 계산 + 리더가 기록한 Trends 스냅샷 사용
+        """
+        target_symbols = symbols or DEFAULT_VOXPOPULI_SYMBOLS
 
         # Fear & Greed Index (전체 시장 심리)
         fgi = self.fetch_fear_greed_index()
+        # Yahoo Finance 뉴스 감성 분석
+        news = {symbol: self.fetch_yahoo_news(symbol) for symbol in target_symbols}
+        if db is None:
+            return self._combine_signals(target_symbols, fgi, news)
+        zscores = self.record_mentions(db, news.values())
+        trends = self.stored_google_trends(db, target_symbols)
+        return self._combine_signals(target_symbols, fgi, news, zscores, trends)
+
+    async def aget_voxpopuli_signals(self, symbols: list[str] | None = None, db=None) -> list[dict]:
+        """
+        get_voxpopuli_signals 비동기 버전 — 모든 소스를 동시에 조회 (소스별 TTL 캐시)
+        콜드 호출도 심볼 수와 무관하게 왕복 1회 지연
+        """
+        target_symbols = symbols or DEFAULT_VOXPOPULI_SYMBOLS
+        fgi, *news_list = await asyncio.gather(
+            self.cached_fear_greed_index(),
+            *(self.cached_yahoo_news(symbol) for symbol in target_symbols),
+        )
+        news = dict(zip(target_symbols, news_list))
+        if db is None:
+            return self._combine_signals(target_symbols, fgi, news)
+        zscores = self.record_mentions(db, news.values())
+        trends = self.stored_google_trends(db, target_symbols)
+        return self._combine_signals(target_symbols, fgi, news, zscores, trends)
+
+    def record_mentions(self, db, observations) -> dict[str, float] | None:
+        """언급량 시계열 기록 + 누적 z-score (DB 오류 시 None → 히스토리 시뮬레이션으로 대체)"""
+        from sqlalchemy.exc import SQLAlchemyError
+        from app.services.social_history import record_mentions
 
+        try:
+            zscores = record_mentions(db, observations)
+            db.commit()
+            return zscores
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning("Social history record error: %s", e)
+            return None
+
+    def _combine_signals(
+        self,
+        target_symbols: list[str],
+        fgi: dict,
+        news: dict[str, dict],
+        zscores: dict[str, float] | None = None,
+        trends: dict[str, dict] | None = None,
+    ) -> list[dict]:
+        results = []
         for symbol in target_symbols:
-            # Yahoo Finance 뉴스 감성 분석
-            news_data = self.fetch_yahoo_news(symbol)
+            news_data = news[symbol]
 
-            # Google Trends (mock 포함)
-            trends_data = self._mock_trends(symbol)
+            # Google Trends (백그라운드 수집 캐시 / 리더가 기록한 DB 스냅샷, 없으면 mock)
+            trends_data = self.cached_google_trends(symbol, stored=trends)
 
-            # 히스토리 시뮬레이션 (실제는 DB에서 가져와야 함)
             base = news_data["mention_count"]
-            history = [base * random.uniform(0.5, 1.5) for _ in range(6)] + [base]
+            if zscores is not None:
+                history = [base]
+                zscore = zscores.get(symbol, 0.0)
+            else:
+                # DB 없이 호출된 경우: 히스토리 시뮬레이션
+                history = [base * random.uniform(0.5, 1.5) for _ in range(6)] + [base]
+                zscore = None
 
             signal = self.evaluate_tipping_point(
                 symbol=symbol,
                 mention_history=history,
                 sentiment=news_data["sentiment"],
                 sources=["yahoo_finance", "google_trends", "fear_greed"],
+                zscore=zscore,
             )
 
             signal["news_mentions"] = news_data["mention_count"]
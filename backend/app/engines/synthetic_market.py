@@ -0,0 +1,170 @@
+"""
+Synthetic Market: 오프라인 시세 시뮬레이터 (yfinance 없을 때 / 부하 테스트 / 백테스트)
+
+- 자산군별 연간 드리프트·변동성 + 점프(Merton jump-diffusion) 파라미터
+- 상관관계는 팩터 모델로 정의: z_i = β_c·M + γ_c·C_c + √(1-β_c²-γ_c²)·ε_i
+  (M: 시장 공통 팩터, C_c: 자산군 팩터, ε_i: 종목 고유 충격)
+  → 같은 자산군 상관 = β²+γ², 다른 자산군 상관 = β_a·β_b (항상 양의 준정부호)
+- numpy Generator + 안정적 시드 (crc32 — PYTHONHASHSEED와 무관)
+  팩터는 (seed, 날짜, 간격), 고유 충격·점프는 (seed, 날짜, 간격, 종목)으로 시드
+  → 종목을 따로 요청해도 함께 요청한 것과 같은 경로 (상관관계 유지)
+- interval로 일간/분봉 해상도 선택, 전체 유니버스를 한 번에 벡터 계산
+"""
+
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.engines.market_data import MOCK_PRICES
+
+YEAR = timedelta(days=365)
+
+
+@dataclass(frozen=True)
+class AssetClass:
+    drift: float                # 연간 기대수익률
+    vol: float                  # 연간 변동성
+    beta: float                 # 시장 팩터 로딩 (-1 ~ 1, 인버스/변동성은 음수)
+    class_loading: float        # 자산군 팩터 로딩
+    jump_rate: float = 0.0      # 연간 점프 횟수 기대값
+    jump_mean: float = 0.0      # 점프 크기 (로그수익률) 평균
+    jump_std: float = 0.0       # 점프 크기 표준편차
+
+    @property
+    def idio_loading(self) -> float:
+        return float(np.sqrt(1.0 - self.beta ** 2 - self.class_loading ** 2))
+
+
+ASSET_CLASSES: dict[str, AssetClass] = {
+    "equity":      AssetClass(0.10, 0.30, 0.70, 0.40, jump_rate=1.0, jump_mean=-0.01, jump_std=0.05),
+    "index_etf":   AssetClass(0.08, 0.17, 0.95, 0.20, jump_rate=0.5, jump_mean=-0.01, jump_std=0.03),
+    "bonds":       AssetClass(0.03, 0.12, -0.20, 0.60),
+    "commodities": AssetClass(0.04, 0.15, 0.10, 0.60),
+    "currencies":  AssetClass(0.01, 0.08, -0.20, 0.60),
+    "crypto":      AssetClass(0.35, 0.70, 0.40, 0.75, jump_rate=12.0, jump_mean=-0.01, jump_std=0.08),
+    "volatility":  AssetClass(-0.50, 0.90, -0.80, 0.50, jump_rate=6.0, jump_mean=0.05, jump_std=0.15),
+    "inverse":     AssetClass(-0.15, 0.45, -0.90, 0.30),
+    "asia":        AssetClass(0.05, 0.22, 0.60, 0.50, jump_rate=1.0, jump_mean=-0.01, jump_std=0.04),
+    "meme":        AssetClass(0.00, 1.00, 0.30, 0.50, jump_rate=24.0, jump_mean=0.02, jump_std=0.25),
+}
+
+SYMBOL_CLASSES: dict[str, str] = {
+    **dict.fromkeys(["AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "COIN", "MSTR"], "equity"),
+    **dict.fromkeys(["SPY", "QQQ", "IWM", "DIA", "VTI"], "index_etf"),
+    "TLT": "bonds", "GLD": "commodities", "UUP": "currencies",
+    **dict.fromkeys(["VIX", "UVXY"], "volatility"),
+    **dict.fromkeys(["SQQQ", "SH"], "inverse"),
+    **dict.fromkeys(["EWJ", "EWY", "FXI", "EWT", "AAXJ"], "asia"),
+    **dict.fromkeys(["GME", "AMC", "BBBY"], "meme"),
+}
+
+
+def _stable_seed(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+class SyntheticMarket:
+    def __init__(
+        self,
+        asset_classes: dict[str, AssetClass] = ASSET_CLASSES,
+        symbol_classes: dict[str, str] = SYMBOL_CLASSES,
+        base_prices: dict[str, float] = MOCK_PRICES,
+        seed: int = 0,
+    ):
+        for name, ac in asset_classes.items():
+            if ac.beta ** 2 + ac.class_loading ** 2 > 1.0:
+                raise ValueError(f"Asset class {name}: beta² + class_loading² must be <= 1")
+        self.asset_classes = asset_classes
+        self.symbol_classes = symbol_classes
+        self.base_prices = base_prices
+        self.seed = seed
+        self._class_names = sorted(asset_classes)
+
+    def asset_class(self, symbol: str) -> str:
+        if symbol in self.symbol_classes:
+            return self.symbol_classes[symbol]
+        return "crypto" if symbol.endswith("-USD") else "equity"
+
+    def simulate(
+        self,
+        symbols: Iterable[str],
+        periods: int,
+        interval: timedelta = timedelta(days=1),
+        day: int | None = None,
+    ) -> np.ndarray:
+        """
+        (periods + 1) × len(symbols) 가격 행렬 — 첫 행은 기준가
+        day: 시드용 날짜 서수 (기본: 오늘 → 같은 날 같은 경로, 날이 바뀌면 새 경로)
+        """
+        symbols = list(symbols)
+        day = date.today().toordinal() if day is None else day
+        step = int(interval.total_seconds())
+        dt = interval / YEAR
+
+        classes = [self.asset_classes[self.asset_class(s)] for s in symbols]
+        class_idx = np.array([self._class_names.index(self.asset_class(s)) for s in symbols], dtype=int)
+        drift = np.array([c.drift for c in classes])
+        vol = np.array([c.vol for c in classes])
+        beta = np.array([c.beta for c in classes])
+        gamma = np.array([c.class_loading for c in classes])
+        idio = np.array([c.idio_loading for c in classes])
+        jump_rate = np.array([c.jump_rate for c in classes])
+        jump_mean = np.array([c.jump_mean for c in classes])
+        jump_std = np.array([c.jump_std for c in classes])
+
+        # 공통 팩터 (시장 1개 + 자산군별 1개)
+        factor_rng = np.random.default_rng([self.seed, day, step])
+        market = factor_rng.standard_normal(periods)
+        class_factors = factor_rng.standard_normal((periods, len(self._class_names)))
+
+        # 종목 고유 충격 + 점프 (종목별 시드)
+        eps = np.empty((periods, len(symbols)))
+        jump_counts = np.empty((periods, len(symbols)))
+        jump_noise = np.empty((periods, len(symbols)))
+        for j, sym in enumerate(symbols):
+            rng = np.random.default_rng([self.seed, day, step, _stable_seed(sym)])
+            eps[:, j] = rng.standard_normal(periods)
+            jump_counts[:, j] = rng.poisson(jump_rate[j] * dt, periods)
+            jump_noise[:, j] = rng.standard_normal(periods)
+
+        z = market[:, None] * beta + class_factors[:, class_idx] * gamma + eps * idio
+        jumps = jump_counts * jump_mean + np.sqrt(jump_counts) * jump_std * jump_noise
+        # 점프 보정: 기대 수익률이 drift가 되도록
+        compensator = jump_rate * (np.exp(jump_mean + 0.5 * jump_std ** 2) - 1)
+        log_returns = (drift - 0.5 * vol ** 2 - compensator) * dt + vol * np.sqrt(dt) * z + jumps
+
+        base = np.array([self.base_prices.get(s, 100.0) for s in symbols])
+        paths = np.empty((periods + 1, len(symbols)))
+        paths[0] = base
+        paths[1:] = base * np.exp(np.cumsum(log_returns, axis=0))
+        return paths
+
+    def _index(self, periods: int, interval: timedelta) -> pd.DatetimeIndex:
+        end = pd.Timestamp(datetime.now()).floor(pd.Timedelta(interval))
+        return pd.date_range(end=end, periods=periods + 1, freq=pd.Timedelta(interval))
+
+    def frame(
+        self, symbols: Iterable[str], periods: int, interval: timedelta = timedelta(days=1), day: int | None = None
+    ) -> pd.DataFrame:
+        """유니버스 전체 가격 DataFrame (열 = 종목)"""
+        symbols = list(symbols)
+        return pd.DataFrame(
+            self.simulate(symbols, periods, interval, day), index=self._index(periods, interval), columns=symbols,
+        )
+
+    def history(
+        self, symbol: str, days: int, interval: timedelta = timedelta(days=1), day: int | None = None
+    ) -> pd.Series:
+        """단일 종목 히스토리 — days 기간을 interval 간격으로 (days / interval + 1 포인트)"""
+        periods = int(timedelta(days=days) / interval)
+        return pd.Series(
+            self.simulate([symbol], periods, interval, day)[:, 0], index=self._index(periods, interval),
+        )
+
+
+synthetic_market = SyntheticMarket(seed=settings.synthetic_market_seed)
@@ -10,15 +10,18 @@ Trading Cycle Engine: 전체 트레이딩 사이클 오케스트레이션
 
 import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 import random
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
+from app.core.metrics import metrics
 from app.engines.quant import QuantEngine
-from app.engines.llm import LLMEngine
+from app.engines.llm import LLMEngine, ProviderUnavailable
+from app.engines.signal_matrix import SignalMatrix
 from app.engines.market_data import (
     get_price_history,
     get_prices_for_pm,
@@ -26,154 +29,332 @@ from app.engines.market_data import (
     PM_WATCHLISTS,
 )
 from app.models.pm import PM
-from app.models.position import Position
-from app.models.trade import Trade
-from app.models.signal import Signal
 from app.models.nav_history import NAVHistory
+from app.services.cycle_writer import CycleWriteBuffer, SessionWriter
+from app.services.revaluation import revalue_pms
 
 logger = logging.getLogger(__name__)
 
 quant_engine = QuantEngine()
 llm_engine = LLMEngine()
+signal_matrix = SignalMatrix(quant_engine=quant_engine)
 
 
-async def run_pm_cycle(pm: PM, db: Session) -> dict:
-    """단일 PM의 트레이딩 사이클 실행"""
+async def run_pm_cycle(
+    pm: PM,
+    db: Session,
+    matrix: SignalMatrix | None = None,
+    *,
+    revalue: bool = True,
+    buffer: CycleWriteBuffer | None = None,
+) -> dict:
+    """
+    단일 PM의 트레이딩 사이클 실행
+    matrix: 틱 단위로 미리 계산된 시그널 매트릭스 (없으면 직접 조회)
+    revalue: False면 체결 후 자본 재평가를 호출자가 틱 끝에 일괄 처리 (revalue_pms)
+    buffer: 틱 쓰기 버퍼 — 있으면 커밋/재평가 없이 스테이징만 (호출자가 flush)
+    """
+    writer = buffer.writer(db, pm.id) if buffer is not None else SessionWriter(db)
+    started = time.perf_counter()
     try:
+        # 배치 모드: 관심 종목 전체를 LLM 1회 호출로 판단
+        if (
+            settings.llm_batch_decisions
+            and matrix is not None
+            and getattr(pm, "llm_provider", "claude") != "rule_based"
+        ):
+            return await _run_batch_cycle(pm, db, matrix, writer, buffered=buffer is not None, revalue=revalue)
+
         # 1. 관심 종목 중 랜덤 선택
         symbols = PM_WATCHLISTS.get(pm.id, ["SPY"])
         symbol = random.choice(symbols)
+        entry = matrix.get(symbol) if matrix is not None else None
 
-        # 2. 가격 히스토리 가져오기
-        prices = get_price_history(symbol, days=60)
-        if prices is None or len(prices) < 20:
-            return {"status": "skipped", "reason": "insufficient_price_data"}
+        if entry is not None:
+            # 2-3. 틱 시그널 매트릭스에서 조회 (종목당 1회 계산)
+            prices = entry.prices
+            signals = entry.signals
+        else:
+            # 2. 가격 히스토리 가져오기
+            with _stage("price_fetch", pm):
+                prices = get_price_history(symbol, days=60)
+            if prices is None or len(prices) < 20:
+                return {"status": "skipped", "reason": "insufficient_price_data"}
 
-        # 3. 퀀트 시그널 생성
-        signals = quant_engine.generate_signals(prices, symbol)
+            # 3. 퀀트 시그널 생성
+            with _stage("signal_generation", pm):
+                signals = await quant_engine.generate_signals_async(prices, symbol)
 
         # 4. 시그널 DB 저장
-        signal_record = Signal(
-            pm_id=pm.id,
-            symbol=symbol,
-            signal_type="composite",
-            value=signals["composite_score"],
-            metadata_={
-                "rsi": signals["rsi"],
-                "momentum": signals["momentum"],
-                "volatility": signals["volatility"],
-                "rsi_signal": signals["rsi_signal"],
-                "momentum_signal": signals["momentum_signal"],
-            },
-        )
-        db.add(signal_record)
-
-        # 5. 현재 가격들 가져오기
-        current_prices = get_prices_for_pm(pm.id)
-        current_price = current_prices.get(symbol, float(prices.iloc[-1]))
+        _add_signal(writer, pm, symbol, signals)
 
-        # 6. 시장 컨텍스트
-        market_context = get_market_context()
+        # 5-6. 현재가 + 시장 컨텍스트
+        if entry is not None:
+            current_price = entry.current_price
+            market_context = dict(matrix.market_context)
+        else:
+            current_prices = get_prices_for_pm(pm.id)
+            current_price = current_prices.get(symbol, float(prices.iloc[-1]))
+            market_context = get_market_context()
         market_context["current_price"] = current_price
 
         # 7. LLM 판단 (API 키 없으면 규칙 기반 폴백)
-        has_positions = db.query(Position).filter(Position.pm_id == pm.id).count() > 0
+        has_positions = len(writer.list_positions(pm.id)) > 0
         provider = getattr(pm, "llm_provider", "claude")
-        if provider == "rule_based":
-            decision = _rule_based_decision(pm.id, signals, has_positions=has_positions)
-        else:
-            try:
-                decision = await llm_engine.make_decision(
-                    pm_id=pm.id,
-                    symbol=symbol,
-                    quant_signals=signals,
-                    market_context=market_context,
-                    llm_provider=provider,
-                )
-                # LLM이 HOLD인데 포지션이 없으면 규칙 기반으로 재판단 (초기 진입 촉진)
-                if decision.get("action") == "HOLD" and not has_positions:
-                    decision = _rule_based_decision(pm.id, signals, has_positions=False)
-            except Exception as e:
-                # API 키 없거나 에러 → 규칙 기반 폴백
-                logger.warning("LLM fallback for %s: %s", pm.id, e)
+        with _stage("llm_decision", pm):
+            if provider == "rule_based":
                 decision = _rule_based_decision(pm.id, signals, has_positions=has_positions)
+            else:
+                try:
+                    decision = await llm_engine.make_decision(
+                        pm_id=pm.id,
+                        symbol=symbol,
+                        quant_signals=signals,
+                        market_context=market_context,
+                        llm_provider=provider,
+                        fallback=lambda: _rule_based_decision(pm.id, signals, has_positions=has_positions),
+                    )
+                    # LLM이 HOLD인데 포지션이 없으면 규칙 기반으로 재판단 (초기 진입 촉진)
+                    if decision.get("action") == "HOLD" and not has_positions:
+                        decision = _rule_based_decision(pm.id, signals, has_positions=False)
+                except ProviderUnavailable as e:
+                    # 서킷 open / 미설정 캐시 → 호출 없이 즉시 규칙 기반
+                    logger.debug("LLM skipped for %s: %s", pm.id, e)
+                    decision = _rule_based_decision(pm.id, signals, has_positions=has_positions)
+                except Exception as e:
+                    # API 키 없거나 에러 → 규칙 기반 폴백
+                    logger.warning("LLM fallback for %s: %s", pm.id, e)
+                    decision = _rule_based_decision(pm.id, signals, has_positions=has_positions)
+
+        result = await _act_on_decision(
+            pm, symbol, decision, signals, current_price, db, writer,
+            buffered=buffer is not None, revalue=revalue,
+        )
+        _commit(writer, pm, buffered=buffer is not None)
+        return result
+
+    except (SQLAlchemyError, OSError, ValueError) as e:
+        # 배치 사이클에서 앞 종목이 이미 체결됐다면 버리는 체결을 대사 로그로 남김
+        writer.rollback(f"cycle error: {e}")
+        logger.error("PM cycle error for %s: %s", pm.id, e)
+        return {"status": "error", "reason": str(e)}
+    except Exception as e:
+        # 예상 밖 예외: 호출자에게 전파하되 스테이징된 쓰기는 버림
+        writer.rollback(f"unexpected cycle error: {e!r}")
+        raise
+    finally:
+        metrics.observe(
+            "cycle_seconds", time.perf_counter() - started,
+            description="Single PM trading cycle latency", pm=pm.id,
+        )
+
+
+async def _run_batch_cycle(
+    pm: PM, db: Session, matrix: SignalMatrix, writer, *, buffered: bool, revalue: bool
+) -> dict:
+    """
+    배치 사이클: 관심 종목 전체 시그널을 한 프롬프트로 → 종목별 결정 → 종목별 주문
+    반환: 대표 결과(체결 종목, 없으면 최고 확신도) + decisions(종목별 결과 목록)
+    """
+    entries = {
+        sym: entry for sym in PM_WATCHLISTS.get(pm.id, ["SPY"]) if (entry := matrix.get(sym)) is not None
+    }
+    if not entries:
+        return {"status": "skipped", "reason": "insufficient_price_data"}
+
+    for sym, entry in entries.items():
+        _add_signal(writer, pm, sym, entry.signals)
+
+    has_positions = len(writer.list_positions(pm.id)) > 0
+    with _stage("llm_decision", pm):
+        try:
+            decisions = await llm_engine.make_batch_decision(
+                pm_id=pm.id,
+                quant_signals={sym: entry.signals for sym, entry in entries.items()},
+                market_context=dict(matrix.market_context),
+                llm_provider=getattr(pm, "llm_provider", "claude"),
+                current_prices={sym: entry.current_price for sym, entry in entries.items()},
+                fallback=lambda: {
+                    sym: _rule_based_decision(pm.id, entry.signals, has_positions=has_positions)
+                    for sym, entry in entries.items()
+                },
+            )
+            # 포지션이 없을 때 HOLD는 규칙 기반으로 재판단 (단일 모드와 동일)
+            if not has_positions:
+                decisions = {
+                    sym: _rule_based_decision(pm.id, entries[sym].signals, has_positions=False)
+                    if decision.get("action") == "HOLD" else decision
+                    for sym, decision in decisions.items()
+                }
+        except Exception as e:
+            log = logger.debug if isinstance(e, ProviderUnavailable) else logger.warning
+            log("LLM batch fallback for %s: %s", pm.id, e)
+            decisions = {
+                sym: _rule_based_decision(pm.id, entry.signals, has_positions=has_positions)
+                for sym, entry in entries.items()
+            }
+
+    results = []
+    for sym, entry in entries.items():
+        decision = decisions.get(sym) or {"action": "HOLD", "conviction": 0.0}
+        results.append(await _act_on_decision(
+            pm, sym, decision, entry.signals, entry.current_price, db, writer,
+            buffered=buffered, revalue=revalue,
+        ))
+    _commit(writer, pm, buffered=buffered)
+
+    executed = [r for r in results if r.get("trade_executed")]
+    primary = executed[0] if executed else max(results, key=lambda r: r.get("conviction", 0.0))
+    return {**primary, "trade_executed": bool(executed), "decisions": results}
+
+
+def _add_signal(writer, pm: PM, symbol: str, signals: dict) -> None:
+    writer.add_signal(
+        pm_id=pm.id,
+        symbol=symbol,
+        signal_type="composite",
+        value=signals["composite_score"],
+        metadata_={
+            "rsi": signals["rsi"],
+            "momentum": signals["momentum"],
+            "volatility": signals["volatility"],
+            "rsi_signal": signals["rsi_signal"],
+            "momentum_signal": signals["momentum_signal"],
+        },
+    )
 
-        action = decision.get("action", "HOLD")
-        conviction = decision.get("conviction", 0.0)
-        reasoning = decision.get("reasoning", "Rule-based decision")
-        position_size = decision.get("position_size", 0.02)
-
-        result = {
-            "pm_id": pm.id,
-            "symbol": symbol,
-            "action": action,
-            "conviction": conviction,
-            "reasoning": reasoning,
-            "composite_score": signals["composite_score"],
-        }
-
-        # 8. 브로커 주문 실행 (KIS / Bybit / Paper 자동 라우팅)
-        if action in ("BUY", "SELL") and conviction >= settings.min_conviction:
-            from app.engines.broker import get_broker_for_pm
-            from app.engines.risk_guard import check_risk
-            broker = get_broker_for_pm(getattr(pm, "broker_type", "paper"))
-
-            # 최소 거래 금액 (주식 $10, 크립토 $5.5)
-            is_crypto = getattr(pm, "broker_type", "paper") == "bybit"
-            min_trade_usd = 5.5 if is_crypto else 10.0
-            trade_amount = pm.current_capital * position_size
-            # 포지션 한도: 크립토 소액 계좌는 95%까지 허용
-            cap_pct = 0.95 if is_crypto else settings.position_limit_pct
-            position_cap = pm.current_capital * cap_pct
-            trade_amount = min(trade_amount, position_cap)
-            if trade_amount < min_trade_usd and pm.current_capital >= min_trade_usd:
-                trade_amount = min(min_trade_usd, pm.current_capital * 0.50)
-            quantity = trade_amount / current_price
 
+async def _act_on_decision(
+    pm: PM,
+    symbol: str,
+    decision: dict,
+    signals: dict,
+    current_price: float,
+    db: Session,
+    writer,
+    *,
+    buffered: bool,
+    revalue: bool,
+) -> dict:
+    """결정 → 사이징/리스크 체크/브로커 주문 (커밋은 호출자)"""
+    action = decision.get("action", "HOLD")
+    conviction = decision.get("conviction", 0.0)
+    reasoning = decision.get("reasoning", "Rule-based decision")
+    position_size = decision.get("position_size", 0.02)
+
+    result = {
+        "pm_id": pm.id,
+        "symbol": symbol,
+        "action": action,
+        "conviction": conviction,
+        "reasoning": reasoning,
+        "composite_score": signals["composite_score"],
+    }
+
+    # 8. 브로커 주문 실행 (KIS / Bybit / Paper 자동 라우팅)
+    if action in ("BUY", "SELL") and conviction >= settings.min_conviction:
+        from app.engines.broker import get_broker_for_pm
+        from app.engines.risk_guard import check_risk
+        broker = get_broker_for_pm(getattr(pm, "broker_type", "paper"))
+
+        # 최소 거래 금액 (주식 $10, 크립토 $5.5)
+        is_crypto = getattr(pm, "broker_type", "paper") == "bybit"
+        min_trade_usd = 5.5 if is_crypto else 10.0
+        trade_amount = pm.current_capital * position_size
+        # 포지션 한도: 크립토 소액 계좌는 95%까지 허용
+        cap_pct = 0.95 if is_crypto else settings.position_limit_pct
+        position_cap = pm.current_capital * cap_pct
+        trade_amount = min(trade_amount, position_cap)
+        if trade_amount < min_trade_usd and pm.current_capital >= min_trade_usd:
+            trade_amount = min(min_trade_usd, pm.current_capital * 0.50)
+        quantity = trade_amount / current_price
+
+        # 주문 대기(pending): 사전 체크 ~ 브로커 제출 직전. 브로커 호출 동안은 _place_order에서 executing으로 전환
+        with metrics.in_progress("orders_pending"):
             # 현금 부족으로 의미 없는 극소량 거래 방지
-            cash = _get_cash(pm, db)
+            cash = _get_cash(pm, db, writer)
             if cash < min_trade_usd:
                 result["skipped"] = True
                 result["reason"] = f"insufficient_cash (${cash:.2f} < ${min_trade_usd})"
-                db.commit()
                 return result
 
             # 리스크 체크 (실거래 브로커일 때만 엄격하게)
             if broker.is_live():
-                allowed, risk_reason = check_risk(pm, action, trade_amount, db)
+                with _stage("risk_check", pm):
+                    allowed, risk_reason = check_risk(
+                        pm, action, trade_amount, db, staged_trades=writer.staged_trades(pm.id),
+                    )
                 if not allowed:
                     logger.warning("RISK BLOCKED %s %s %s: %s", pm.id, action, symbol, risk_reason)
+                    metrics.event("orders_rejected")
                     result["risk_blocked"] = True
                     result["risk_reason"] = risk_reason
-                    db.commit()
                     return result
 
             if action == "BUY":
-                result.update(await _execute_buy(pm, symbol, quantity, current_price, db, broker))
+                result.update(await _execute_buy(pm, symbol, quantity, current_price, db, broker, writer))
             elif action == "SELL":
-                result.update(await _execute_sell(pm, symbol, quantity, current_price, db, broker))
+                result.update(await _execute_sell(pm, symbol, quantity, current_price, db, broker, writer))
 
-            if result.get("trade_executed"):
-                result["broker"] = getattr(broker, "__class__", type(broker)).__name__
-                result["broker_live"] = broker.is_live()
+        if result.get("trade_executed"):
+            result["broker"] = getattr(broker, "__class__", type(broker)).__name__
+            result["broker_live"] = broker.is_live()
+            if revalue and not buffered:
                 _update_pm_capital(pm, db)
 
-        db.commit()
-        return result
+    return result
 
-    except (SQLAlchemyError, OSError, ValueError) as e:
-        db.rollback()
-        logger.error("PM cycle error for %s: %s", pm.id, e)
-        return {"status": "error", "reason": str(e)}
+
+def _stage(name: str, pm: PM):
+    """PM 사이클 단계 타이머 (라벨: pm / LLM provider / broker)"""
+    return metrics.stage(
+        name,
+        pm=pm.id,
+        provider=getattr(pm, "llm_provider", "claude"),
+        broker=getattr(pm, "broker_type", "paper"),
+    )
+
+
+def _commit(writer, pm: PM, buffered: bool) -> None:
+    """사이클 커밋 — 틱 버퍼면 스테이징만 (실제 커밋은 revalue_tick에서 계측)"""
+    if buffered:
+        writer.commit()
+        return
+    with _stage("db_commit", pm):
+        writer.commit()
+
+
+async def _place_order(pm: PM, broker, symbol: str, quantity: float, side: str, **kwargs) -> dict:
+    """
+    브로커 주문 + 계측 (지연 히스토그램, 거절 이벤트)
+    호출 동안 주문 1건을 pending → executing으로 옮김 (두 게이지는 서로 겹치지 않음, 큐 깊이 = 합)
+    """
+    metrics.gauge_add("orders_pending", -1)
+    try:
+        with metrics.in_progress("orders_executing"), _stage("broker_order", pm):
+            try:
+                result = await broker.place_order(symbol, quantity, side, **kwargs)
+            except Exception:
+                metrics.event("orders_rejected")
+                raise
+    finally:
+        metrics.gauge_add("orders_pending", 1)
+    if result.get("status") in ("filled", "partially_filled"):
+        metrics.event("orders_completed")
+    else:
+        metrics.event("orders_rejected")
+    return result
 
 
 async def _execute_buy(
-    pm: PM, symbol: str, quantity: float, price: float, db: Session, broker=None
+    pm: PM, symbol: str, quantity: float, price: float, db: Session, broker=None, writer=None
 ) -> dict:
-    """BUY 실행 — 브로커 주문 → DB 기록"""
+    """BUY 실행 — 브로커 주문 → DB 기록 (writer: 세션 즉시 반영 또는 틱 버퍼)"""
     from app.engines.broker import PaperAdapter
     if broker is None:
         broker = PaperAdapter()
+    if writer is None:
+        writer = SessionWriter(db)
 
     order_value = quantity * price
     is_crypto = getattr(pm, "broker_type", "paper") == "bybit"
@@ -184,7 +365,7 @@ async def _execute_buy(
         quantity = position_limit / price
         order_value = quantity * price
 
-    cash = _get_cash(pm, db)
+    cash = _get_cash(pm, db, writer)
     if cash < order_value:
         quantity = cash * settings.cash_reserve_pct / price
         order_value = quantity * price
@@ -193,7 +374,7 @@ async def _execute_buy(
 
     # 브로커 주문 (실패 시 DB 기록 생략)
     try:
-        order_result = await broker.place_order(symbol, quantity, "BUY", notional=order_value)
+        order_result = await _place_order(pm, broker, symbol, quantity, "BUY", notional=order_value)
         if order_result.get("status") not in ("filled", "partially_filled"):
             return {
                 "trade_executed": False,
@@ -212,43 +393,42 @@ async def _execute_buy(
         return {"trade_executed": False, "reason": f"broker_error: {e}"}
 
     # DB 기록
-    existing = db.query(Position).filter(
-        Position.pm_id == pm.id, Position.symbol == symbol
-    ).first()
+    existing = writer.get_position(pm.id, symbol)
     if existing:
         total_qty = existing.quantity + quantity
-        existing.avg_cost = (existing.quantity * existing.avg_cost + quantity * filled_price) / total_qty
-        existing.quantity = total_qty
+        avg_cost = (existing.quantity * existing.avg_cost + quantity * filled_price) / total_qty
+        writer.set_position(pm.id, symbol, total_qty, avg_cost)
     else:
-        db.add(Position(pm_id=pm.id, symbol=symbol, quantity=quantity, avg_cost=filled_price))
+        writer.set_position(pm.id, symbol, quantity, filled_price)
 
-    db.add(Trade(
+    writer.add_trade(
+        order_id=str(order_result.get("order_id", "")),
         pm_id=pm.id, symbol=symbol, action="BUY",
         quantity=quantity, price=filled_price, conviction_score=0.7,
         reasoning=f"[{broker.__class__.__name__}] BUY at ${filled_price:.4f} (fee: ${fee:.4f})",
         fee=fee,
-    ))
+    )
     return {"trade_executed": True, "quantity": quantity, "price": filled_price, "fee": fee}
 
 
 async def _execute_sell(
-    pm: PM, symbol: str, quantity: float, price: float, db: Session, broker=None
+    pm: PM, symbol: str, quantity: float, price: float, db: Session, broker=None, writer=None
 ) -> dict:
-    """SELL 실행 — 포지션 확인 → 브로커 주문 → DB 기록"""
+    """SELL 실행 — 포지션 확인 → 브로커 주문 → DB 기록 (writer: 세션 즉시 반영 또는 틱 버퍼)"""
     from app.engines.broker import PaperAdapter
     if broker is None:
         broker = PaperAdapter()
+    if writer is None:
+        writer = SessionWriter(db)
 
-    existing = db.query(Position).filter(
-        Position.pm_id == pm.id, Position.symbol == symbol
-    ).first()
+    existing = writer.get_position(pm.id, symbol)
     if not existing:
         return {"trade_executed": False, "reason": "no_position"}
 
     sell_qty = min(quantity, existing.quantity)
 
     try:
-        order_result = await broker.place_order(symbol, sell_qty, "SELL")
+        order_result = await _place_order(pm, broker, symbol, sell_qty, "SELL")
         if order_result.get("status") not in ("filled", "partially_filled"):
             return {
                 "trade_executed": False,
@@ -267,38 +447,32 @@ async def _execute_sell(
 
     gross_pnl = (filled_price - existing.avg_cost) * sell_qty
     pnl = gross_pnl - fee  # 수수료 차감한 순수익
-    existing.quantity -= sell_qty
-    if existing.quantity <= 0.001:
-        db.delete(existing)
+    remaining = existing.quantity - sell_qty
+    if remaining <= 0.001:
+        writer.delete_position(pm.id, symbol)
+    else:
+        writer.set_position(pm.id, symbol, remaining, existing.avg_cost)
 
-    db.add(Trade(
+    writer.add_trade(
+        order_id=str(order_result.get("order_id", "")),
         pm_id=pm.id, symbol=symbol, action="SELL",
         quantity=sell_qty, price=filled_price, conviction_score=0.7,
         reasoning=f"[{broker.__class__.__name__}] SELL at ${filled_price:.4f} (P&L: ${pnl:+.2f}, fee: ${fee:.4f})",
         fee=fee,
-    ))
+    )
     return {"trade_executed": True, "quantity": sell_qty, "price": filled_price, "pnl": round(pnl, 2), "fee": fee}
 
 
-def _get_cash(pm: PM, db: Session) -> float:
+def _get_cash(pm: PM, db: Session, writer=None) -> float:
     """PM의 현금 잔고 = 총 자본 - 포지션 평가액"""
-    positions = db.query(Position).filter(Position.pm_id == pm.id).all()
+    positions = (writer or SessionWriter(db)).list_positions(pm.id)
     position_value = sum(p.quantity * p.avg_cost for p in positions)
     return max(pm.current_capital - position_value, 0.0)
 
 
-def _update_pm_capital(pm: PM, db: Session) -> float:
-    """PM 자본 = 현금 잔고 + 포지션 현재가 기준 평가액. DB 업데이트로 변이 방지."""
-    from app.engines.market_data import get_current_price
-
-    positions = db.query(Position).filter(Position.pm_id == pm.id).all()
-    position_value = sum(
-        pos.quantity * get_current_price(pos.symbol) for pos in positions
-    )
-
-    cash = _get_cash(pm, db)
-    new_capital = round(cash + position_value, 2)
-    db.query(PM).filter(PM.id == pm.id).update({"current_capital": new_capital})
+def _update_pm_capital(pm: PM, db: Session, prices: dict[str, float] | None = None) -> float:
+    """PM 자본 = 현금 잔고 + 포지션 현재가 기준 평가액. 단일 PM용 — 틱 단위는 revalue_pms 일괄 처리."""
+    new_capital = revalue_pms(db, [pm.id], prices=prices).get(pm.id, pm.current_capital)
     logger.info("PM %s capital updated: %s", pm.id, new_capital)
     return new_capital
 
@@ -336,13 +510,50 @@ async def run_all_pm_cycles(db: Session, *, exclude_crypto: bool = True) -> list
     if exclude_crypto:
         query = query.filter(PM.broker_type != "bybit")
     pms = query.all()
-    tasks = [run_pm_cycle(pm, db) for pm in pms]
+
+    # 틱당 한 번: 전체 관심 종목 합집합의 시그널 매트릭스 갱신
+    await signal_matrix.refresh(SignalMatrix.universe(pm.id for pm in pms), history_fn=get_price_history)
+    # 시그널/거래/포지션 쓰기는 틱 버퍼에 모았다가 한 트랜잭션으로 flush
+    buffer = CycleWriteBuffer()
+    tasks = [run_pm_cycle(pm, db, matrix=signal_matrix, revalue=False, buffer=buffer) for pm in pms]
     results = await asyncio.gather(*tasks, return_exceptions=True)
-    return [r if isinstance(r, dict) else {"status": "error", "reason": str(r)} for r in results]
+    results = [r if isinstance(r, dict) else {"status": "error", "reason": str(r)} for r in results]
+
+    # 버퍼 flush + 체결된 PM 자본 일괄 재평가 (쿼리 1회 + 가격 벡터 1회 + bulk UPDATE) → 커밋 1회
+    revalue_tick(db, results, buffer=buffer)
+    return results
+
+
+def revalue_tick(
+    db: Session, results: list[dict], buffer: CycleWriteBuffer | None = None
+) -> dict[str, float]:
+    """
+    틱 마무리: 쓰기 버퍼 flush → 체결된 PM 자본을 시그널 매트릭스 가격으로 일괄 재평가 → 커밋 1회
+    flush 실패 PM은 제외하고 나머지만 반영, 커밋 자체가 실패하면 틱 전체 롤백
+    (거래·포지션·자본이 함께 반영되거나 함께 버려짐 — 버려진 체결은 대사용 로그)
+    """
+    traded = [r["pm_id"] for r in results if r.get("trade_executed")]
+    if buffer is None and not traded:
+        return {}
+    prices = {sym: e.current_price for sym, e in signal_matrix.entries.items()}
+    try:
+        with metrics.stage("db_commit"):
+            if buffer is not None:
+                buffer.flush(db)
+                traded = [pm_id for pm_id in traded if pm_id not in buffer.failed]
+            updated = revalue_pms(db, traded, prices=prices)
+            db.commit()
+        return updated
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Tick flush/revaluation error: %s", e)
+        if buffer is not None:
+            buffer.report_unsaved(f"tick commit failed: {e}")
+        return {}
 
 
-def record_nav(db: Session) -> dict:
-    """현재 펀드 NAV를 히스토리에 저장"""
+def record_nav(db: Session, recorded_at: datetime | None = None) -> dict:
+    """현재 펀드 NAV를 히스토리에 저장 (recorded_at: 리플레이 가상 시각, 없으면 DB 현재 시각)"""
     pms = db.query(PM).filter(PM.is_active == True).all()
     total_nav = sum(pm.current_capital for pm in pms)
 
@@ -353,41 +564,47 @@ def record_nav(db: Session) -> dict:
         daily_return = (total_nav - last_nav.nav) / last_nav.nav
 
     nav_record = NAVHistory(nav=total_nav, daily_return=daily_return)
+    if recorded_at is not None:
+        nav_record.recorded_at = recorded_at
     db.add(nav_record)
     db.commit()
     return {"nav": total_nav, "daily_return": daily_return}
 
 
-def seed_nav_history(db: Session, days: int = 90):
-    """초기 NAV 히스토리 시딩 (90일 시뮬레이션 데이터)"""
-    existing = db.query(NAVHistory).count()
-    if existing > 0:
+def seed_nav_history(db: Session, days: int = 90, interval: timedelta = timedelta(days=1)):
+    """
+    초기 NAV 히스토리 시딩 (기본 90일 일간 시뮬레이션 데이터)
+    interval을 줄이면 같은 기간을 더 촘촘하게 (예: 5분 → 365일 ≈ 10만 행)
+    수익률 경로는 한 번의 벡터 샘플링 + cumprod, 삽입은 bulk INSERT 1회
+    """
+    existing = db.query(NAVHistory.id).limit(1).first()
+    if existing is not None:
         return  # 이미 데이터 있으면 스킵
 
     import numpy as np
-    from datetime import timedelta
-    np.random.seed(42)
+    from sqlalchemy import func, insert
+
+    periods = int(timedelta(days=days) / interval)
+    dt = interval / timedelta(days=1)  # 일 단위 기간 비율 (드리프트·변동성 스케일)
+    rng = np.random.default_rng(42)
 
     initial_nav = 1_100_000.0  # 11 PMs × $100k
-    nav = initial_nav
+    returns = rng.normal(0.0008 * dt, 0.012 * np.sqrt(dt), periods)  # 연 20% 수익, 12% 변동성
+    navs = initial_nav * np.cumprod(1 + returns)
     base_date = datetime.now() - timedelta(days=days)
 
-    for i in range(days):
-        daily_return = np.random.normal(0.0008, 0.012)  # 연 20% 수익, 12% 변동성
-        nav = nav * (1 + daily_return)
-        record_date = base_date + timedelta(days=i)
-        record = NAVHistory(
-            nav=round(nav, 2),
-            daily_return=round(daily_return, 6),
-            recorded_at=record_date,
+    if periods:
+        db.execute(
+            insert(NAVHistory.__table__),  # Core INSERT (ORM bulk 경로의 행별 매핑 생략)
+            [
+                {"nav": nav, "daily_return": ret, "recorded_at": base_date + i * interval}
+                for i, (nav, ret) in enumerate(zip(navs.round(2).tolist(), returns.round(6).tolist()))
+            ],
         )
-        db.add(record)
 
     # 마지막으로 현재 PM 자본 합산해서 최신 NAV 저장
-    pms = db.query(PM).all()
-    if pms:
-        current_nav = sum(pm.current_capital for pm in pms)
-    else:
+    current_nav = db.query(func.sum(PM.current_capital)).scalar()
+    if current_nav is None:
         current_nav = initial_nav
 
     db.add(NAVHistory(nav=round(current_nav, 2), daily_return=0.0))
@@ -0,0 +1,223 @@
+"""
+Trends Collector: Google Trends 배치 수집기
+
+- pytrends 세션(TrendReq) 하나를 재사용 (요청마다 새 세션/쿠키 생성 X)
+- 페이로드당 최대 5개 키워드: 키워드 4개 + 공통 앵커 1개
+  Trends 값은 페이로드 내부 상대값이라, 수집마다 첫 배치의 앵커 평균을 기준으로 배치 간 스케일을 정규화
+- timeframe별 캐시 — API 요청 경로는 캐시만 읽고, 실제 수집은 백그라운드 루프에서 주기적으로 실행
+- 수집(리더 워커)은 결과를 trend_snapshots 테이블에 기록 → 다른 워커는 요청 경로에서 snapshots()로 읽음
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+import numpy as np
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.trend_snapshot import TrendSnapshot
+
+logger = logging.getLogger(__name__)
+
+MAX_KEYWORDS_PER_PAYLOAD = 5
+
+
+def trend_stats(keyword: str, values: list[float], source: str = "google_trends") -> dict:
+    """관심도 시계열 → 현재값/이전 평균/추세(%)"""
+    current = values[-1] if values else 50
+    avg_prev = np.mean(values[:-1]) if len(values) > 1 else current
+    trend = (current - avg_prev) / max(avg_prev, 1) * 100
+    return {
+        "keyword": keyword,
+        "current_interest": int(round(current)),
+        "avg_interest": round(float(avg_prev), 1),
+        "trend_pct": round(float(trend), 2),
+        "is_trending": bool(trend > 50),
+        "source": source,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def _batch_errors() -> tuple[type[Exception], ...]:
+    """배치 하나만 폴백할 오류 — pytrends ResponseError(429 TooManyRequestsError 포함)는 Exception 직계"""
+    try:
+        from pytrends.exceptions import ResponseError
+    except ImportError:
+        return (ConnectionError, OSError, ValueError)
+    return (ConnectionError, OSError, ValueError, ResponseError)
+
+
+def _default_session():
+    from pytrends.request import TrendReq
+    return TrendReq(hl="en-US", tz=360)
+
+
+class TrendsCollector:
+    def __init__(
+        self,
+        session_factory: Callable[[], object] | None = None,
+        anchor: str | None = None,
+        fallback: Callable[[str], dict] | None = None,
+        db_factory: Callable[[], Session] | None = None,
+    ):
+        self._session_factory = session_factory or _default_session
+        self._db_factory = db_factory  # 있으면 refresh 결과를 DB에 기록 (워커 간 공유)
+        self._session = None
+        self.anchor = settings.trends_anchor if anchor is None else anchor
+        self._fallback = fallback
+        self._lock = threading.Lock()  # pytrends 세션은 스레드 안전하지 않음
+        self._cache: dict[str, dict[str, tuple[float, dict]]] = {}  # timeframe → keyword → (수집 시각, 결과)
+        self._task: Optional[asyncio.Task] = None
+        self.requests_made = 0
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    def _batches(self, keywords: list[str]) -> list[list[str]]:
+        size = MAX_KEYWORDS_PER_PAYLOAD - 1 if self.anchor else MAX_KEYWORDS_PER_PAYLOAD
+        unique = [k for k in dict.fromkeys(keywords) if k != self.anchor]
+        return [unique[i:i + size] for i in range(0, len(unique), size)]
+
+    def fetch(self, keywords: list[str], timeframe: str = "now 7-d") -> dict[str, dict]:
+        """키워드를 5개 단위 페이로드로 묶어 조회 (블로킹 — 백그라운드/스레드에서 호출)"""
+        results: dict[str, dict] = {}
+        anchor_ref = None  # 이번 수집의 앵커 기준 평균 (앵커 평균이 0보다 큰 첫 배치)
+        for batch in self._batches(keywords):
+            batch_results, anchor_ref = self._fetch_batch(batch, timeframe, anchor_ref)
+            results.update(batch_results)
+        return results
+
+    def _fetch_batch(
+        self, batch: list[str], timeframe: str, anchor_ref: float | None,
+    ) -> tuple[dict[str, dict], float | None]:
+        payload = batch + [self.anchor] if self.anchor else batch
+        try:
+            with self._lock:
+                self.requests_made += 1
+                self.session.build_payload(payload, cat=0, timeframe=timeframe, geo="US")
+                data = self.session.interest_over_time()
+        except _batch_errors() as e:
+            logger.warning("Google Trends batch error %s: %s", batch, e)
+            return self._fallbacks(batch, error=str(e)), anchor_ref
+
+        if data is None or data.empty:
+            return self._fallbacks(batch), anchor_ref
+
+        # 앵커 기준 정규화: 이번 수집의 첫 유효 앵커 평균을 기준으로 이후 배치 스케일 보정
+        scale = 1.0
+        if self.anchor and self.anchor in data:
+            anchor_mean = float(data[self.anchor].mean())
+            if anchor_mean > 0:
+                if anchor_ref is None:
+                    anchor_ref = anchor_mean
+                scale = anchor_ref / anchor_mean
+
+        results = {}
+        now = time.monotonic()
+        bucket = self._cache.setdefault(timeframe, {})
+        for keyword in batch:
+            if keyword not in data:
+                results.update(self._fallbacks([keyword]))
+                continue
+            result = trend_stats(keyword, [v * scale for v in data[keyword].tolist()])
+            bucket[keyword] = (now, result)
+            results[keyword] = result
+        return results, anchor_ref
+
+    def _fallbacks(self, keywords: list[str], error: str | None = None) -> dict[str, dict]:
+        if self._fallback is None:
+            return {}
+        extra = {"error": error} if error else {}
+        return {k: {**self._fallback(k), **extra} for k in keywords}
+
+    def cached(self, keyword: str, timeframe: str = "now 7-d", max_age: float | None = None) -> dict | None:
+        """캐시된 결과만 반환 (네트워크 호출 없음)"""
+        entry = self._cache.get(timeframe, {}).get(keyword)
+        if entry is None:
+            return None
+        if max_age is not None and time.monotonic() - entry[0] > max_age:
+            return None
+        return entry[1]
+
+    # ── 워커 간 공유 (trend_snapshots) ──────────────────────
+
+    def store(self, results: dict[str, dict], timeframe: str = "now 7-d") -> None:
+        """실제 수집 결과를 trend_snapshots에 upsert (블로킹, DB 오류는 로그만)"""
+        db = self._db_factory()
+        try:
+            for keyword, result in results.items():
+                db.merge(TrendSnapshot(keyword=keyword, timeframe=timeframe, payload=result))
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning("Google Trends snapshot store error: %s", e)
+        finally:
+            db.close()
+
+    @staticmethod
+    def snapshots(db: Session, keywords: list[str], timeframe: str = "now 7-d") -> dict[str, dict]:
+        """리더가 기록한 최신 수집 결과 {keyword: 결과} — 조회 1회"""
+        rows = (
+            db.query(TrendSnapshot)
+            .filter(TrendSnapshot.timeframe == timeframe, TrendSnapshot.keyword.in_(keywords))
+            .all()
+        )
+        return {row.keyword: row.payload for row in rows}
+
+    # ── 백그라운드 갱신 ──────────────────────────────────
+
+    async def refresh(self, keywords: list[str], timeframe: str = "now 7-d") -> int:
+        results = await asyncio.to_thread(self.fetch, keywords, timeframe)
+        fresh = {k: r for k, r in results.items() if r.get("source") == "google_trends"}
+        if fresh and self._db_factory is not None:
+            await asyncio.to_thread(self.store, fresh, timeframe)
+        return len(fresh)
+
+    async def _refresh_loop(self, keywords: list[str], timeframe: str, interval: int, initial_delay: int) -> None:
+        await asyncio.sleep(initial_delay)
+        while True:
+            try:
+                updated = await self.refresh(keywords, timeframe)
+                logger.info("Google Trends refreshed — %d/%d keywords", updated, len(keywords))
+            except Exception as e:
+                logger.error("Google Trends refresh error: %s", e)
+            await asyncio.sleep(interval)
+
+    def start(
+        self,
+        keywords: list[str],
+        timeframe: str = "now 7-d",
+        interval: int | None = None,
+        initial_delay: int | None = None,
+    ) -> bool:
+        if self._task and not self._task.done():
+            return False
+        self._task = asyncio.create_task(self._refresh_loop(
+            keywords,
+            timeframe,
+            settings.trends_refresh_interval if interval is None else interval,
+            settings.trends_initial_delay if initial_delay is None else initial_delay,
+        ))
+        return True
+
+    def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def get_status(self) -> dict:
+        return {
+            "running": bool(self._task and not self._task.done()),
+            "anchor": self.anchor,
+            "requests_made": self.requests_made,
+            "cached": {tf: len(entries) for tf, entries in self._cache.items()},
+        }
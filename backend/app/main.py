@@ -1,7 +1,11 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.api.fund import router as fund_router
 from app.api.pm import router as pm_router
@@ -15,11 +19,34 @@ from app.api.trading import router as trading_router
 from app.api.crypto import router as crypto_router
 from app.config import settings
 from app.db.base import Base, engine, get_db
-from app.core.scheduler import start_scheduler, stop_scheduler
+from app.core.leader import start_leader_election, stop_leader_election
+from app.core.scheduler import start_trading_schedulers, stop_trading_schedulers
+from app.core.workers import shutdown_pool
+from app.core import data_version
+from app.core.response_cache import ResponseCacheMiddleware
+from app.core.responses import FastJSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _seed_nav_history() -> None:
+    """NAV 히스토리 시딩 (백그라운드 스레드 — 서버 기동을 막지 않음)"""
+    from app.engines.trading_cycle import seed_nav_history
+
+    db = next(get_db())
+    try:
+        seed_nav_history(db)
+    except Exception as e:
+        db.rollback()
+        logger.warning("NAV history seeding failed: %s", e)
+    finally:
+        db.close()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 라우터 import 경로에서 로드되지 않는 모델도 create_all 대상에 등록
+    from app.models import social_mention, trend_snapshot  # noqa: F401
     Base.metadata.create_all(bind=engine)
     # Lightweight migration: add missing columns to existing tables
     from sqlalchemy import text, inspect
@@ -30,27 +57,49 @@ async def lifespan(app: FastAPI):
             conn.commit()
     db = next(get_db())
     from app.db.seed import seed_pms
-    from app.engines.trading_cycle import seed_nav_history
 
     seed_pms(db)
-    seed_nav_history(db)
     db.close()
-    start_scheduler(interval_seconds=300)  # 5분마다 주식 PM 자동 거래
-    # 크립토 PM 전용 스케줄러 자동 시작
-    import asyncio
-    import app.api.crypto as crypto_mod
-    loop = asyncio.get_event_loop()
-    crypto_mod._crypto_scheduler_task = loop.create_task(
-        crypto_mod._crypto_trading_loop(300)
-    )
-    crypto_mod._crypto_scheduler_interval = 300
+    # NAV 시딩은 대시보드 표시용 → 기동 임계 경로 밖에서
+    nav_seed = asyncio.create_task(asyncio.to_thread(_seed_nav_history))
+    if settings.scheduler_leader_election:
+        # 멀티 워커: lease를 잡은 워커 하나만 트레이딩 사이클 실행, 나머지는 HTTP만 처리
+        start_leader_election(
+            on_elected=start_trading_schedulers,
+            on_demoted=stop_trading_schedulers,
+        )
+    else:
+        start_trading_schedulers()
     yield
-    stop_scheduler()
-    if crypto_mod._crypto_scheduler_task and not crypto_mod._crypto_scheduler_task.done():
-        crypto_mod._crypto_scheduler_task.cancel()
+    await nav_seed
+    stop_leader_election()
+    stop_trading_schedulers()
+    shutdown_pool()
 
 
-app = FastAPI(title="AI Hedge Fund", version="0.2.0", lifespan=lifespan)
+app = FastAPI(
+    title="AI Hedge Fund",
+    version="0.2.0",
+    lifespan=lifespan,
+    **({"default_response_class": FastJSONResponse} if settings.fast_json_enabled else {}),
+)
+
+if settings.response_cache_enabled:
+    # 쓰기 커밋마다 데이터 버전 증가 → 대시보드 읽기 응답 캐시 자동 무효화
+    data_version.install()
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        paths=[p.strip() for p in settings.response_cache_paths.split(",") if p.strip()],
+        ttl=settings.response_cache_ttl,
+    )
+
+if settings.gzip_enabled:
+    # 캐시 미들웨어 바깥 → 캐시 히트 응답도 압축 (Accept-Encoding: gzip 요청만)
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.gzip_min_size,
+        compresslevel=settings.gzip_level,
+    )
 
 app.add_middleware(
     CORSMiddleware,
@@ -75,3 +124,19 @@ app.include_router(crypto_router)
 @app.get("/health")
 async def health():
     return {"status": "ok", "version": "0.2.0"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """
+    Prometheus 스크레이프 엔드포인트 (사이클 단계 히스토그램 + 주문 파이프라인 게이지)
+    값은 워커 프로세스별 — scheduler_leader{worker_id}로 사이클을 돌리는 리더 워커의 스크레이프를 구분
+    """
+    from app.core.leader import WORKER_ID, is_leader
+    from app.core.metrics import metrics
+
+    body = metrics.render_prometheus() + (
+        "# TYPE scheduler_leader gauge\n"
+        f'scheduler_leader{{worker_id="{WORKER_ID}"}} {int(is_leader())}\n'
+    )
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
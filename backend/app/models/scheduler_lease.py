@@ -0,0 +1,13 @@
+from sqlalchemy import String, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    holder: Mapped[str] = mapped_column(String(100), default="")
+    expires_at = mapped_column(DateTime)
+    acquired_at = mapped_column(DateTime, server_default=func.now())
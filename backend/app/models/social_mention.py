@@ -0,0 +1,31 @@
+from sqlalchemy import String, Integer, Float, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SocialMention(Base):
+    """소셜 언급량 시계열 (append-only) — 심볼·소스별 수집 시점마다 1행"""
+    __tablename__ = "social_mentions"
+    __table_args__ = (Index("ix_social_mentions_symbol_source", "symbol", "source", "recorded_at"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    symbol: Mapped[str] = mapped_column(String(20))
+    source: Mapped[str] = mapped_column(String(50))
+    mention_count: Mapped[float] = mapped_column(Float)
+    sentiment: Mapped[float] = mapped_column(Float, default=0.0)
+    recorded_at = mapped_column(DateTime, server_default=func.now())
+
+
+class SocialMentionStats(Base):
+    """심볼·소스별 언급량 지수가중 통계 (EWMA) — z-score를 O(1)로 계산"""
+    __tablename__ = "social_mention_stats"
+
+    symbol: Mapped[str] = mapped_column(String(20), primary_key=True)
+    source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+    mean: Mapped[float] = mapped_column(Float, default=0.0)
+    m2: Mapped[float] = mapped_column(Float, default=0.0)      # 분산 × count (지수가중)
+    last_zscore: Mapped[float] = mapped_column(Float, default=0.0)
+    last_observed: Mapped[str] = mapped_column(String(40), default="")  # 마지막으로 기록한 수집 타임스탬프
+    updated_at = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
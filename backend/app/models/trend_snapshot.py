@@ -0,0 +1,14 @@
+from sqlalchemy import String, DateTime, func, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TrendSnapshot(Base):
+    """Google Trends 최신 수집 결과 — 리더가 기록, 모든 워커가 요청 경로에서 읽음"""
+    __tablename__ = "trend_snapshots"
+
+    keyword: Mapped[str] = mapped_column(String(50), primary_key=True)
+    timeframe: Mapped[str] = mapped_column(String(20), primary_key=True)
+    payload: Mapped[dict] = mapped_column(JSON, default=dict)  # trend_stats() 결과
+    fetched_at = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
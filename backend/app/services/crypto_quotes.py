@@ -0,0 +1,126 @@
+"""
+Crypto Quote Service: 암호화폐 시세 일괄 조회
+
+Bybit 공개 시세 API(/v5/market/tickers?category=spot) 1회 호출로
+전체 심볼의 현재가 + 24시간 시가/고가/저가/거래량/변동률을 가져옴 (API 키 불필요)
+짧은 TTL 캐시(stale-while-revalidate) → 대시보드 폴링은 메모리에서 응답
+Bybit 실패 시 yfinance 배치 조회로 현재가만 채우고 24h 필드는 None (값을 지어내지 않음)
+"""
+
+import asyncio
+import logging
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.engines.broker import BybitAdapter
+
+logger = logging.getLogger(__name__)
+
+BYBIT_TICKERS_URL = f"{BybitAdapter.LIVE_URL}/v5/market/tickers"
+
+
+def _round_price(price: float | None) -> float | None:
+    if price is None:
+        return None
+    return round(price, 2) if price > 10 else round(price, 4)
+
+
+def _parse_ticker(symbol: str, t: dict) -> dict | None:
+    try:
+        price = float(t["lastPrice"])
+        open_24h = float(t.get("prevPrice24h") or 0) or price
+        return {
+            "symbol": symbol,
+            "price": price,
+            "open_24h": open_24h,
+            "high_24h": float(t.get("highPrice24h") or price),
+            "low_24h": float(t.get("lowPrice24h") or price),
+            "volume_24h": float(t.get("volume24h") or 0.0),
+            "change_24h": round(float(t.get("price24hPcnt") or 0.0) * 100, 2),
+            "source": "bybit",
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _fallback_quote(symbol: str, price: float) -> dict:
+    """Bybit 실패 시: 현재가만 채우고 24h 필드는 None — 클라이언트는 "데이터 없음"으로 표시"""
+    return {
+        "symbol": symbol,
+        "price": price,
+        "open_24h": None,
+        "high_24h": None,
+        "low_24h": None,
+        "volume_24h": None,
+        "change_24h": None,
+        "source": "fallback",
+    }
+
+
+async def fetch_bybit_tickers(symbols: list[str], client: "httpx.AsyncClient | None" = None) -> dict[str, dict]:
+    """Bybit 현물 티커 1회 조회 → {yfinance 심볼: quote}"""
+    import httpx
+    by_bybit = {BybitAdapter.SYMBOL_MAP.get(s, s.replace("-USD", "USDT")): s for s in symbols}
+    params = {"category": "spot"}
+    if client is None:
+        async with httpx.AsyncClient(timeout=settings.crypto_quote_timeout) as own_client:
+            resp = await own_client.get(BYBIT_TICKERS_URL, params=params)
+    else:
+        resp = await client.get(BYBIT_TICKERS_URL, params=params)
+    resp.raise_for_status()
+    data = resp.json()
+    if data.get("retCode") != 0:
+        raise ValueError(f"Bybit tickers error: {data.get('retMsg')}")
+
+    quotes = {}
+    for t in data.get("result", {}).get("list", []):
+        symbol = by_bybit.get(t.get("symbol"))
+        if symbol:
+            quote = _parse_ticker(symbol, t)
+            if quote:
+                quotes[symbol] = quote
+    return quotes
+
+
+async def fetch_quotes(symbols: list[str]) -> dict[str, dict]:
+    """전체 심볼 시세 — Bybit 1회, 빠진 심볼은 yfinance 배치 1회로 보충"""
+    import httpx
+
+    quotes: dict[str, dict] = {}
+    try:
+        quotes = await fetch_bybit_tickers(symbols)
+    except (httpx.HTTPError, ValueError, KeyError) as e:
+        logger.warning("Bybit tickers unavailable, falling back: %s", e)
+
+    missing = [s for s in symbols if s not in quotes]
+    if missing:
+        from app.engines.market_data import get_current_prices
+        prices = await asyncio.to_thread(get_current_prices, missing)
+        for s in missing:
+            quotes[s] = _fallback_quote(s, prices[s])
+    return quotes
+
+
+class CryptoQuoteService:
+    def __init__(self, symbols: list[str]):
+        self.symbols = list(symbols)
+        self._cache = TTLCache(settings.crypto_quote_ttl, settings.crypto_quote_stale_ttl)
+
+    async def get_quotes(self) -> list[dict]:
+        """심볼 순서대로 시세 목록 (캐시)"""
+        quotes = await self._cache.get("quotes", lambda: fetch_quotes(self.symbols))
+        return [quotes[s] for s in self.symbols if s in quotes]
+
+    @staticmethod
+    def to_response(quote: dict) -> dict:
+        return {
+            "symbol": quote["symbol"],
+            "coin": quote["symbol"].replace("-USD", ""),
+            "price": _round_price(quote["price"]),
+            "change_24h": quote["change_24h"],
+            "open_24h": _round_price(quote["open_24h"]),
+            "high_24h": _round_price(quote["high_24h"]),
+            "low_24h": _round_price(quote["low_24h"]),
+            "volume_24h": None if quote["volume_24h"] is None else round(quote["volume_24h"], 4),
+            "source": quote["source"],
+        }
@@ -0,0 +1,265 @@
+"""
+Cycle Writer: 트레이딩 사이클의 DB 쓰기 경로
+
+- SessionWriter: ORM 세션에 즉시 반영 (단일 PM 실행용, 기존 동작)
+- CycleWriteBuffer: 틱 동안 시그널/거래/포지션 변경을 PM별로 모아두고
+  flush()에서 bulk INSERT + 포지션 반영을 한 트랜잭션으로 처리
+  → 15개 PM 틱이 15+회 커밋(fsync) 대신 1회 커밋
+
+PM 사이클이 실패하면 해당 PM의 버퍼만 폐기 → 거래와 포지션 변경은 항상 함께 커밋되거나 함께 버려짐
+(이미 브로커에서 체결된 거래를 버릴 때는 대사용으로 로그)
+flush가 실패하면 PM별로 재시도 → 문제 PM만 제외, 저장 못 한 체결은 대사용으로 로그
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.metrics import metrics
+from app.models.position import Position
+from app.models.signal import Signal
+from app.models.trade import Trade
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PositionState:
+    quantity: float
+    avg_cost: float
+
+
+class SessionWriter:
+    """쓰기를 세션에 바로 반영 — commit/rollback도 세션에 위임"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._uncommitted: dict[str, _PMWrites] = {}  # 마지막 커밋 이후 추가한 거래 — 롤백 시 대사 로그용
+
+    def _find(self, pm_id: str, symbol: str) -> Optional[Position]:
+        return self.db.query(Position).filter(
+            Position.pm_id == pm_id, Position.symbol == symbol
+        ).first()
+
+    def get_position(self, pm_id: str, symbol: str) -> Optional[PositionState]:
+        pos = self._find(pm_id, symbol)
+        return PositionState(pos.quantity, pos.avg_cost) if pos else None
+
+    def list_positions(self, pm_id: str) -> list[PositionState]:
+        positions = self.db.query(Position).filter(Position.pm_id == pm_id).all()
+        return [PositionState(p.quantity, p.avg_cost) for p in positions]
+
+    def set_position(self, pm_id: str, symbol: str, quantity: float, avg_cost: float) -> None:
+        pos = self._find(pm_id, symbol)
+        if pos:
+            pos.quantity = quantity
+            pos.avg_cost = avg_cost
+        else:
+            self.db.add(Position(pm_id=pm_id, symbol=symbol, quantity=quantity, avg_cost=avg_cost))
+
+    def delete_position(self, pm_id: str, symbol: str) -> None:
+        pos = self._find(pm_id, symbol)
+        if pos:
+            self.db.delete(pos)
+
+    def add_signal(self, **row) -> None:
+        self.db.add(Signal(**row))
+
+    def add_trade(self, order_id: str = "", **row) -> None:
+        self.db.add(Trade(**row))
+        writes = self._uncommitted.setdefault(row.get("pm_id", ""), _PMWrites())
+        writes.trades.append(row)
+        writes.order_ids.append(order_id)
+
+    def staged_trades(self, pm_id: str) -> list[dict]:
+        """세션에 추가됐지만 아직 flush 안 된 거래 (autoflush=False라 쿼리에 안 보임)"""
+        return [
+            {"action": t.action, "reasoning": t.reasoning}
+            for t in self.db.new if isinstance(t, Trade) and t.pm_id == pm_id
+        ]
+
+    def commit(self) -> None:
+        self.db.commit()
+        self._uncommitted = {}
+
+    def rollback(self, reason: str = "cycle rolled back") -> None:
+        self.db.rollback()
+        for pm_id, writes in self._uncommitted.items():
+            log_unsaved_fills(pm_id, writes, reason)
+        self._uncommitted = {}
+
+
+@dataclass
+class _PMWrites:
+    signals: list[dict] = field(default_factory=list)
+    trades: list[dict] = field(default_factory=list)
+    order_ids: list[str] = field(default_factory=list)   # trades와 같은 순서 (DB 컬럼 없음, 대사용)
+    positions: dict[str, Optional[PositionState]] = field(default_factory=dict)  # None = 삭제
+
+
+class BufferedPMWriter:
+    """한 PM의 틱 내 쓰기를 버퍼에 스테이징 (읽기는 스테이징 → DB 순)"""
+
+    def __init__(self, buffer: "CycleWriteBuffer", db: Session, pm_id: str):
+        self._buffer = buffer
+        self.db = db
+        self.pm_id = pm_id
+
+    @property
+    def _writes(self) -> _PMWrites:
+        return self._buffer._pending.setdefault(self.pm_id, _PMWrites())
+
+    def get_position(self, pm_id: str, symbol: str) -> Optional[PositionState]:
+        staged = self._writes.positions
+        if symbol in staged:
+            return staged[symbol]
+        pos = self.db.query(Position).filter(
+            Position.pm_id == pm_id, Position.symbol == symbol
+        ).first()
+        return PositionState(pos.quantity, pos.avg_cost) if pos else None
+
+    def list_positions(self, pm_id: str) -> list[PositionState]:
+        staged = self._writes.positions
+        result = [
+            PositionState(p.quantity, p.avg_cost)
+            for p in self.db.query(Position).filter(Position.pm_id == pm_id).all()
+            if p.symbol not in staged
+        ]
+        result.extend(s for s in staged.values() if s is not None)
+        return result
+
+    def set_position(self, pm_id: str, symbol: str, quantity: float, avg_cost: float) -> None:
+        self._writes.positions[symbol] = PositionState(quantity, avg_cost)
+
+    def delete_position(self, pm_id: str, symbol: str) -> None:
+        self._writes.positions[symbol] = None
+
+    def add_signal(self, **row) -> None:
+        self._writes.signals.append(row)
+
+    def add_trade(self, order_id: str = "", **row) -> None:
+        self._writes.trades.append(row)
+        self._writes.order_ids.append(order_id)
+
+    def staged_trades(self, pm_id: str) -> list[dict]:
+        """이번 틱에 스테이징된 거래 (오래된 순) — 리스크 체크가 미커밋 체결을 반영하도록"""
+        return list(self._writes.trades)
+
+    def commit(self) -> None:
+        """틱 끝 flush에서 함께 커밋"""
+
+    def rollback(self, reason: str = "cycle rolled back") -> None:
+        self._buffer.discard(self.pm_id, reason)
+
+
+def log_unsaved_fills(pm_id: str, writes: _PMWrites, reason: str) -> None:
+    """브로커에서 체결됐지만 DB에 저장하지 못한 거래 — 브로커와 대사할 수 있도록 체결 단위로 기록"""
+    for row, order_id in zip(writes.trades, writes.order_ids):
+        metrics.event("fills_unsaved")
+        logger.error(
+            "Unsaved fill — pm=%s symbol=%s side=%s qty=%s price=%s order_id=%s reason=%s",
+            pm_id, row.get("symbol"), row.get("action"), row.get("quantity"), row.get("price"),
+            order_id or "-", reason,
+        )
+
+
+class CycleWriteBuffer:
+    """틱 단위 쓰기 버퍼"""
+
+    def __init__(self):
+        self._pending: dict[str, _PMWrites] = {}
+        self._flushed: dict[str, _PMWrites] = {}   # flush 후 커밋 전 — 커밋 실패 시 대사 로그용
+        self.failed: list[str] = []                # 마지막 flush에서 저장하지 못한 PM
+
+    def writer(self, db: Session, pm_id: str) -> BufferedPMWriter:
+        return BufferedPMWriter(self, db, pm_id)
+
+    def discard(self, pm_id: str, reason: str = "cycle discarded") -> None:
+        """PM 스테이징 폐기 — 이미 체결된 거래가 있으면 대사 로그"""
+        writes = self._pending.pop(pm_id, None)
+        if writes is not None:
+            log_unsaved_fills(pm_id, writes, reason)
+
+    def flush(self, db: Session) -> dict:
+        """
+        스테이징된 변경을 세션에 반영 (커밋은 호출자 — 재평가와 같은 트랜잭션으로 묶기 위함)
+        포지션은 PM별로 소수라 ORM, 시그널/거래는 bulk INSERT 1회씩
+        bulk 반영이 실패하면 롤백 후 PM별로 반영·커밋 → 실패한 PM만 제외 (self.failed)
+        (pysqlite는 SAVEPOINT RELEASE가 바깥 트랜잭션까지 커밋하므로 savepoint 대신 PM별 커밋)
+        """
+        pending, self._pending = self._pending, {}
+        self.failed = []
+        try:
+            counts = self._apply(db, pending)
+            self._flushed = pending
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning("Cycle buffer bulk flush failed, retrying per PM: %s", e)
+            counts = self._flush_each(db, pending)
+            self._flushed = {}
+        logger.info(
+            "Cycle buffer flushed — %d signals, %d trades, %d position changes",
+            counts["signals"], counts["trades"], counts["positions"],
+        )
+        return counts
+
+    def _flush_each(self, db: Session, pending: dict[str, _PMWrites]) -> dict:
+        counts = {"signals": 0, "trades": 0, "positions": 0}
+        for pm_id, writes in pending.items():
+            try:
+                pm_counts = self._apply(db, {pm_id: writes})
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                self.failed.append(pm_id)
+                log_unsaved_fills(pm_id, writes, f"flush failed: {e}")
+                continue
+            for key, value in pm_counts.items():
+                counts[key] += value
+        return counts
+
+    def report_unsaved(self, reason: str) -> None:
+        """flush 이후 커밋이 실패했을 때 호출 — flush된 체결 전부를 대사 로그로 남김"""
+        for pm_id, writes in self._flushed.items():
+            log_unsaved_fills(pm_id, writes, reason)
+        self._flushed = {}
+
+    @staticmethod
+    def _apply(db: Session, pending: dict[str, _PMWrites]) -> dict:
+        signals: list[dict] = []
+        trades: list[dict] = []
+        position_changes = 0
+        for pm_id, writes in pending.items():
+            signals.extend(writes.signals)
+            trades.extend(writes.trades)
+            if writes.positions:
+                existing = {
+                    p.symbol: p
+                    for p in db.query(Position).filter(
+                        Position.pm_id == pm_id,
+                        Position.symbol.in_(list(writes.positions)),
+                    ).all()
+                }
+                for symbol, state in writes.positions.items():
+                    pos = existing.get(symbol)
+                    if state is None:
+                        if pos:
+                            db.delete(pos)
+                    elif pos:
+                        pos.quantity = state.quantity
+                        pos.avg_cost = state.avg_cost
+                    else:
+                        db.add(Position(pm_id=pm_id, symbol=symbol,
+                                        quantity=state.quantity, avg_cost=state.avg_cost))
+                    position_changes += 1
+
+        if signals:
+            db.execute(insert(Signal), signals)
+        if trades:
+            db.execute(insert(Trade), trades)
+        db.flush()
+        return {"signals": len(signals), "trades": len(trades), "positions": position_changes}
@@ -0,0 +1,276 @@
+"""
+Dashboard Service: 대시보드 페이로드 빌더
+
+각 대시보드 엔드포인트(stats, pms, pm-performance, nav history, exposure, heatmap,
+risk overview, trades)의 응답을 메모리 상의 PM/포지션/NAV/거래 목록에서 만드는 순수 함수 모음.
+개별 엔드포인트와 /api/fund/dashboard/snapshot이 같은 빌더를 공유 →
+스냅샷은 DB를 한 번 읽고(load_snapshot) 포지션 집계(PositionAggregate)도 한 번만 계산
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.nav_history import NAVHistory
+from app.models.pm import PM
+from app.models.position import Position
+from app.models.trade import Trade
+
+# 섹터 분류 (간소화)
+SYMBOL_SECTORS = {
+    "AAPL": "Technology", "MSFT": "Technology", "GOOGL": "Technology",
+    "AMZN": "Consumer", "META": "Technology", "NVDA": "Technology",
+    "TSLA": "Automotive", "COIN": "Crypto", "MSTR": "Crypto",
+    "BTC-USD": "Crypto", "ETH-USD": "Crypto", "SOL-USD": "Crypto",
+    "SPY": "Index ETF", "QQQ": "Index ETF", "IWM": "Index ETF",
+    "TLT": "Bonds", "GLD": "Commodities", "UUP": "Currencies",
+    "VIX": "Volatility", "UVXY": "Volatility", "SQQQ": "Inverse ETF",
+    "EWJ": "Asia ETF", "EWY": "Asia ETF", "FXI": "Asia ETF",
+    "GME": "Meme", "AMC": "Meme",
+}
+
+
+def _itd(pm: PM) -> float:
+    return (
+        (pm.current_capital - pm.initial_capital) / pm.initial_capital * 100
+        if pm.initial_capital > 0 else 0.0
+    )
+
+
+# ── 포지션 집계 (exposure / heatmap / risk 공용) ─────────────
+
+@dataclass
+class PositionAggregate:
+    long_value: float = 0.0
+    short_value: float = 0.0
+    by_sector: dict[str, dict] = field(default_factory=dict)   # 섹터 → {symbols, total_value}
+    by_pm: dict[str, float] = field(default_factory=dict)      # pm_id → |평가액| 합 (포지션 등장 순서 유지)
+
+    @classmethod
+    def build(cls, positions: Iterable[Position]) -> "PositionAggregate":
+        agg = cls()
+        for p in positions:
+            val = p.quantity * p.avg_cost
+            if p.quantity > 0:
+                agg.long_value += val
+            elif p.quantity < 0:
+                agg.short_value += abs(p.quantity) * p.avg_cost
+
+            sector = SYMBOL_SECTORS.get(p.symbol, "Other")
+            bucket = agg.by_sector.setdefault(sector, {"symbols": [], "total_value": 0.0})
+            if p.symbol not in bucket["symbols"]:
+                bucket["symbols"].append(p.symbol)
+            bucket["total_value"] += val
+
+            agg.by_pm[p.pm_id] = agg.by_pm.get(p.pm_id, 0.0) + abs(val)
+        return agg
+
+
+# ── 페이로드 빌더 ────────────────────────────────────────
+
+def build_fund_stats(active_pms: list[PM], last_two_nav: list[NAVHistory], total_positions: int) -> dict:
+    """last_two_nav: 최신순 NAV 기록 최대 2개"""
+    total_capital = sum(pm.current_capital for pm in active_pms)
+    initial_total = sum(pm.initial_capital for pm in active_pms)
+    today_return = last_two_nav[0].daily_return * 100 if len(last_two_nav) >= 1 else 0.0
+    prior_day_return = last_two_nav[1].daily_return * 100 if len(last_two_nav) >= 2 else 0.0
+    itd_return = (
+        ((total_capital - initial_total) / initial_total * 100)
+        if initial_total > 0
+        else 0.0
+    )
+    return {
+        "nav": round(total_capital, 2),
+        "today_return": round(today_return, 4),
+        "prior_day_return": round(prior_day_return, 4),
+        "itd_return": round(itd_return, 2),
+        "active_pms": len(active_pms),
+        "total_positions": total_positions,
+    }
+
+
+def build_pm_list(active_pms: list[PM]) -> list[dict]:
+    return [
+        {
+            "id": pm.id,
+            "name": pm.name,
+            "emoji": pm.emoji,
+            "strategy": pm.strategy,
+            "llm_provider": pm.llm_provider,
+            "broker_type": pm.broker_type,
+            "current_capital": round(pm.current_capital, 2),
+            "itd_return": round(_itd(pm), 2),
+        }
+        for pm in sorted(active_pms, key=lambda pm: pm.id)
+    ]
+
+
+def build_pm_performance(active_pms: list[PM], trade_counts: dict[str, int]) -> dict:
+    result = [
+        {
+            "id": pm.id,
+            "name": pm.name,
+            "emoji": pm.emoji,
+            "strategy": pm.strategy,
+            "llm_provider": pm.llm_provider,
+            "current_capital": round(pm.current_capital, 2),
+            "itd_return": round(_itd(pm), 2),
+            "trade_count": trade_counts.get(pm.id, 0),
+        }
+        for pm in active_pms
+    ]
+    result.sort(key=lambda x: x["itd_return"], reverse=True)
+    return {"pms": result}
+
+
+def build_nav_history(records: list[NAVHistory]) -> dict:
+    """records: 오래된 순"""
+    data = []
+    initial_nav = None
+    for r in records:
+        if initial_nav is None:
+            initial_nav = r.nav
+        cum_return = ((r.nav - initial_nav) / initial_nav * 100) if initial_nav and initial_nav > 0 else 0.0
+        data.append({
+            "date": r.recorded_at.strftime("%Y-%m-%d") if r.recorded_at else "",
+            "nav": round(r.nav, 2),
+            "daily_return_pct": round(r.daily_return * 100, 4),
+            "cumulative_return_pct": round(cum_return, 4),
+        })
+    return {"history": data, "count": len(data)}
+
+
+def build_exposure(active_pms: list[PM], agg: PositionAggregate) -> dict:
+    total_nav = sum(pm.current_capital for pm in active_pms)
+    net = agg.long_value - agg.short_value
+    gross = agg.long_value + agg.short_value
+
+    pm_map = {pm.id: pm for pm in active_pms}
+    pm_exposure = []
+    for pm_id, value in agg.by_pm.items():
+        pm = pm_map.get(pm_id)
+        value = round(value, 2)
+        pm_exposure.append({
+            "pm_id": pm_id,
+            "pm_name": pm.name if pm else pm_id,
+            "pm_emoji": pm.emoji if pm else "🤖",
+            "value": value,
+            "pct": round(value / total_nav * 100, 2) if total_nav > 0 else 0,
+        })
+
+    return {
+        "net_exposure": {
+            "long": round(agg.long_value, 2),
+            "short": round(agg.short_value, 2),
+            "net": round(net, 2),
+            "gross": round(gross, 2),
+            "net_pct": round(net / total_nav * 100, 1) if total_nav > 0 else 0,
+            "gross_pct": round(gross / total_nav * 100, 1) if total_nav > 0 else 0,
+        },
+        "pm_exposure": sorted(pm_exposure, key=lambda x: x["value"], reverse=True),
+        "conflicts": [],
+    }
+
+
+def build_heatmap(active_pms: list[PM], agg: PositionAggregate) -> dict:
+    total_nav = sum(pm.current_capital for pm in active_pms)
+    sectors = []
+    for sector, bucket in agg.by_sector.items():
+        value = round(bucket["total_value"], 2)
+        sectors.append({
+            "sector": sector,
+            "symbols": list(bucket["symbols"]),
+            "total_value": value,
+            "pct": round(value / total_nav * 100, 2) if total_nav > 0 else 0,
+        })
+    return {
+        "sectors": sorted(sectors, key=lambda x: x["total_value"], reverse=True),
+        "total_nav": round(total_nav, 2),
+    }
+
+
+def build_risk_overview(active_pms: list[PM], agg: PositionAggregate) -> dict:
+    total_nav = sum(pm.current_capital for pm in active_pms)
+    gross_pct = (
+        ((agg.long_value + agg.short_value) / total_nav * 100) if total_nav > 0 else 0
+    )
+    net_pct = (
+        ((agg.long_value - agg.short_value) / total_nav * 100) if total_nav > 0 else 0
+    )
+    return {
+        "exposure": {"gross_pct": round(gross_pct, 1), "net_pct": round(net_pct, 1)},
+        "margin": {"utilization_pct": 0.0},
+        "vix": None,
+        "active_conditions": 0,
+        "concentration": {
+            "top_ticker": None,
+            "top_sector": None,
+        },
+        "decisions_24h": {
+            "approval_rate": 100.0,
+            "total": 0,
+            "approved": 0,
+            "rejected": 0,
+        },
+    }
+
+
+def build_trades(trades: list[Trade], all_pms: list[PM]) -> dict:
+    pms = {pm.id: pm for pm in all_pms}
+    return {
+        "trades": [
+            {
+                "id": t.id,
+                "pm_id": t.pm_id,
+                "pm_name": pms.get(t.pm_id, PM(name=t.pm_id, emoji="🤖")).name,
+                "pm_emoji": pms.get(t.pm_id, PM(name=t.pm_id, emoji="🤖")).emoji,
+                "symbol": t.symbol,
+                "action": t.action,
+                "quantity": round(t.quantity, 4),
+                "price": round(t.price, 2),
+                "value": round(t.quantity * t.price, 2),
+                "conviction": round(t.conviction_score, 3),
+                "reasoning": t.reasoning,
+                "sector": SYMBOL_SECTORS.get(t.symbol, "Other"),
+                "executed_at": (t.executed_at.isoformat() + "Z") if t.executed_at else None,
+            }
+            for t in trades
+        ]
+    }
+
+
+# ── 스냅샷 ────────────────────────────────────────────
+
+def load_snapshot(db: Session, nav_limit: int = 90, trade_limit: int = 50) -> dict:
+    """
+    대시보드 전체를 한 트랜잭션의 읽기로 구성
+    PM 1회 + 포지션 1회 + NAV 1회 + 최근 거래 1회 + PM별 거래 수 GROUP BY 1회
+    """
+    from app.core.scheduler import get_status as get_scheduler_status
+
+    if db.get_bind().dialect.name == "postgresql":
+        # 여러 SELECT가 같은 스냅샷을 보도록 (첫 쿼리 전에 설정해야 함)
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    all_pms = db.query(PM).all()
+    positions = db.query(Position).all()
+    nav_records = db.query(NAVHistory).order_by(NAVHistory.id.desc()).limit(nav_limit).all()
+    trades = db.query(Trade).order_by(Trade.executed_at.desc()).limit(trade_limit).all()
+    trade_counts = dict(db.query(Trade.pm_id, func.count(Trade.id)).group_by(Trade.pm_id).all())
+
+    active_pms = [pm for pm in all_pms if pm.is_active]
+    agg = PositionAggregate.build(positions)
+
+    return {
+        "stats": build_fund_stats(active_pms, nav_records[:2], len(positions)),
+        "pms": build_pm_list(active_pms),
+        "pm_performance": build_pm_performance(active_pms, trade_counts),
+        "nav_history": build_nav_history(list(reversed(nav_records))),
+        "exposure": build_exposure(active_pms, agg),
+        "heatmap": build_heatmap(active_pms, agg),
+        "risk_overview": build_risk_overview(active_pms, agg),
+        "scheduler": get_scheduler_status(),
+        "recent_trades": build_trades(trades, all_pms),
+    }
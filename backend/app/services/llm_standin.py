@@ -0,0 +1,296 @@
+"""
+LLM Stand-in Server: 오프라인 부하/지연 테스트용 로컬 LLM 프로바이더
+
+- Anthropic Messages (POST /v1/messages)
+- OpenAI / Grok Chat Completions (POST /v1/chat/completions)
+- Gemini generateContent (POST /v1beta/models/{model}:generateContent)
+- 응답은 DECISION_SCHEMA를 만족하는 JSON (프롬프트의 composite_score를 따라 BUY/SELL/HOLD)
+  배치 프롬프트면 종목별 결정 배열 (JSON 모드 Chat Completions는 {"decisions": [...]})
+- 지연 분포(fixed/uniform/lognormal/exponential) + 오류율(429/500/503·529) + hang 비율
+  → 수백 PM 규모에서 동시성 제한·타임아웃·폴백을 실제 SDK 경로 그대로 벤치마크
+- usage에 프롬프트 캐시 흉내 (같은 system prefix 반복 시 cache read 토큰)
+- GET/PUT /standin/config: 실행 중 분포·오류율 변경, GET /standin/stats: 요청/오류 카운트
+
+사용: python -m app.services.llm_standin --port 8900 --latency-ms 800 --error-rate 0.05
+      (.env: ANTHROPIC_BASE_URL=http://localhost:8900, OPENAI_BASE_URL=http://localhost:8900/v1, ...)
+"""
+
+import asyncio
+import json
+import re
+import time
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass, replace
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal", "exponential")
+
+_SCORE_RE = re.compile(r'"composite_score":\s*(-?\d+(?:\.\d+)?)')
+_SYMBOL_RE = re.compile(r"Symbol:\s*([A-Z0-9.\-]+)")
+_BATCH_LINE_RE = re.compile(r"^- ([A-Z0-9.\-]+): (\{.*\})$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    latency: str = "lognormal"
+    latency_ms: float = 800.0        # 중앙값
+    latency_sigma: float = 0.5       # lognormal 꼬리
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    hang_seconds: float = 120.0      # timeout_rate에 걸린 요청의 대기 시간
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.latency}")
+        if not 0.0 <= self.error_rate + self.timeout_rate <= 1.0:
+            raise ValueError("error_rate + timeout_rate must be within [0, 1]")
+
+    @classmethod
+    def from_settings(cls) -> "StandInConfig":
+        return cls(
+            latency=settings.llm_standin_latency,
+            latency_ms=settings.llm_standin_latency_ms,
+            latency_sigma=settings.llm_standin_latency_sigma,
+            error_rate=settings.llm_standin_error_rate,
+            timeout_rate=settings.llm_standin_timeout_rate,
+            seed=settings.llm_standin_seed,
+        )
+
+    def sample_latency(self, rng: np.random.Generator) -> float:
+        """지연 (초)"""
+        median = self.latency_ms / 1000
+        if self.latency == "fixed":
+            return median
+        if self.latency == "uniform":
+            return float(rng.uniform(0.0, 2 * median))
+        if self.latency == "exponential":
+            return float(rng.exponential(median / np.log(2)))
+        return float(median * np.exp(self.latency_sigma * rng.standard_normal()))
+
+
+def decide(prompt: str, rng: np.random.Generator) -> dict:
+    """프롬프트의 종합 점수로 결정 (점수가 없으면 무작위) — 항상 스키마 준수"""
+    match = _SCORE_RE.search(prompt)
+    score = float(match.group(1)) if match else float(rng.uniform(-1, 1))
+    symbol = _SYMBOL_RE.search(prompt)
+    action = "BUY" if score > 0.2 else "SELL" if score < -0.2 else "HOLD"
+    return {
+        "action": action,
+        "conviction": round(min(abs(score) + 0.3, 1.0), 3),
+        "reasoning": f"stand-in: {symbol.group(1) if symbol else 'symbol'} composite {score:+.2f}"[:200],
+        "position_size": round(min(abs(score) * 0.1, 0.1), 3),
+    }
+
+
+def respond(prompt: str, rng: np.random.Generator, json_object: bool = False) -> str:
+    """
+    응답 텍스트: 배치 프롬프트("- SYM: {시그널}" 줄)면 종목별 결정 배열, 아니면 단일 결정
+    json_object: Chat Completions JSON 모드 → 배열을 {"decisions": [...]}로 감쌈
+    """
+    lines = _BATCH_LINE_RE.findall(prompt)
+    if not lines:
+        return json.dumps(decide(prompt, rng))
+    decisions = [{"symbol": sym, **decide(f"Symbol: {sym} {signals}", rng)} for sym, signals in lines]
+    return json.dumps({"decisions": decisions} if json_object else decisions)
+
+
+# ── 프로바이더별 에러 포맷 ───────────────────────────────────
+
+def _anthropic_error(status: int) -> JSONResponse:
+    kind = {429: "rate_limit_error", 529: "overloaded_error"}.get(status, "api_error")
+    body = {"type": "error", "error": {"type": kind, "message": f"stand-in {status}"}}
+    return JSONResponse(body, status_code=status)
+
+
+def _openai_error(status: int) -> JSONResponse:
+    kind = "rate_limit_exceeded" if status == 429 else "server_error"
+    body = {"error": {"message": f"stand-in {status}", "type": kind, "code": kind}}
+    return JSONResponse(body, status_code=status)
+
+
+def _gemini_error(status: int) -> JSONResponse:
+    state = {429: "RESOURCE_EXHAUSTED", 503: "UNAVAILABLE"}.get(status, "INTERNAL")
+    body = {"error": {"code": status, "message": f"stand-in {status}", "status": state}}
+    return JSONResponse(body, status_code=status)
+
+
+def _tokens(text: str) -> int:
+    return max(len(text) // 4, 1)
+
+
+def create_app(config: StandInConfig | None = None) -> FastAPI:
+    app = FastAPI(title="LLM Stand-in", docs_url=None, redoc_url=None)
+    state = {"config": config or StandInConfig.from_settings()}
+    state["rng"] = np.random.default_rng(state["config"].seed)
+    stats: Counter = Counter()
+    cached_prefixes: set[str] = set()
+
+    def _prefix_cache(prefix: str) -> tuple[int, int]:
+        """프롬프트 캐시 흉내: 같은 prefix 두 번째부터 (읽기 토큰, 생성 토큰)"""
+        if not prefix:
+            return 0, 0
+        if prefix in cached_prefixes:
+            return _tokens(prefix), 0
+        cached_prefixes.add(prefix)
+        return 0, _tokens(prefix)
+
+    async def _simulate(provider: str, overloaded_status: int) -> int | None:
+        """지연 대기 후 주입할 오류 상태 코드 반환 (None = 정상 응답)"""
+        cfg: StandInConfig = state["config"]
+        rng: np.random.Generator = state["rng"]
+        stats[f"{provider}_requests"] += 1
+        roll = rng.random()
+        if roll < cfg.timeout_rate:
+            stats["timeouts"] += 1
+            await asyncio.sleep(cfg.hang_seconds)
+        await asyncio.sleep(cfg.sample_latency(rng))
+        if roll < cfg.timeout_rate + cfg.error_rate:
+            stats["errors"] += 1
+            return int(rng.choice([429, 500, overloaded_status]))
+        return None
+
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        body = await request.json()
+        status = await _simulate("anthropic", 529)
+        if status:
+            return _anthropic_error(status)
+        prompt = "\n".join(
+            m["content"] if isinstance(m["content"], str) else "\n".join(b.get("text", "") for b in m["content"])
+            for m in body.get("messages", [])
+        )
+        text = respond(prompt, state["rng"])
+        system = body.get("system") or ""
+        blocks = [{"text": system}] if isinstance(system, str) else system
+        system_text = "".join(b.get("text", "") for b in blocks)
+        usage = {"input_tokens": _tokens(prompt), "output_tokens": _tokens(text)}
+        if any(b.get("cache_control") for b in blocks):
+            usage["cache_read_input_tokens"], usage["cache_creation_input_tokens"] = _prefix_cache(system_text)
+        else:
+            usage["input_tokens"] += _tokens(system_text) if system_text else 0
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "stand-in"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": usage,
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        status = await _simulate("openai", 503)
+        if status:
+            return _openai_error(status)
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []) if m.get("role") == "user")
+        json_object = (body.get("response_format") or {}).get("type") == "json_object"
+        text = respond(prompt, state["rng"], json_object=json_object)
+        # 자동 prefix 캐시: system 메시지가 반복되면 cached_tokens
+        system_text = "".join(str(m.get("content", "")) for m in body.get("messages", []) if m.get("role") == "system")
+        cached, _ = _prefix_cache(system_text)
+        prompt_tokens = _tokens(system_text + prompt)
+        completion_tokens = _tokens(text)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stand-in"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached},
+            },
+        }
+
+    @app.post("/v1beta/models/{model}:generateContent")
+    async def generate_content(model: str, request: Request):
+        body = await request.json()
+        status = await _simulate("gemini", 503)
+        if status:
+            return _gemini_error(status)
+        prompt = "\n".join(
+            part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", [])
+        )
+        text = respond(prompt, state["rng"])
+        return {
+            "candidates": [{
+                "content": {"role": "model", "parts": [{"text": text}]},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {
+                "promptTokenCount": _tokens(prompt),
+                "candidatesTokenCount": _tokens(text),
+                "totalTokenCount": _tokens(prompt) + _tokens(text),
+            },
+            "modelVersion": model,
+        }
+
+    @app.get("/standin/config")
+    async def get_config():
+        return asdict(state["config"])
+
+    @app.put("/standin/config")
+    async def put_config(request: Request):
+        try:
+            cfg = replace(state["config"], **await request.json())
+        except (TypeError, ValueError) as e:
+            return JSONResponse({"detail": str(e)}, status_code=422)
+        if cfg.seed != state["config"].seed:
+            state["rng"] = np.random.default_rng(cfg.seed)
+        state["config"] = cfg
+        return asdict(cfg)
+
+    @app.get("/standin/stats")
+    async def get_stats():
+        return dict(stats)
+
+    return app
+
+
+def main() -> None:  # pragma: no cover
+    import argparse
+
+    import uvicorn
+
+    defaults = StandInConfig.from_settings()
+    parser = argparse.ArgumentParser(description="Local stand-in LLM provider server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--latency-sigma", type=float, default=defaults.latency_sigma)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--timeout-rate", type=float, default=defaults.timeout_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,81 @@
+"""
+Revaluation Service: PM 자본 일괄 재평가
+PM 자본 = 현금 잔고(자본 - 포지션 취득원가) + 포지션 현재가 평가액
+
+PM + 포지션 조인 쿼리 1회 → 가격 벡터 1회(배치 조회) → numpy 벡터 연산 → bulk UPDATE 1회
+틱이 끝날 때 체결된 PM들을 한 번에 재평가 (커밋은 호출자 책임)
+"""
+
+import logging
+from typing import Iterable, Optional
+
+import numpy as np
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.pm import PM
+from app.models.position import Position
+
+logger = logging.getLogger(__name__)
+
+
+def revalue_pms(
+    db: Session,
+    pm_ids: Iterable[str],
+    prices: Optional[dict[str, float]] = None,
+) -> dict[str, float]:
+    """
+    pm_ids의 current_capital을 재계산해 한 번의 bulk UPDATE로 기록.
+    prices: 이미 알고 있는 현재가 (예: 시그널 매트릭스) — 없는 종목만 배치 조회
+    Returns {pm_id: new_capital}
+    """
+    ids = sorted(set(pm_ids))
+    if not ids:
+        return {}
+
+    db.flush()  # 세션에 쌓인 포지션 변경을 쿼리에 반영
+    rows = (
+        db.query(PM.id, PM.current_capital, Position.symbol, Position.quantity, Position.avg_cost)
+        .outerjoin(Position, Position.pm_id == PM.id)
+        .filter(PM.id.in_(ids))
+        .all()
+    )
+    if not rows:
+        return {}
+
+    pm_index = {pm_id: i for i, pm_id in enumerate(sorted({r[0] for r in rows}))}
+    capital = np.zeros(len(pm_index))
+    for r in rows:
+        capital[pm_index[r[0]]] = r[1]
+
+    held = [r for r in rows if r[2] is not None]
+    book = np.zeros(len(pm_index))
+    market = np.zeros(len(pm_index))
+    if held:
+        known = dict(prices or {})
+        missing = {r[2] for r in held} - known.keys()
+        if missing:
+            from app.engines.market_data import get_current_prices
+            known.update(get_current_prices(missing))
+
+        codes = np.array([pm_index[r[0]] for r in held])
+        qty = np.array([r[3] for r in held], dtype=float)
+        cost = np.array([r[4] for r in held], dtype=float)
+        px = np.array([known[r[2]] for r in held], dtype=float)
+        book = np.bincount(codes, weights=qty * cost, minlength=len(pm_index))
+        market = np.bincount(codes, weights=qty * px, minlength=len(pm_index))
+
+    cash = np.maximum(capital - book, 0.0)
+    new_capital = np.round(cash + market, 2)
+    result = {pm_id: float(new_capital[i]) for pm_id, i in pm_index.items()}
+
+    db.execute(update(PM), [{"id": pm_id, "current_capital": v} for pm_id, v in result.items()])
+
+    # bulk UPDATE는 세션 객체를 갱신하지 않으므로 로드된 PM 인스턴스에 반영
+    for obj in list(db.identity_map.values()):
+        if isinstance(obj, PM) and obj.id in result:
+            set_committed_value(obj, "current_capital", result[obj.id])
+
+    logger.info("Revalued %d PMs", len(result))
+    return result
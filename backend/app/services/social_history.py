@@ -0,0 +1,115 @@
+"""
+Social History Service: 소셜 언급량 시계열 기록 + 지수가중 통계 기반 z-score
+
+수집할 때마다 social_mentions에 1행 추가(append-only)하고,
+심볼·소스별 지수가중 mean/variance(EWMA)를 갱신 → 과거 행을 다시 읽지 않고 O(1)로 z-score 계산
+관측치가 적을 때는 가중치 1/n(누적 Welford와 동일)으로 시작해 settings.social_zscore_window 이후
+최근 관측치 위주로 기준선이 따라감 — 언급량 수준이 바뀌어도 z-score가 영구히 치우치지 않음
+z-score 정의는 SocialEngine.calculate_zscore와 같음: (현재값 - 이전 평균) / 이전 표준편차
+"""
+
+import logging
+import math
+from typing import Iterable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.social_mention import SocialMention, SocialMentionStats
+
+logger = logging.getLogger(__name__)
+
+MIN_HISTORY = 2  # calculate_zscore와 동일: 이전 관측치 2개 미만이면 0
+
+
+def running_zscore(count: int, mean: float, m2: float, value: float) -> float:
+    """이전 관측치 통계 대비 value의 z-score (m2 / count = 분산)"""
+    if count < MIN_HISTORY:
+        return 0.0
+    std = math.sqrt(m2 / count)
+    if std == 0:
+        return 0.0
+    return (value - mean) / std
+
+
+def _ewma_alpha() -> float:
+    from app.config import settings
+    return 2.0 / (max(settings.social_zscore_window, 1) + 1)
+
+
+def _ewma_update(stats: SocialMentionStats, value: float) -> None:
+    """
+    지수가중 mean/variance 갱신. alpha = max(1/n, 2/(window+1)) —
+    1/n 구간에서는 누적 Welford와 같은 값, 이후에는 고정 가중치로 오래된 관측치를 잊음.
+    분산은 m2 / count 형태로 저장 (running_zscore와 동일한 해석)
+    """
+    count = (stats.count or 0) + 1
+    mean = stats.mean or 0.0
+    variance = (stats.m2 or 0.0) / (count - 1) if count > 1 else 0.0
+    alpha = max(1.0 / count, _ewma_alpha())
+    delta = value - mean
+    stats.mean = mean + alpha * delta
+    stats.m2 = (1.0 - alpha) * (variance + alpha * delta * delta) * count
+    stats.count = count
+
+
+def record_mentions(db: Session, observations: Iterable[dict]) -> dict[str, float]:
+    """
+    수집 결과(symbol, source, mention_count, sentiment, timestamp)를 시계열에 기록하고 z-score 반환.
+    같은 수집 결과(timestamp 동일 — 캐시 재사용)는 다시 기록하지 않고 직전 z-score 반환.
+    커밋은 호출자 책임. Returns {symbol: zscore}
+    """
+    observations = list(observations)
+    if not observations:
+        return {}
+
+    symbols = {o["symbol"] for o in observations}
+    stats_by_key = {
+        (s.symbol, s.source): s
+        for s in db.query(SocialMentionStats).filter(SocialMentionStats.symbol.in_(symbols)).all()
+    }
+
+    rows: list[dict] = []
+    zscores: dict[str, float] = {}
+    for obs in observations:
+        key = (obs["symbol"], obs["source"])
+        observed = str(obs.get("timestamp", ""))
+        stats = stats_by_key.get(key)
+        if stats is None:
+            stats = SocialMentionStats(symbol=key[0], source=key[1], count=0, mean=0.0, m2=0.0)
+            db.add(stats)
+            stats_by_key[key] = stats
+        elif observed and stats.last_observed == observed:
+            zscores[obs["symbol"]] = stats.last_zscore or 0.0
+            continue
+
+        value = float(obs["mention_count"])
+        z = running_zscore(stats.count or 0, stats.mean or 0.0, stats.m2 or 0.0, value)
+        _ewma_update(stats, value)
+        stats.last_zscore = z
+        stats.last_observed = observed
+        zscores[obs["symbol"]] = z
+        rows.append({
+            "symbol": key[0],
+            "source": key[1],
+            "mention_count": value,
+            "sentiment": float(obs.get("sentiment", 0.0)),
+        })
+
+    if rows:
+        db.execute(insert(SocialMention), rows)
+    db.flush()
+    logger.debug("Recorded %d social mention observations", len(rows))
+    return zscores
+
+
+def mention_history(db: Session, symbol: str, source: str, limit: int = 100) -> list[float]:
+    """최근 언급량 시계열 (오래된 순)"""
+    rows = (
+        db.query(SocialMention.mention_count)
+        .filter(SocialMention.symbol == symbol, SocialMention.source == source)
+        .order_by(SocialMention.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return [r[0] for r in reversed(rows)]
@@ -0,0 +1,135 @@
+"""
+벤치마크 공용 픽스처 — 완전 오프라인 (mock 시세 + PaperAdapter + LLM 키 없음)
+
+설치:   pip install -e ".[bench]"
+비교:   pytest benchmarks --benchmark-storage=benchmarks/baselines --benchmark-compare=0001 --benchmark-compare-fail=mean:20%
+        (커밋된 기준선 baselines/Linux-CPython-3.11-64bit/0001_baseline.json 대비 평균 20% 이상 느려지면 실패)
+기준선 갱신: pytest benchmarks --benchmark-storage=benchmarks/baselines --benchmark-save=baseline
+        → 새 번호(0002_...)로 저장되므로 이전 파일을 지우고 커밋, 비교 대상 번호도 함께 변경
+기준선은 기록한 머신/파이썬 기준 — 다른 환경에서는 먼저 같은 명령으로 로컬 기준선을 만든 뒤 비교
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import settings
+from app.db.base import Base, get_db
+from app.main import app
+from app.models.pm import PM
+from app.models.position import Position
+from app.models.trade import Trade
+
+# 대형 합성 DB 규모
+N_POSITIONS = 2_000
+N_TRADES = 50_000
+NAV_DAYS = 365          # 5분 간격 → ≈10만 행
+
+SYMBOLS = ["SPY", "QQQ", "AAPL", "MSFT", "NVDA", "TSLA", "META", "GLD", "TLT", "BTC-USD", "ETH-USD", "GME"]
+
+_OFFLINE_SETTINGS = [
+    "anthropic_api_key", "openai_api_key", "gemini_api_key", "grok_api_key", "deepseek_api_key",
+    "kis_app_key", "kis_app_secret", "bybit_api_key", "bybit_api_secret", "alpaca_api_key",
+]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def offline():
+    """외부 API 차단: yfinance → mock 시세, 브로커 → PaperAdapter, LLM → 키 없음 폴백, 워커 풀 비활성"""
+    mp = pytest.MonkeyPatch()
+    mp.setattr("app.engines.market_data.YFINANCE_AVAILABLE", False)
+    for name in _OFFLINE_SETTINGS:
+        mp.setattr(settings, name, "")
+    mp.setattr(settings, "worker_processes", 0)
+    yield
+    mp.undo()
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = factory()
+    from app.db.seed import seed_pms
+    seed_pms(db)
+    db.close()
+    yield factory
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def large_db(session_factory):
+    """포지션 2천 + 거래 5만 + NAV ≈10만 행 합성 DB"""
+    from datetime import datetime, timedelta
+
+    from app.engines.trading_cycle import seed_nav_history
+
+    db = session_factory()
+    rng = np.random.default_rng(7)
+    pm_ids = [pm.id for pm in db.query(PM).all()]
+    now = datetime.utcnow()
+
+    db.execute(insert(Position.__table__), [
+        {
+            "pm_id": pm_ids[i % len(pm_ids)],
+            "symbol": SYMBOLS[int(rng.integers(len(SYMBOLS)))],
+            "quantity": float(rng.uniform(-50, 100)),
+            "avg_cost": float(rng.uniform(10, 1_000)),
+        }
+        for i in range(N_POSITIONS)
+    ])
+    db.execute(insert(Trade.__table__), [
+        {
+            "pm_id": pm_ids[i % len(pm_ids)],
+            "symbol": SYMBOLS[int(rng.integers(len(SYMBOLS)))],
+            "action": "BUY" if i % 2 else "SELL",
+            "quantity": float(rng.uniform(1, 100)),
+            "price": float(rng.uniform(10, 1_000)),
+            "conviction_score": float(rng.uniform(0, 1)),
+            "reasoning": f"bench (P&L: ${rng.normal(0, 500):+.2f})",
+            "executed_at": now - timedelta(minutes=i),
+        }
+        for i in range(N_TRADES)
+    ])
+    db.commit()
+    seed_nav_history(db, days=NAV_DAYS, interval=timedelta(minutes=5))
+    db.close()
+    return session_factory
+
+
+@pytest.fixture
+def client(session_factory):
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def run_async():
+    """코루틴 벤치마크용: 라운드마다 같은 이벤트 루프에서 실행"""
+    loop = asyncio.new_event_loop()
+    yield lambda fn, *args, **kwargs: loop.run_until_complete(fn(*args, **kwargs))
+    loop.close()
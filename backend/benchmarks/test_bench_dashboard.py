@@ -0,0 +1,35 @@
+"""대시보드 엔드포인트 벤치마크 (대형 합성 DB)"""
+
+import pytest
+
+from app.core import data_version
+
+DASHBOARD_ENDPOINTS = [
+    "/api/fund/stats",
+    "/api/fund/pms",
+    "/api/fund/pm-performance",
+    "/api/fund/nav/history",
+    "/api/fund/exposure",
+    "/api/fund/heatmap",
+    "/api/fund/risk/overview",
+    "/api/fund/trades",
+    "/api/fund/dashboard/snapshot",
+]
+
+
+@pytest.mark.parametrize("path", DASHBOARD_ENDPOINTS)
+def test_dashboard_endpoint_uncached(benchmark, large_db, client, path):
+    """응답 캐시 미스 경로 (매 라운드 데이터 버전 증가)"""
+    def call():
+        data_version.bump()
+        return client.get(path)
+
+    resp = benchmark(call)
+    assert resp.status_code == 200
+
+
+def test_dashboard_stats_cached(benchmark, large_db, client):
+    """응답 캐시 히트 경로"""
+    client.get("/api/fund/stats")
+    resp = benchmark(client.get, "/api/fund/stats")
+    assert resp.status_code == 200
@@ -0,0 +1,49 @@
+"""엔진 벤치마크: 퀀트 시그널, 성과 지표, 리스크 체크"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import insert
+
+from app.engines.market_data import get_price_history
+from app.engines.performance import PerformanceEngine
+from app.engines.quant import QuantEngine
+from app.engines.risk_guard import check_risk
+from app.models.pm import PM
+from app.models.trade import Trade
+
+
+@pytest.mark.parametrize("days", [60, 252])
+def test_quant_generate_signals(benchmark, days):
+    prices = get_price_history("SPY", days=days)
+    engine = QuantEngine()
+    result = benchmark(engine.generate_signals, prices, "SPY")
+    assert -1.0 <= result["composite_score"] <= 1.0
+
+
+@pytest.mark.parametrize("days", [252, 2_520])
+def test_performance_compute_all(benchmark, days):
+    rng = np.random.default_rng(0)
+    fund = rng.normal(0.0008, 0.012, days).tolist()
+    bench = rng.normal(0.0005, 0.010, days).tolist()
+    result = benchmark(PerformanceEngine().compute_all, fund, bench)
+    assert "sharpe" in result
+
+
+def test_check_risk_10k_trades(benchmark, db):
+    """PM 하나에 거래 1만 건 (절반은 오늘 체결된 SELL)"""
+    pm = db.get(PM, "atlas")
+    now = datetime.utcnow()
+    db.execute(insert(Trade.__table__), [
+        {
+            "pm_id": pm.id, "symbol": "SPY", "action": "SELL" if i % 2 else "BUY",
+            "quantity": 1.0, "price": 450.0, "conviction_score": 0.5,
+            "reasoning": f"bench (P&L: ${(i % 7) - 3:+.2f})",
+            "executed_at": now - timedelta(minutes=i),
+        }
+        for i in range(10_000)
+    ])
+    db.commit()
+    allowed, _ = benchmark(check_risk, pm, "BUY", 1_000.0, db)
+    assert isinstance(allowed, bool)
@@ -0,0 +1,19 @@
+"""트레이딩 핫패스 벤치마크: 전체 PM 사이클 1틱, 백테스트 핸들러"""
+
+import pytest
+
+from app.engines.trading_cycle import run_all_pm_cycles
+
+
+def test_run_all_pm_cycles_tick(benchmark, db, run_async):
+    """mock 시세 + PaperAdapter + LLM 키 없음 → 네트워크 없이 1틱 전체 (시그널 매트릭스 갱신 ~ 커밋)"""
+    results = benchmark.pedantic(run_async, args=(run_all_pm_cycles, db), rounds=10, warmup_rounds=1)
+    assert results and all(r.get("status") != "error" for r in results)
+
+
+@pytest.mark.parametrize("days", [90, 365])
+def test_backtest_handler(benchmark, client, days):
+    payload = {"symbol": "SPY", "strategy": "rsi_momentum", "days": days}
+    resp = benchmark(client.post, "/api/trading/backtest", json=payload)
+    assert resp.status_code == 200
+    assert resp.json()["chart_data"]
@@ -160,6 +160,121 @@ class TestSystemEndpoints:
         assert "avg_latency_ms" in data
         assert "orders_today" in data
 
+    def test_pipeline_stats_use_recorded_metrics(self):
+        from app.core.metrics import metrics
+        metrics.reset()
+        for ms in (10, 20, 30):
+            metrics.observe("cycle_stage_seconds", ms / 1000, stage="broker_order", pm="atlas")
+        metrics.event("orders_rejected")
+        pipeline = client.get("/api/fund/order-pipeline/stats").json()
+        assert pipeline["rejected_24h"] == 1
+        assert pipeline["stages"]["broker_order"]["p50_ms"] == 20.0
+        soq = client.get("/api/fund/soq/status").json()
+        assert soq["avg_latency_ms"] == 20.0
+        assert soq["p99_latency_ms"] == 30.0
+        metrics.reset()
+
+    def test_pipeline_stats_identify_worker(self):
+        from app.core.leader import WORKER_ID
+        for path in ("/api/fund/order-pipeline/stats", "/api/fund/soq/status"):
+            data = client.get(path).json()
+            assert data["worker_id"] == WORKER_ID
+            assert {"is_leader", "leader"} <= set(data)
+
+    def test_llm_usage_aggregates(self):
+        from app.engines.llm_usage import usage_ledger
+        usage_ledger.reset()
+        usage_ledger.record("claude", "atlas", "claude-haiku-4-5-20251001",
+                            input_tokens=100, cached_tokens=300, output_tokens=50, latency=0.4)
+        usage_ledger.record("openai", "momentum", "gpt-4o-mini", latency=2.0, ok=False)
+        data = client.get("/api/fund/llm/usage").json()
+        assert data["totals"]["calls"] == 2
+        assert data["by_provider"]["claude"]["cache_hit_ratio"] == 0.75
+        assert data["by_provider"]["openai"]["errors"] == 1
+        assert set(data["by_pm"]) == {"atlas", "momentum"}
+        assert client.get("/api/fund/llm/usage?hours=1").json()["totals"]["calls"] == 2
+        usage_ledger.reset()
+
+    def test_llm_provider_status_and_reset(self, monkeypatch):
+        from app.config import settings
+        from app.core.leader import WORKER_ID
+        from app.engines.trading_cycle import llm_engine
+
+        monkeypatch.setattr(settings, "scheduler_leader_election", False)
+        breaker = llm_engine.breakers["grok"]
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        data = client.get("/api/fund/llm/providers").json()
+        assert data["providers"]["grok"]["state"] == "open"
+        assert data["worker_id"] == data["leader"] == WORKER_ID
+        r = client.post("/api/fund/llm/providers/grok/reset")
+        assert r.json()["state"] == "closed"
+        assert r.json()["is_leader"] is True
+        assert client.post("/api/fund/llm/providers/nope/reset").status_code == 404
+
+    def test_llm_providers_rejected_on_follower(self, monkeypatch):
+        from app.config import settings
+        from app.core import leader
+
+        monkeypatch.setattr(settings, "scheduler_leader_election", True)
+        monkeypatch.setattr(leader, "_is_leader", False)
+        r = client.get("/api/fund/llm/providers")
+        assert r.status_code == 409
+        assert r.json()["detail"]["reason"] == "not_leader"
+        assert r.json()["detail"]["worker_id"] == leader.WORKER_ID
+        assert client.post("/api/fund/llm/providers/grok/reset").status_code == 409
+
+    def test_profile_single_pm_cycle(self, monkeypatch):
+        from unittest.mock import AsyncMock, patch
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "scheduler_leader_election", False)
+        with patch("app.engines.trading_cycle.run_pm_cycle", new_callable=AsyncMock,
+                   return_value={"status": "ok"}) as run:
+            r = client.post("/api/fund/profile/cycle?pm_id=atlas&format=text")
+        assert r.status_code == 200
+        assert run.await_count == 1
+        report_id = r.headers["x-profile-id"]
+        status = client.get("/api/fund/profile/settings").json()
+        assert any(str(rep["id"]) == report_id for rep in status["reports"])
+        assert client.get(f"/api/fund/profile/reports/{report_id}").text == r.text
+
+    def test_profile_unknown_pm_404(self, monkeypatch):
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "scheduler_leader_election", False)
+        assert client.post("/api/fund/profile/cycle?pm_id=nobody").status_code == 404
+
+    def test_profile_rejected_on_follower(self, monkeypatch):
+        from unittest.mock import AsyncMock, patch
+        from app.config import settings
+        from app.core import leader
+
+        monkeypatch.setattr(settings, "scheduler_leader_election", True)
+        monkeypatch.setattr(leader, "_is_leader", False)
+        with patch("app.engines.trading_cycle.run_all_pm_cycles", new_callable=AsyncMock) as run:
+            r = client.post("/api/fund/profile/cycle?format=text")
+        assert r.status_code == 409
+        assert r.json()["detail"]["reason"] == "not_leader"
+        run.assert_not_awaited()
+
+    def test_profile_settings_toggle(self):
+        r = client.put("/api/fund/profile/settings", json={"every_n": 5, "keep": 3})
+        assert r.json()["every_n"] == 5
+        assert r.json()["keep"] == 3
+        assert client.put("/api/fund/profile/settings", json={"format": "svg"}).status_code == 400
+        client.put("/api/fund/profile/settings", json={"every_n": 0, "keep": 10})
+
+    def test_prometheus_metrics_endpoint(self):
+        from app.core.metrics import metrics
+        metrics.observe("cycle_seconds", 0.1, pm="atlas")
+        r = client.get("/metrics")
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/plain")
+        assert 'cycle_seconds_count{pm="atlas"}' in r.text
+        assert "scheduler_leader{worker_id=" in r.text
+        metrics.reset()
+
     def test_executions_recent_returns_200(self):
         r = client.get("/api/fund/executions/recent")
         assert r.status_code == 200
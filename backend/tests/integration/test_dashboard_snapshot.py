@@ -0,0 +1,62 @@
+"""대시보드 스냅샷 엔드포인트 통합 테스트"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.models.nav_history import NAVHistory
+from app.models.position import Position
+from app.models.trade import Trade
+
+client = TestClient(app)
+
+SECTIONS = {
+    "stats", "pms", "pm_performance", "nav_history", "exposure",
+    "heatmap", "risk_overview", "scheduler", "recent_trades",
+}
+
+
+def _seed():
+    from tests.conftest import TestSession
+    db = TestSession()
+    db.add_all([
+        Position(pm_id="atlas", symbol="SPY", quantity=10.0, avg_cost=450.0),
+        Position(pm_id="drflow", symbol="NVDA", quantity=5.0, avg_cost=800.0),
+        Trade(pm_id="atlas", symbol="SPY", action="BUY", quantity=10.0, price=450.0,
+              conviction_score=0.8, reasoning="t"),
+        NAVHistory(nav=1_000_000.0, daily_return=0.0),
+        NAVHistory(nav=1_010_000.0, daily_return=0.01),
+    ])
+    db.commit()
+    db.close()
+
+
+class TestDashboardSnapshot:
+    def test_has_all_sections(self):
+        r = client.get("/api/fund/dashboard/snapshot")
+        assert r.status_code == 200
+        assert SECTIONS <= set(r.json())
+
+    def test_matches_individual_endpoints(self):
+        _seed()
+        snap = client.get("/api/fund/dashboard/snapshot").json()
+        assert snap["stats"] == client.get("/api/fund/stats").json()
+        assert snap["pms"] == client.get("/api/fund/pms").json()
+        assert snap["pm_performance"] == client.get("/api/fund/pm-performance").json()
+        assert snap["nav_history"] == client.get("/api/fund/nav/history").json()
+        assert snap["exposure"] == client.get("/api/fund/exposure").json()
+        assert snap["heatmap"] == client.get("/api/fund/heatmap").json()
+        assert snap["risk_overview"] == client.get("/api/fund/risk/overview").json()
+        assert snap["recent_trades"] == client.get("/api/fund/trades").json()
+
+    def test_constant_query_count(self):
+        from tests.conftest import test_engine
+        _seed()
+        statements = []
+        listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+        event.listen(test_engine, "before_cursor_execute", listener)
+        try:
+            client.get("/api/fund/dashboard/snapshot")
+        finally:
+            event.remove(test_engine, "before_cursor_execute", listener)
+        assert sum(1 for s in statements if s.lstrip().upper().startswith("SELECT")) == 5
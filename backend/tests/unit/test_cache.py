@@ -0,0 +1,81 @@
+"""stale-while-revalidate TTL 캐시 유닛 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Counter:
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.calls
+
+
+class TestTTLCache:
+    @pytest.mark.asyncio
+    async def test_fresh_value_served_from_memory(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        fetch = Counter()
+        assert await cache.get("k", fetch) == 1
+        clock.now = 9
+        assert await cache.get("k", fetch) == 1
+        assert fetch.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_value_returned_while_refreshing(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, stale_ttl=20, clock=clock)
+        fetch = Counter()
+        await cache.get("k", fetch)
+        clock.now = 15
+        assert await cache.get("k", fetch) == 1  # 이전 값 즉시 반환
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert fetch.calls == 2
+        assert cache.peek("k") == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_value_refetched(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, stale_ttl=5, clock=clock)
+        fetch = Counter()
+        await cache.get("k", fetch)
+        clock.now = 16
+        assert await cache.get("k", fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_fetch_once(self):
+        cache = TTLCache(ttl=10)
+        fetch = Counter(delay=0.01)
+        results = await asyncio.gather(*(cache.get("k", fetch) for _ in range(5)))
+        assert results == [1] * 5
+        assert fetch.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_not_cached(self):
+        cache = TTLCache(ttl=10)
+
+        async def boom():
+            raise OSError("down")
+
+        with pytest.raises(OSError):
+            await cache.get("k", boom)
+        assert cache.peek("k") is None
+        assert await cache.get("k", Counter()) == 1
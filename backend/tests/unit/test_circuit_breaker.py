@@ -0,0 +1,82 @@
+"""Circuit breaker 유닛 테스트 (closed → open → half_open → closed/open)"""
+
+from app.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(clock, **kwargs):
+    return CircuitBreaker("test", failure_threshold=3, cooldown=10.0, max_cooldown=40.0, clock=clock, **kwargs)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = _breaker(FakeClock())
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.status()["rejected"] == 1
+
+
+def test_success_resets_failure_count():
+    breaker = _breaker(FakeClock())
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_single_probe():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 10.0
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_doubles_cooldown_up_to_max():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_failure()
+    for expected in (20.0, 40.0, 40.0):
+        clock.now += breaker.status()["cooldown_s"]
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert breaker.status()["cooldown_s"] == expected
+    assert breaker.status()["retry_in_s"] == 40.0
+
+    breaker.reset()
+    assert breaker.state == CLOSED
+    assert breaker.status()["cooldown_s"] == 10.0
+
+
+def test_released_probe_lets_next_call_probe():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 10.0
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.release_probe()  # probe 취소 (결과 없음)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
@@ -0,0 +1,76 @@
+"""암호화폐 시세 일괄 조회 서비스 유닛 테스트"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.crypto_quotes import CryptoQuoteService, fetch_quotes
+
+SYMBOLS = ["BTC-USD", "ETH-USD"]
+
+TICKERS = {
+    "retCode": 0,
+    "result": {"list": [
+        {"symbol": "BTCUSDT", "lastPrice": "65000", "prevPrice24h": "64000", "highPrice24h": "66000",
+         "lowPrice24h": "63000", "volume24h": "1234.5", "price24hPcnt": "0.0156"},
+        {"symbol": "ETHUSDT", "lastPrice": "3200", "prevPrice24h": "3300", "highPrice24h": "3350",
+         "lowPrice24h": "3150", "volume24h": "9999", "price24hPcnt": "-0.0303"},
+        {"symbol": "SOLUSDT", "lastPrice": "150"},
+    ]},
+}
+
+
+def _mock_client(mock_cls, payload=None, error=None):
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = payload
+    mock_resp.raise_for_status = MagicMock()
+    mock_http = AsyncMock()
+    mock_http.get = AsyncMock(side_effect=error) if error else AsyncMock(return_value=mock_resp)
+    mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
+    mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+    return mock_http
+
+
+class TestFetchQuotes:
+    @pytest.mark.asyncio
+    async def test_single_batched_call(self):
+        with patch("httpx.AsyncClient") as mock_cls:
+            mock_http = _mock_client(mock_cls, TICKERS)
+            quotes = await fetch_quotes(SYMBOLS)
+        mock_http.get.assert_awaited_once()
+        assert mock_http.get.call_args.kwargs["params"] == {"category": "spot"}
+        assert set(quotes) == set(SYMBOLS)
+        assert quotes["BTC-USD"]["price"] == 65000.0
+        assert quotes["BTC-USD"]["open_24h"] == 64000.0
+        assert quotes["ETH-USD"]["change_24h"] == pytest.approx(-3.03)
+
+    @pytest.mark.asyncio
+    async def test_fallback_reports_no_24h_data(self):
+        with patch("httpx.AsyncClient") as mock_cls, \
+             patch("app.engines.market_data.get_current_prices", return_value={"BTC-USD": 60000.0, "ETH-USD": 3000.0}):
+            _mock_client(mock_cls, error=httpx.ConnectError("down"))
+            quotes = await fetch_quotes(SYMBOLS)
+        assert quotes["BTC-USD"]["source"] == "fallback"
+        assert quotes["BTC-USD"]["price"] == 60000.0
+        resp = CryptoQuoteService.to_response(quotes["BTC-USD"])
+        assert [resp[k] for k in ("change_24h", "open_24h", "high_24h", "low_24h", "volume_24h")] == [None] * 5
+
+
+class TestCryptoQuoteService:
+    @pytest.mark.asyncio
+    async def test_repeat_calls_served_from_cache(self):
+        service = CryptoQuoteService(SYMBOLS)
+        with patch("httpx.AsyncClient") as mock_cls:
+            mock_http = _mock_client(mock_cls, TICKERS)
+            first = await service.get_quotes()
+            second = await service.get_quotes()
+        assert mock_http.get.await_count == 1
+        assert [q["symbol"] for q in first] == SYMBOLS
+        assert first == second
+
+    def test_response_shape(self):
+        quote = {"symbol": "DOGE-USD", "price": 0.123456, "open_24h": 0.12, "high_24h": 0.13,
+                 "low_24h": 0.11, "volume_24h": 1.0, "change_24h": 2.88, "source": "bybit"}
+        resp = CryptoQuoteService.to_response(quote)
+        assert resp["coin"] == "DOGE"
+        assert resp["price"] == 0.1235
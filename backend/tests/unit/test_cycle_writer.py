@@ -0,0 +1,180 @@
+"""틱 쓰기 버퍼 유닛 테스트"""
+
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.pm import PM
+from app.models.position import Position
+from app.models.signal import Signal
+from app.models.trade import Trade
+from app.services.cycle_writer import CycleWriteBuffer
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+Session = sessionmaker(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = Session()
+    yield session
+    session.close()
+
+
+def _pm(pm_id: str, capital: float = 100_000.0) -> PM:
+    return PM(id=pm_id, name=pm_id, emoji="🤖", strategy="t", llm_provider="rule_based",
+              current_capital=capital, is_active=True)
+
+
+def _trade(pm_id: str, symbol: str, action: str = "BUY") -> dict:
+    return dict(pm_id=pm_id, symbol=symbol, action=action, quantity=1.0, price=100.0,
+                conviction_score=0.7, reasoning="test", fee=0.1)
+
+
+class TestCycleWriteBuffer:
+    def test_nothing_written_until_flush(self, db):
+        db.add(_pm("a"))
+        db.commit()
+        buffer = CycleWriteBuffer()
+        writer = buffer.writer(db, "a")
+        writer.add_signal(pm_id="a", symbol="SPY", signal_type="composite", value=0.5)
+        writer.add_trade(**_trade("a", "SPY"))
+        writer.set_position("a", "SPY", 1.0, 100.0)
+        writer.commit()
+        assert db.query(Trade).count() == 0
+        assert db.query(Position).count() == 0
+
+        counts = buffer.flush(db)
+        db.commit()
+        assert counts == {"signals": 1, "trades": 1, "positions": 1}
+        assert db.query(Signal).count() == 1
+        assert db.query(Trade).count() == 1
+        assert db.query(Position).filter_by(pm_id="a", symbol="SPY").one().quantity == 1.0
+
+    def test_reads_see_staged_positions(self, db):
+        db.add_all([_pm("a"), Position(pm_id="a", symbol="SPY", quantity=5.0, avg_cost=100.0)])
+        db.commit()
+        writer = CycleWriteBuffer().writer(db, "a")
+        writer.set_position("a", "QQQ", 2.0, 50.0)
+        writer.delete_position("a", "SPY")
+        assert writer.get_position("a", "SPY") is None
+        assert writer.get_position("a", "QQQ").quantity == 2.0
+        assert [p.quantity for p in writer.list_positions("a")] == [2.0]
+
+    def test_rollback_discards_only_that_pm(self, db):
+        db.add_all([_pm("a"), _pm("b")])
+        db.commit()
+        buffer = CycleWriteBuffer()
+        buffer.writer(db, "a").add_trade(**_trade("a", "SPY"))
+        failed = buffer.writer(db, "b")
+        failed.add_trade(**_trade("b", "QQQ"))
+        failed.set_position("b", "QQQ", 1.0, 100.0)
+        failed.rollback()
+
+        buffer.flush(db)
+        db.commit()
+        assert [t.pm_id for t in db.query(Trade).all()] == ["a"]
+        assert db.query(Position).filter_by(pm_id="b").count() == 0
+
+    def test_flush_uses_one_insert_per_table(self, db):
+        db.add_all([_pm(f"pm{i}") for i in range(5)])
+        db.commit()
+        buffer = CycleWriteBuffer()
+        for i in range(5):
+            buffer.writer(db, f"pm{i}").add_trade(**_trade(f"pm{i}", "SPY"))
+
+        statements = []
+        listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            buffer.flush(db)
+            db.commit()
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT INTO TRADES")]
+        assert len(inserts) == 1
+        assert db.query(Trade).count() == 5
+
+    def test_failing_pm_isolated(self, db, caplog):
+        db.add_all([_pm("good"), _pm("bad")])
+        db.commit()
+        buffer = CycleWriteBuffer()
+        buffer.writer(db, "good").add_trade(**_trade("good", "SPY"))
+        buffer.writer(db, "good").set_position("good", "SPY", 1.0, 100.0)
+        buffer.writer(db, "bad").add_trade(order_id="ODR-7", **{**_trade("bad", "QQQ"), "quantity": None})
+        buffer.writer(db, "bad").set_position("bad", "QQQ", 1.0, 100.0)
+
+        with caplog.at_level("ERROR"):
+            counts = buffer.flush(db)
+        db.commit()
+        assert buffer.failed == ["bad"]
+        assert counts["trades"] == 1
+        assert [t.pm_id for t in db.query(Trade).all()] == ["good"]
+        assert [p.pm_id for p in db.query(Position).all()] == ["good"]
+        assert "pm=bad symbol=QQQ side=BUY" in caplog.text
+        assert "order_id=ODR-7" in caplog.text
+
+
+class TestBufferedCycle:
+    @pytest.mark.asyncio
+    async def test_buy_sell_round_trip_through_buffer(self, db):
+        from app.engines.trading_cycle import _execute_buy, _execute_sell
+
+        pm = _pm("a")
+        db.add(pm)
+        db.commit()
+        buffer = CycleWriteBuffer()
+        writer = buffer.writer(db, "a")
+        await _execute_buy(pm, "SPY", 10.0, 100.0, db, writer=writer)
+        await _execute_sell(pm, "SPY", 4.0, 110.0, db, writer=writer)
+        assert db.query(Trade).count() == 0
+
+        buffer.flush(db)
+        db.commit()
+        assert [t.action for t in db.query(Trade).order_by(Trade.id).all()] == ["BUY", "SELL"]
+        assert db.query(Position).filter_by(pm_id="a", symbol="SPY").one().quantity == pytest.approx(6.0)
+
+    @pytest.mark.asyncio
+    async def test_tick_commits_once(self, db):
+        from app.engines import trading_cycle
+
+        db.add_all([_pm("a"), _pm("b")])
+        db.commit()
+        buffer = CycleWriteBuffer()
+        for pm in db.query(PM).all():
+            buffer.writer(db, pm.id).add_trade(**_trade(pm.id, "SPY"))
+            buffer.writer(db, pm.id).set_position(pm.id, "SPY", 1.0, 100.0)
+
+        with patch.object(db, "commit", wraps=db.commit) as mock_commit, \
+             patch("app.engines.market_data.get_current_prices", return_value={"SPY": 100.0}):
+            trading_cycle.revalue_tick(
+                db,
+                [{"pm_id": "a", "trade_executed": True}, {"pm_id": "b", "trade_executed": True}],
+                buffer=buffer,
+            )
+        assert mock_commit.call_count == 1
+        assert db.query(Trade).count() == 2
+
+    def test_failed_commit_logs_unsaved_fills(self, db, caplog):
+        from sqlalchemy.exc import OperationalError
+        from app.engines import trading_cycle
+
+        db.add(_pm("a"))
+        db.commit()
+        buffer = CycleWriteBuffer()
+        buffer.writer(db, "a").add_trade(order_id="BY-1", **_trade("a", "BTCUSDT", "SELL"))
+
+        with patch.object(db, "commit", side_effect=OperationalError("COMMIT", {}, Exception("disk I/O error"))), \
+             caplog.at_level("ERROR"):
+            assert trading_cycle.revalue_tick(db, [{"pm_id": "a", "trade_executed": True}], buffer=buffer) == {}
+        assert db.query(Trade).count() == 0
+        assert "pm=a symbol=BTCUSDT side=SELL qty=1.0 price=100.0 order_id=BY-1" in caplog.text
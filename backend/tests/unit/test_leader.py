@@ -0,0 +1,149 @@
+"""스케줄러 리더 선출 (lease) 유닛 테스트"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.scheduler_lease import SchedulerLease
+from app.core import leader
+from app.core.leader import try_acquire_lease, release_lease
+
+TEST_DB_URL = "sqlite:///:memory:"
+engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False})
+Session = sessionmaker(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = Session()
+    yield session
+    session.close()
+
+
+class TestTryAcquireLease:
+    def test_first_worker_acquires(self, db):
+        assert try_acquire_lease(db, holder="w1", ttl_seconds=30) is True
+        lease = db.query(SchedulerLease).first()
+        assert lease.holder == "w1"
+
+    def test_second_worker_blocked_while_valid(self, db):
+        try_acquire_lease(db, holder="w1", ttl_seconds=30)
+        assert try_acquire_lease(db, holder="w2", ttl_seconds=30) is False
+
+    def test_holder_renews(self, db):
+        now = datetime.utcnow()
+        try_acquire_lease(db, holder="w1", ttl_seconds=30, now=now)
+        assert try_acquire_lease(db, holder="w1", ttl_seconds=30, now=now + timedelta(seconds=20)) is True
+        lease = db.query(SchedulerLease).first()
+        assert lease.expires_at == now + timedelta(seconds=50)
+
+    def test_takeover_after_expiry(self, db):
+        now = datetime.utcnow()
+        try_acquire_lease(db, holder="w1", ttl_seconds=30, now=now)
+        assert try_acquire_lease(db, holder="w2", ttl_seconds=30, now=now + timedelta(seconds=31)) is True
+        # 이전 리더는 다음 heartbeat에서 강등
+        assert try_acquire_lease(db, holder="w1", ttl_seconds=30, now=now + timedelta(seconds=32)) is False
+
+    def test_release_allows_immediate_takeover(self, db):
+        try_acquire_lease(db, holder="w1", ttl_seconds=30)
+        release_lease(db, holder="w1")
+        assert try_acquire_lease(db, holder="w2", ttl_seconds=30) is True
+
+    def test_release_by_non_holder_is_noop(self, db):
+        try_acquire_lease(db, holder="w1", ttl_seconds=30)
+        release_lease(db, holder="w2")
+        assert try_acquire_lease(db, holder="w2", ttl_seconds=30) is False
+
+
+class TestElectionLoop:
+    @pytest.mark.asyncio
+    async def test_elected_then_demoted_on_lost_lease(self):
+        on_elected = MagicMock()
+        on_demoted = MagicMock()
+        results = iter([True, False])
+
+        with patch.object(leader, "_heartbeat", side_effect=lambda: next(results, False)):
+            task = asyncio.ensure_future(leader._election_loop(on_elected, on_demoted, 0))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        on_elected.assert_called_once()
+        on_demoted.assert_called_once()
+        assert leader._is_leader is False
+
+    @pytest.mark.asyncio
+    async def test_db_error_demotes_leader(self):
+        from sqlalchemy.exc import OperationalError
+
+        on_elected = MagicMock()
+        on_demoted = MagicMock()
+        calls = {"n": 0}
+
+        def heartbeat():
+            calls["n"] += 1
+            if calls["n"] == 1:
+                return True
+            raise OperationalError("stmt", {}, Exception("db down"))
+
+        with patch.object(leader, "_heartbeat", side_effect=heartbeat):
+            task = asyncio.ensure_future(leader._election_loop(on_elected, on_demoted, 0))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        on_elected.assert_called_once()
+        on_demoted.assert_called_once()
+
+
+class TestLeaderStatus:
+    def test_status_fields(self):
+        status = leader.get_status()
+        assert status["worker_id"] == leader.WORKER_ID
+        assert "is_leader" in status
+        assert "enabled" in status
+
+    def test_disabled_election_treats_worker_as_leader(self):
+        with patch("app.core.leader.settings") as mock_settings:
+            mock_settings.scheduler_leader_election = False
+            assert leader.is_leader() is True
+
+    def test_current_leader_reads_valid_lease(self, db):
+        now = datetime.utcnow()
+        assert leader.current_leader(db) is None
+        try_acquire_lease(db, holder="w1", ttl_seconds=30, now=now)
+        assert leader.current_leader(db, now=now + timedelta(seconds=10)) == "w1"
+        assert leader.current_leader(db, now=now + timedelta(seconds=31)) is None
+
+
+class TestLeaderOnlyTasks:
+    def test_trends_refresh_follows_leadership(self):
+        import app.api.crypto as crypto_mod
+        from app.core import scheduler
+
+        social = MagicMock()
+        running = MagicMock()
+        running.done.return_value = False
+        with patch("app.api.admin.strategic.get_social_engine", return_value=social), \
+             patch.object(scheduler, "start_scheduler"), \
+             patch.object(scheduler, "stop_scheduler"), \
+             patch.object(crypto_mod, "_crypto_scheduler_task", running):
+            scheduler.start_trading_schedulers()
+            social.start_trends_refresh.assert_called_once()
+            social.trends.stop.assert_not_called()
+            scheduler.stop_trading_schedulers()
+            social.trends.stop.assert_called_once()
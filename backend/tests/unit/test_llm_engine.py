@@ -1,4 +1,5 @@
 from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
 import json
 
 import pytest
@@ -63,13 +64,24 @@ def test_client_property_creates_anthropic_with_key():
     engine = LLMEngine()
     mock_anthropic = MagicMock()
     with patch("app.engines.llm.settings") as mock_settings, \
-         patch("anthropic.Anthropic", return_value=mock_anthropic) as mock_cls:
+         patch("anthropic.AsyncAnthropic", return_value=mock_anthropic) as mock_cls:
         mock_settings.anthropic_api_key = "test_key_123"
+        mock_settings.anthropic_base_url = ""
         engine._claude_client = None  # 리셋
         client = engine.claude_client
         mock_cls.assert_called_once_with(api_key="test_key_123")
 
 
+def test_client_property_uses_base_url():
+    engine = LLMEngine()
+    with patch("app.engines.llm.settings") as mock_settings, \
+         patch("openai.AsyncOpenAI") as mock_cls:
+        mock_settings.openai_api_key = "k"
+        mock_settings.openai_base_url = "http://localhost:8900/v1"
+        engine.openai_client
+        mock_cls.assert_called_once_with(api_key="k", base_url="http://localhost:8900/v1")
+
+
 @pytest.mark.asyncio
 async def test_call_claude_parses_json():
     engine = LLMEngine()
@@ -78,9 +90,352 @@ async def test_call_claude_parses_json():
     mock_msg = MagicMock()
     mock_msg.content = [MagicMock(text=json.dumps(expected))]
     mock_client = MagicMock()
-    mock_client.messages.create.return_value = mock_msg
+    mock_client.messages.create = AsyncMock(return_value=mock_msg)
     engine._claude_client = mock_client
 
     result = await engine._call_claude("atlas", "test prompt")
     assert result["action"] == "BUY"
     assert result["conviction"] == 0.8
+
+
+@pytest.mark.asyncio
+async def test_batch_decision_parses_array():
+    engine = LLMEngine()
+    payload = [
+        {"symbol": "SPY", "action": "BUY", "conviction": 0.8, "reasoning": "trend", "position_size": 0.05},
+        {"symbol": "tlt", "action": "SELL", "conviction": 0.2, "reasoning": "weak", "position_size": 0.02},
+        {"symbol": "ZZZ", "action": "BUY", "conviction": 0.9, "reasoning": "not asked", "position_size": 0.05},
+    ]
+    signals = {"SPY": {"composite_score": 0.6}, "TLT": {"composite_score": -0.1}, "GLD": {"composite_score": 0.0}}
+    with patch.object(engine, "_call_claude", new_callable=AsyncMock, return_value=payload) as mock:
+        result = await engine.make_batch_decision("atlas", signals, {"vix": 15.0})
+
+    mock.assert_awaited_once()
+    prompt = mock.call_args.args[1]
+    assert all(f"- {sym}:" in prompt for sym in signals)
+    assert set(result) == {"SPY", "TLT", "GLD"}
+    assert result["SPY"]["action"] == "BUY"
+    assert result["TLT"]["action"] == "HOLD"  # min_conviction 미만
+    assert result["GLD"] == {"action": "HOLD", "conviction": 0.0, "reasoning": "No decision returned",
+                             "position_size": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_batch_decision_json_object_providers():
+    from app.engines.llm import BATCH_OBJECT_INSTRUCTION
+
+    engine = LLMEngine()
+    payload = {"decisions": [{"symbol": "SPY", "action": "BUY", "conviction": 0.7, "reasoning": "", "position_size": 0.03}]}
+    with patch.object(engine, "_call_openai", new_callable=AsyncMock, return_value=payload) as mock:
+        result = await engine.make_batch_decision("atlas", {"SPY": {}}, {}, llm_provider="openai")
+    assert mock.call_args.kwargs["instruction"] == BATCH_OBJECT_INSTRUCTION
+    assert result["SPY"]["action"] == "BUY"
+
+
+def test_parse_batch_rejects_non_array():
+    from app.engines.llm import _parse_batch
+
+    with pytest.raises(ValueError):
+        _parse_batch({"decisions": "nope"}, ["SPY"])
+    assert _parse_batch([1, {"symbol": "SPY"}, {"symbol": "SPY", "action": "SELL"}], ["SPY"]) == {"SPY": {"symbol": "SPY"}}
+
+
+@pytest.mark.asyncio
+async def test_claude_call_caches_system_and_records_usage():
+    from app.engines.llm_usage import usage_ledger
+
+    usage_ledger.reset()
+    engine = LLMEngine()
+    mock_msg = MagicMock()
+    mock_msg.content = [MagicMock(text='{"action": "HOLD", "conviction": 0.5}')]
+    mock_msg.usage = MagicMock(input_tokens=40, cache_read_input_tokens=120, cache_creation_input_tokens=0,
+                               output_tokens=30)
+    engine._claude_client = MagicMock()
+    engine._claude_client.messages.create = AsyncMock(return_value=mock_msg)
+
+    await engine._call_claude("atlas", "prompt")
+    system = engine._claude_client.messages.create.call_args.kwargs["system"]
+    assert system[0]["cache_control"] == {"type": "ephemeral"}
+    assert system[0]["text"].startswith(SYSTEM_PROMPTS["atlas"])
+
+    stats = usage_ledger.aggregate("pm")["atlas"]
+    assert (stats["input_tokens"], stats["cached_tokens"], stats["output_tokens"]) == (40, 120, 30)
+    usage_ledger.reset()
+
+
+@pytest.mark.asyncio
+async def test_failed_call_recorded_as_error():
+    from app.engines.llm_usage import usage_ledger
+
+    usage_ledger.reset()
+    engine = LLMEngine()
+    engine._openai_client = MagicMock()
+    engine._openai_client.chat.completions.create = AsyncMock(side_effect=TimeoutError("slow"))
+    with pytest.raises(TimeoutError):
+        await engine._call_openai("momentum", "prompt")
+    assert usage_ledger.aggregate("provider")["openai"]["errors"] == 1
+    usage_ledger.reset()
+
+
+def test_openai_usage_subtracts_cached_prefix():
+    from app.engines.llm import _openai_usage
+
+    response = MagicMock()
+    response.usage.prompt_tokens = 1500
+    response.usage.prompt_tokens_details.cached_tokens = 1024
+    response.usage.completion_tokens = 80
+    assert _openai_usage(response) == {"input_tokens": 476, "cached_tokens": 1024, "output_tokens": 80}
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_short_circuits(monkeypatch):
+    from app.config import settings
+    from app.engines.llm import ProviderUnavailable
+
+    monkeypatch.setattr(settings, "llm_breaker_failure_threshold", 2)
+    engine = LLMEngine()
+    with patch.object(engine, "_call_openai", new_callable=AsyncMock, side_effect=TimeoutError("down")) as mock:
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                await engine.make_decision("momentum", "SPY", {}, {}, llm_provider="openai")
+        with pytest.raises(ProviderUnavailable):
+            await engine.make_decision("momentum", "SPY", {}, {}, llm_provider="openai")
+        with pytest.raises(ProviderUnavailable):
+            await engine.make_batch_decision("momentum", {"SPY": {}}, {}, llm_provider="openai")
+    assert mock.await_count == 2
+    assert engine.provider_status()["openai"]["state"] == "open"
+    assert engine.provider_status()["claude"]["state"] == "closed"
+
+    engine.reset_provider("openai")
+    assert engine.provider_status()["openai"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_parse_error_does_not_trip_breaker(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "llm_breaker_failure_threshold", 1)
+    engine = LLMEngine()
+    with patch.object(engine, "_call_claude", new_callable=AsyncMock, side_effect=json.JSONDecodeError("x", "", 0)):
+        with pytest.raises(ValueError):
+            await engine.make_decision("atlas", "SPY", {}, {})
+    assert engine.provider_status()["claude"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_missing_key_cached_as_unavailable(monkeypatch):
+    from app.config import settings
+    from app.engines.llm import ProviderNotConfigured, ProviderUnavailable
+
+    monkeypatch.setattr(settings, "gemini_api_key", "")
+    engine = LLMEngine()
+    with pytest.raises(ProviderNotConfigured):
+        await engine.make_decision("asiatiger", "EWJ", {}, {}, llm_provider="gemini")
+    with pytest.raises(ProviderUnavailable):
+        await engine.make_decision("asiatiger", "EWJ", {}, {}, llm_provider="gemini")
+    assert engine.provider_status()["gemini"]["configured"] is False
+    # deepseek → claude 백엔드 공유
+    assert set(engine.provider_status()) == {"claude", "openai", "gemini", "grok"}
+
+
+def _slow_then(result: dict, delay: float):
+    async def call(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return result
+    return call
+
+
+@pytest.mark.asyncio
+async def test_hedge_falls_back_when_primary_slow(monkeypatch):
+    from app.config import settings
+    from app.core.metrics import metrics
+
+    monkeypatch.setattr(settings, "llm_hedge_enabled", True)
+    monkeypatch.setattr(settings, "llm_hedge_default_delay", 0.05)
+    monkeypatch.setattr(settings, "llm_hedge_min_delay", 0.0)
+    monkeypatch.setattr(settings, "llm_hedge_secondary", "")
+    engine = LLMEngine()
+    before = metrics.count_24h("llm_hedged")
+    slow = {"action": "BUY", "conviction": 0.9, "reasoning": "late", "position_size": 0.05}
+    with patch.object(engine, "_call_claude", side_effect=_slow_then(slow, 1.0)):
+        result = await engine.make_decision(
+            "atlas", "SPY", {}, {}, fallback=lambda: {"action": "HOLD", "conviction": 0.4, "reasoning": "rules"},
+        )
+    assert result["decided_by"] == "fallback"
+    assert result["reasoning"] == "rules"
+    assert metrics.count_24h("llm_hedged") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_uses_faster_secondary(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "llm_hedge_enabled", True)
+    monkeypatch.setattr(settings, "llm_hedge_default_delay", 0.05)
+    monkeypatch.setattr(settings, "llm_hedge_min_delay", 0.0)
+    monkeypatch.setattr(settings, "llm_hedge_secondary", "openai")
+    engine = LLMEngine()
+    slow = {"action": "BUY", "conviction": 0.9, "reasoning": "late", "position_size": 0.05}
+    fast = {"action": "SELL", "conviction": 0.7, "reasoning": "quick", "position_size": 0.05}
+    with patch.object(engine, "_call_claude", side_effect=_slow_then(slow, 1.0)), \
+         patch.object(engine, "_call_openai", side_effect=_slow_then(fast, 0.01)):
+        result = await engine.make_decision("atlas", "SPY", {}, {})
+    assert result["action"] == "SELL"
+    assert result["decided_by"] == "secondary:openai"
+
+
+@pytest.mark.asyncio
+async def test_primary_within_deadline_not_hedged(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "llm_hedge_enabled", True)
+    monkeypatch.setattr(settings, "llm_hedge_default_delay", 1.0)
+    engine = LLMEngine()
+    quick = {"action": "BUY", "conviction": 0.8, "reasoning": "ok", "position_size": 0.05}
+    with patch.object(engine, "_call_claude", side_effect=_slow_then(quick, 0.0)):
+        result = await engine.make_decision("atlas", "SPY", {}, {}, fallback=lambda: {"action": "HOLD"})
+    assert result["decided_by"] == "primary"
+    assert result["action"] == "BUY"
+
+
+@pytest.mark.asyncio
+async def test_decision_budget_bounds_batch_latency(monkeypatch):
+    from app.config import settings
+    from app.core.metrics import metrics
+
+    monkeypatch.setattr(settings, "llm_hedge_enabled", False)
+    monkeypatch.setattr(settings, "llm_decision_budget", 0.05)
+    engine = LLMEngine()
+    before = metrics.count_24h("llm_budget_exceeded")
+    rules = {"SPY": {"action": "HOLD", "conviction": 0.3}, "QQQ": {"action": "BUY", "conviction": 0.6}}
+    with patch.object(engine, "_call_claude", side_effect=_slow_then([], 1.0)):
+        started = asyncio.get_running_loop().time()
+        result = await engine.make_batch_decision("atlas", {"SPY": {}, "QQQ": {}}, {}, fallback=lambda: rules)
+        elapsed = asyncio.get_running_loop().time() - started
+    assert elapsed < 0.5
+    assert result["QQQ"] == {"action": "BUY", "conviction": 0.6, "decided_by": "fallback"}
+    assert metrics.count_24h("llm_budget_exceeded") == before + 1
+
+    with patch.object(engine, "_call_claude", side_effect=_slow_then([], 1.0)):
+        with pytest.raises(TimeoutError):
+            await engine.make_batch_decision("atlas", {"SPY": {}}, {})
+
+
+def test_hedge_deadline_tracks_latency_percentile(monkeypatch):
+    from app.config import settings
+    from app.engines.llm_usage import usage_ledger
+
+    monkeypatch.setattr(settings, "llm_hedge_min_samples", 5)
+    monkeypatch.setattr(settings, "llm_hedge_default_delay", 5.0)
+    monkeypatch.setattr(settings, "llm_hedge_min_delay", 0.5)
+    monkeypatch.setattr(settings, "llm_decision_budget", 0.0)
+    usage_ledger.reset()
+    engine = LLMEngine()
+    assert engine.hedge_deadline("grok") == 5.0
+    for latency in (1.0, 1.0, 1.0, 1.0, 3.0):
+        usage_ledger.record("grok", "quantking", "grok-3-mini-fast", latency=latency)
+    assert 1.0 < engine.hedge_deadline("grok") <= 3.0
+    monkeypatch.setattr(settings, "llm_decision_budget", 1.2)
+    assert engine.hedge_deadline("grok") == 1.2
+    usage_ledger.reset()
+
+
+def _openai_response(content: str, delay: float = 0.0):
+    from types import SimpleNamespace
+
+    async def create(**kwargs):
+        await asyncio.sleep(delay)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=100, completion_tokens=20, prompt_tokens_details=None),
+        )
+    return create
+
+
+@pytest.mark.asyncio
+async def test_slow_probe_reopens_then_recovers(monkeypatch):
+    from app.config import settings
+    from app.engines.llm_usage import usage_ledger
+
+    monkeypatch.setattr(settings, "llm_breaker_failure_threshold", 1)
+    monkeypatch.setattr(settings, "llm_breaker_cooldown", 0.05)
+    monkeypatch.setattr(settings, "llm_hedge_enabled", False)
+    monkeypatch.setattr(settings, "llm_decision_budget", 0.1)
+    usage_ledger.reset()
+    engine = LLMEngine()
+    engine._openai_client = MagicMock()
+    engine._openai_client.chat.completions.create = AsyncMock()
+    rules = lambda: {"action": "HOLD", "conviction": 0.3, "reasoning": "rules"}
+
+    # 1) 실패 1회 → open
+    engine._openai_client.chat.completions.create.side_effect = TimeoutError("down")
+    with pytest.raises(TimeoutError):
+        await engine.make_decision("momentum", "SPY", {}, {}, llm_provider="openai")
+    assert engine.provider_status()["openai"]["state"] == "open"
+
+    # 2) cooldown 후 half_open probe가 결정 예산에 잘림 → fallback, probe 실패로 다시 open (cooldown 2배)
+    await asyncio.sleep(0.06)
+    engine._openai_client.chat.completions.create.side_effect = _openai_response(
+        '{"action": "BUY", "conviction": 0.8, "reasoning": "late", "position_size": 0.05}', delay=0.3,
+    )
+    result = await engine.make_decision("momentum", "SPY", {}, {}, llm_provider="openai", fallback=rules)
+    assert result["decided_by"] == "fallback"
+    await asyncio.sleep(0.01)  # 취소된 probe 태스크가 실패를 기록할 때까지
+    assert engine.provider_status()["openai"]["state"] == "open"
+    assert engine.provider_status()["openai"]["cooldown_s"] == pytest.approx(0.1)
+
+    # 3) 프로바이더 회복 → 다음 cooldown 후 probe 성공으로 closed
+    await asyncio.sleep(0.11)
+    engine._openai_client.chat.completions.create.side_effect = _openai_response(
+        '{"action": "SELL", "conviction": 0.7, "reasoning": "ok", "position_size": 0.05}',
+    )
+    result = await engine.make_decision("momentum", "SPY", {}, {}, llm_provider="openai", fallback=rules)
+    assert result["decided_by"] == "primary"
+    assert engine.provider_status()["openai"]["state"] == "closed"
+
+    # 잘린 호출도 취소 시점까지의 지연으로 기록 → hedge deadline 표본
+    assert usage_ledger.latency_percentile("openai", 100) >= 0.09
+    assert usage_ledger.aggregate("provider")["openai"]["calls"] == 3
+    usage_ledger.reset()
+
+
+@pytest.mark.asyncio
+async def test_hanging_provider_under_budget_opens_breaker(monkeypatch):
+    from app.config import settings
+    from app.engines.llm import ProviderUnavailable
+
+    monkeypatch.setattr(settings, "llm_breaker_failure_threshold", 3)
+    monkeypatch.setattr(settings, "llm_hedge_enabled", False)
+    monkeypatch.setattr(settings, "llm_decision_budget", 0.02)
+    engine = LLMEngine()
+    rules = lambda: {"action": "HOLD", "conviction": 0.3, "reasoning": "rules"}
+    with patch.object(engine, "_call_claude", side_effect=_slow_then({}, 60.0)) as mock:
+        for _ in range(3):
+            result = await engine.make_decision("atlas", "SPY", {}, {}, fallback=rules)
+            assert result["decided_by"] == "fallback"
+            await asyncio.sleep(0.01)
+        with pytest.raises(ProviderUnavailable):
+            await engine.make_decision("atlas", "SPY", {}, {}, fallback=rules)
+    assert mock.call_count == 3
+    assert engine.provider_status()["claude"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_secondary_losing_race_is_not_a_failure(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "llm_breaker_failure_threshold", 1)
+    monkeypatch.setattr(settings, "llm_hedge_enabled", True)
+    monkeypatch.setattr(settings, "llm_hedge_default_delay", 0.02)
+    monkeypatch.setattr(settings, "llm_hedge_min_delay", 0.0)
+    monkeypatch.setattr(settings, "llm_hedge_secondary", "openai")
+    monkeypatch.setattr(settings, "llm_decision_budget", 0.0)
+    engine = LLMEngine()
+    quick = {"action": "BUY", "conviction": 0.8, "reasoning": "ok", "position_size": 0.05}
+    with patch.object(engine, "_call_claude", side_effect=_slow_then(quick, 0.05)), \
+         patch.object(engine, "_call_openai", side_effect=_slow_then(quick, 1.0)):
+        result = await engine.make_decision("atlas", "SPY", {}, {})
+        await asyncio.sleep(0)
+    assert result["decided_by"] == "primary"
+    assert engine.provider_status()["openai"]["state"] == "closed"
+    assert engine.provider_status()["claude"]["state"] == "closed"
@@ -0,0 +1,191 @@
+"""LLM stand-in 서버 유닛 테스트 (와이어 포맷 + 지연/오류 주입 + 실제 SDK 경로)"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.llm_standin import StandInConfig, create_app, decide
+
+FAST = StandInConfig(latency="fixed", latency_ms=0)
+PROMPT = 'Symbol: NVDA\nQuant Signals: {"composite_score": 0.7}'
+
+
+@pytest.fixture
+def client():
+    return TestClient(create_app(FAST))
+
+
+class TestDecide:
+    def test_follows_composite_score(self):
+        rng = np.random.default_rng(0)
+        assert decide(PROMPT, rng)["action"] == "BUY"
+        assert decide('"composite_score": -0.5', rng)["action"] == "SELL"
+        assert decide('"composite_score": 0.05', rng)["action"] == "HOLD"
+
+    def test_schema_without_score(self):
+        result = decide("no signals here", np.random.default_rng(1))
+        assert result["action"] in ("BUY", "SELL", "HOLD")
+        assert 0.0 <= result["conviction"] <= 1.0
+        assert 0.0 <= result["position_size"] <= 0.10
+        assert len(result["reasoning"]) <= 200
+
+
+class TestLatency:
+    @pytest.mark.parametrize("dist", ["fixed", "uniform", "lognormal", "exponential"])
+    def test_median_close_to_configured(self, dist):
+        cfg = StandInConfig(latency=dist, latency_ms=100)
+        rng = np.random.default_rng(0)
+        samples = [cfg.sample_latency(rng) for _ in range(4000)]
+        assert min(samples) >= 0
+        assert np.median(samples) == pytest.approx(0.1, rel=0.1)
+
+    def test_rejects_unknown_distribution(self):
+        with pytest.raises(ValueError):
+            StandInConfig(latency="pareto")
+
+
+class TestWireFormats:
+    def test_messages(self, client):
+        resp = client.post("/v1/messages", json={
+            "model": "claude-haiku", "max_tokens": 512, "messages": [{"role": "user", "content": PROMPT}],
+        })
+        body = resp.json()
+        assert resp.status_code == 200
+        assert body["type"] == "message"
+        assert json.loads(body["content"][0]["text"])["action"] == "BUY"
+        assert body["usage"]["output_tokens"] > 0
+
+    def test_chat_completions(self, client):
+        resp = client.post("/v1/chat/completions", json={
+            "model": "gpt-4o-mini", "messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": PROMPT}],
+        })
+        body = resp.json()
+        assert body["object"] == "chat.completion"
+        assert json.loads(body["choices"][0]["message"]["content"])["action"] == "BUY"
+
+    def test_generate_content(self, client):
+        resp = client.post("/v1beta/models/gemini-2.0-flash:generateContent", json={
+            "contents": [{"role": "user", "parts": [{"text": PROMPT}]}],
+        })
+        body = resp.json()
+        assert json.loads(body["candidates"][0]["content"]["parts"][0]["text"])["action"] == "BUY"
+
+    def test_batch_prompt_returns_array(self, client):
+        prompt = 'Symbols (quant signals):\n- SPY: {"composite_score": 0.6}\n- TLT: {"composite_score": -0.6}'
+        resp = client.post("/v1/messages", json={"messages": [{"role": "user", "content": prompt}]})
+        decisions = json.loads(resp.json()["content"][0]["text"])
+        assert [(d["symbol"], d["action"]) for d in decisions] == [("SPY", "BUY"), ("TLT", "SELL")]
+
+        resp = client.post("/v1/chat/completions", json={
+            "messages": [{"role": "user", "content": prompt}], "response_format": {"type": "json_object"},
+        })
+        wrapped = json.loads(resp.json()["choices"][0]["message"]["content"])
+        assert [d["symbol"] for d in wrapped["decisions"]] == ["SPY", "TLT"]
+
+    def test_error_injection_and_stats(self):
+        client = TestClient(create_app(StandInConfig(latency="fixed", latency_ms=0, error_rate=1.0)))
+        resp = client.post("/v1/messages", json={"messages": [{"role": "user", "content": PROMPT}]})
+        assert resp.status_code in (429, 500, 529)
+        assert resp.json()["type"] == "error"
+        assert client.get("/standin/stats").json() == {"anthropic_requests": 1, "errors": 1}
+
+    def test_runtime_config(self, client):
+        assert client.put("/standin/config", json={"error_rate": 0.25}).json()["error_rate"] == 0.25
+        assert client.get("/standin/config").json()["error_rate"] == 0.25
+        assert client.put("/standin/config", json={"latency": "pareto"}).status_code == 422
+        assert client.put("/standin/config", json={"bogus": 1}).status_code == 422
+
+
+@pytest.fixture
+def live_server():
+    import uvicorn
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    server = uvicorn.Server(uvicorn.Config(create_app(FAST), port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not server.started and time.time() < deadline:
+        time.sleep(0.02)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+@pytest.mark.parametrize("provider", ["claude", "openai", "gemini", "grok"])
+def test_llm_engine_through_standin(live_server, provider, monkeypatch):
+    """실제 SDK → base URL → stand-in 서버 → make_decision 결과"""
+    from app.config import settings
+    from app.engines.llm import LLMEngine
+
+    for name in ("anthropic", "openai", "gemini", "grok"):
+        monkeypatch.setattr(settings, f"{name}_api_key", "stand-in")
+    monkeypatch.setattr(settings, "anthropic_base_url", live_server)
+    monkeypatch.setattr(settings, "openai_base_url", f"{live_server}/v1")
+    monkeypatch.setattr(settings, "grok_base_url", f"{live_server}/v1")
+    monkeypatch.setattr(settings, "gemini_base_url", live_server)
+
+    result = asyncio.run(LLMEngine().make_decision("atlas", "NVDA", {"composite_score": 0.7}, {}, provider))
+    assert result["action"] == "BUY"
+    assert result["conviction"] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("provider", ["claude", "openai"])
+def test_prompt_cache_reads_recorded(live_server, provider, monkeypatch):
+    """같은 PM system prefix 반복 → 두 번째 호출부터 cached 토큰이 ledger에 기록"""
+    from app.config import settings
+    from app.engines.llm import LLMEngine
+    from app.engines.llm_usage import usage_ledger
+
+    monkeypatch.setattr(settings, "anthropic_api_key", "stand-in")
+    monkeypatch.setattr(settings, "openai_api_key", "stand-in")
+    monkeypatch.setattr(settings, "anthropic_base_url", live_server)
+    monkeypatch.setattr(settings, "openai_base_url", f"{live_server}/v1")
+    usage_ledger.reset()
+    engine = LLMEngine()
+
+    async def run():
+        for _ in range(3):
+            await engine.make_decision("sentinel", "SPY", {"composite_score": 0.1}, {}, provider)
+
+    asyncio.run(run())
+    stats = usage_ledger.aggregate("provider")[provider]
+    assert stats["calls"] == 3
+    assert stats["cached_tokens"] > 0
+    assert stats["output_tokens"] > 0
+    usage_ledger.reset()
+
+
+def test_concurrent_calls_not_bounded_by_thread_pool(live_server, monkeypatch):
+    """비동기 SDK 클라이언트 → 동시 호출이 스레드 풀 크기에 묶이지 않고 지연 ≈ 프로바이더 지연"""
+    import httpx
+
+    from app.config import settings
+    from app.engines.llm import LLMEngine
+    from app.engines.llm_usage import usage_ledger
+
+    monkeypatch.setattr(settings, "openai_api_key", "stand-in")
+    monkeypatch.setattr(settings, "openai_base_url", f"{live_server}/v1")
+    httpx.put(f"{live_server}/standin/config", json={"latency": "fixed", "latency_ms": 300})
+    usage_ledger.reset()
+    engine = LLMEngine()
+
+    async def run():
+        calls = [engine.make_decision("momentum", "SPY", {"composite_score": 0.7}, {}, "openai") for _ in range(64)]
+        started = time.perf_counter()
+        await asyncio.gather(*calls)
+        return time.perf_counter() - started
+
+    elapsed = asyncio.run(run())
+    assert elapsed < 1.5
+    assert usage_ledger.latency_percentile("openai", 95) < 1.0
+    usage_ledger.reset()
@@ -0,0 +1,79 @@
+"""LLM usage ledger 유닛 테스트 (링버퍼 + 집계 + 비용)"""
+
+import pytest
+
+from app.engines.llm_usage import MODEL_PRICING, UsageLedger
+
+MODEL = "claude-haiku-4-5-20251001"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_aggregate_by_provider_and_pm():
+    ledger = UsageLedger()
+    ledger.record("claude", "atlas", MODEL, input_tokens=100, cached_tokens=900, output_tokens=50, latency=0.2)
+    ledger.record("claude", "council", MODEL, input_tokens=100, cache_write_tokens=900, output_tokens=50, latency=0.6)
+    ledger.record("openai", "atlas", "gpt-4o-mini", latency=5.0, ok=False)
+
+    by_provider = ledger.aggregate("provider")
+    claude = by_provider["claude"]
+    assert claude["calls"] == 2
+    assert claude["errors"] == 0
+    assert claude["cached_tokens"] == 900
+    assert claude["cache_hit_ratio"] == pytest.approx(900 / 2000)
+    assert claude["p50_ms"] == pytest.approx(200.0, abs=0.1)
+    assert claude["p95_ms"] == pytest.approx(600.0, abs=0.1)
+    assert (by_provider["openai"]["calls"], by_provider["openai"]["errors"]) == (1, 1)
+    assert by_provider["openai"]["cost_usd"] == 0.0
+
+    by_pm = ledger.aggregate("pm")
+    assert by_pm["atlas"]["calls"] == 2
+    assert by_pm["council"]["cache_write_tokens"] == 900
+
+
+def test_cost_uses_model_pricing():
+    ledger = UsageLedger()
+    ledger.record("claude", "atlas", MODEL, input_tokens=1_000_000, cached_tokens=1_000_000,
+                  cache_write_tokens=1_000_000, output_tokens=1_000_000)
+    assert ledger.totals()["cost_usd"] == pytest.approx(sum(MODEL_PRICING[MODEL]))
+    ledger.record("local", "atlas", "unknown-model", input_tokens=1_000_000)
+    assert ledger.aggregate("model")["unknown-model"]["cost_usd"] == 0.0
+
+
+def test_ring_buffer_keeps_latest():
+    ledger = UsageLedger(capacity=3)
+    for i in range(5):
+        ledger.record("claude", f"pm{i}", MODEL, output_tokens=i)
+    assert ledger.totals()["calls"] == 3
+    assert set(ledger.aggregate("pm")) == {"pm2", "pm3", "pm4"}
+
+
+def test_since_window_and_validation():
+    clock = FakeClock()
+    ledger = UsageLedger(clock=clock)
+    ledger.record("claude", "atlas", MODEL)
+    clock.now += 7200
+    ledger.record("claude", "atlas", MODEL)
+    assert ledger.totals(since=clock.now - 3600)["calls"] == 1
+    with pytest.raises(ValueError):
+        ledger.aggregate("symbol")
+
+
+def test_latency_percentile_needs_min_samples():
+    ledger = UsageLedger(capacity=100)
+    assert ledger.latency_percentile("claude", 95) is None
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        ledger.record("claude", "atlas", MODEL, latency=latency)
+    assert ledger.latency_percentile("claude", 95, min_samples=5) is None
+    assert ledger.latency_percentile("claude", 50, min_samples=4) == pytest.approx(0.25, abs=0.06)
+    # 타임아웃으로 끝난 시도도 꼬리 지연 표본
+    ledger.record("claude", "atlas", MODEL, latency=9.0, ok=False)
+    assert ledger.latency_percentile("claude", 100, min_samples=5) == pytest.approx(9.0)
+    assert ledger.latency_percentile("claude", 100, window=2) == pytest.approx(9.0)
+    assert ledger.latency_percentile("claude", 100, window=1) == pytest.approx(9.0)
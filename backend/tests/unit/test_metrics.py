@@ -0,0 +1,78 @@
+"""In-process metrics 유닛 테스트"""
+
+import pytest
+
+from app.core.metrics import MetricsRegistry, percentile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock):
+    return MetricsRegistry(clock=clock)
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+
+    def test_empty(self):
+        assert percentile([], 99) == 0.0
+
+
+class TestHistograms:
+    def test_summary_merges_matching_series(self, registry):
+        for ms in range(1, 101):
+            registry.observe("cycle_stage_seconds", ms / 1000, stage="broker_order", pm="a")
+        registry.observe("cycle_stage_seconds", 5.0, stage="llm_decision", pm="a")
+        s = registry.summary("cycle_stage_seconds", stage="broker_order")
+        assert s["count"] == 100
+        assert s["p50_ms"] == 50.0
+        assert s["p99_ms"] == 99.0
+        assert registry.summary("cycle_stage_seconds", pm="a")["count"] == 101
+
+    def test_stage_timer_records_on_exception(self, registry):
+        with pytest.raises(ValueError):
+            with registry.stage("risk_check", pm="a"):
+                raise ValueError("boom")
+        assert registry.stage_summaries()["risk_check"]["count"] == 1
+
+    def test_prometheus_text(self, registry):
+        registry.observe("cycle_seconds", 0.02, description="cycle", pm='x"y')
+        registry.gauge_add("orders_pending", 1)
+        text = registry.render_prometheus()
+        assert "# HELP cycle_seconds cycle" in text
+        assert "# TYPE cycle_seconds histogram" in text
+        assert 'cycle_seconds_bucket{pm="x\\"y",le="0.025"} 1' in text
+        assert 'cycle_seconds_bucket{pm="x\\"y",le="+Inf"} 1' in text
+        assert 'cycle_seconds_count{pm="x\\"y"} 1' in text
+        assert "orders_pending 1" in text
+
+
+class TestGaugesAndEvents:
+    def test_in_progress_gauge(self, registry):
+        with registry.in_progress("orders_executing"):
+            assert registry.gauge("orders_executing") == 1
+        assert registry.gauge("orders_executing") == 0
+
+    def test_events_expire_after_24h(self, registry, clock):
+        registry.event("orders_rejected")
+        clock.now += 3600
+        registry.event("orders_rejected")
+        assert registry.count_24h("orders_rejected") == 2
+        clock.now += 86_400 - 1800
+        assert registry.count_24h("orders_rejected") == 1
@@ -0,0 +1,76 @@
+"""사이클 프로파일러 유닛 테스트"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import profiling
+from app.core.profiling import CycleProfiler, ProfilerBusy, _collapsed_from_frame, profile_call
+
+
+async def _work(n: int = 2000) -> int:
+    await asyncio.sleep(0)
+    return sum(i * i for i in range(n))
+
+
+class TestProfileCall:
+    @pytest.mark.asyncio
+    async def test_cprofile_fallback_returns_pstats(self):
+        result, report = await profile_call(_work, 100, target="t", fmt="html", engine="cprofile")
+        assert result == sum(i * i for i in range(100))
+        assert report.engine == "cprofile"
+        assert report.format == "pstats"
+        assert report.media_type == "text/plain"
+        assert "_work" in report.content
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_rejected(self):
+        with pytest.raises(ValueError):
+            await profile_call(_work, fmt="svg", engine="cprofile")
+
+    @pytest.mark.asyncio
+    async def test_busy_when_profile_running(self):
+        async def nested():
+            return await profile_call(_work, engine="cprofile")
+
+        with pytest.raises(ProfilerBusy):
+            await profile_call(nested, engine="cprofile")
+
+
+class TestCycleProfiler:
+    @pytest.mark.asyncio
+    async def test_off_by_default(self):
+        profiler = CycleProfiler()
+        assert await profiler.run(_work, 10) == sum(i * i for i in range(10))
+        assert not profiler.reports
+
+    @pytest.mark.asyncio
+    async def test_every_nth_call_keeps_last_k(self, monkeypatch):
+        monkeypatch.setattr(profiling, "PYINSTRUMENT_AVAILABLE", False)
+        profiler = CycleProfiler(every_n=2, keep=2)
+        for _ in range(6):
+            await profiler.run(_work, 10)
+        assert len(profiler.reports) == 2
+        ids = [r.id for r in profiler.reports]
+        assert profiler.get(ids[-1]) is profiler.reports[-1]
+        assert profiler.status()["reports"][0]["id"] == ids[-1]
+
+    def test_configure(self):
+        profiler = CycleProfiler(keep=5)
+        profiler.configure(every_n=3, keep=1, fmt="collapsed")
+        assert (profiler.every_n, profiler.reports.maxlen, profiler.fmt) == (3, 1, "collapsed")
+        with pytest.raises(ValueError):
+            profiler.configure(fmt="svg")
+
+
+def test_collapsed_stacks_from_frame_tree():
+    def frame(fn, self_time, children=()):
+        return SimpleNamespace(function=fn, file_path_short="m.py", line_no=1,
+                               self_time=self_time, children=list(children))
+
+    root = frame("tick", 0.0, [frame("fetch", 0.002), frame("decide", 0.001, [frame("llm", 0.005)])])
+    lines = _collapsed_from_frame(root).splitlines()
+    assert "tick (m.py:1);fetch (m.py:1) 2000" in lines
+    assert "tick (m.py:1);decide (m.py:1);llm (m.py:1) 5000" in lines
+    assert len(lines) == 3
@@ -0,0 +1,93 @@
+"""Replay harness 유닛 테스트 (가상 시계 + 가격 소스 훅 + 결정적 재생)"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.engines import market_data
+from app.engines.replay import BarReplaySource, ReplayHarness, StandInLLM, VirtualClock
+
+
+@pytest.fixture
+def bars():
+    index = pd.date_range("2024-01-02 09:30", periods=50, freq="5min")
+    return pd.DataFrame({"SPY": np.arange(50, dtype=float) + 400, "QQQ": np.arange(50, dtype=float) + 300}, index=index)
+
+
+class TestBarReplaySource:
+    def test_no_look_ahead(self, bars):
+        clock = VirtualClock(bars.index[9].to_pydatetime())
+        source = BarReplaySource(bars, clock)
+        history = source.history("SPY", 30)
+        assert len(history) == 10
+        assert history.index[-1] == bars.index[9]
+        assert source.current("SPY") == 409.0
+
+    def test_between_bars_uses_last_closed(self, bars):
+        clock = VirtualClock(bars.index[9].to_pydatetime() + timedelta(minutes=2))
+        assert BarReplaySource(bars, clock).current("SPY") == 409.0
+
+    def test_lookback_cap(self, bars):
+        clock = VirtualClock(bars.index[-1].to_pydatetime())
+        assert len(BarReplaySource(bars, clock, lookback_bars=20).history("QQQ", 30)) == 20
+
+    def test_unknown_symbol_and_before_start(self, bars):
+        clock = VirtualClock(datetime(2020, 1, 1))
+        source = BarReplaySource(bars, clock)
+        assert source.history("SPY", 30) is None
+        clock.set(bars.index[-1].to_pydatetime())
+        assert source.history("NOPE", 30) is None
+        assert source.current("NOPE") == 0.0
+
+
+class TestPriceSourceHook:
+    def test_market_data_uses_source_and_restores(self, bars):
+        clock = VirtualClock(bars.index[4].to_pydatetime())
+        previous = market_data.set_price_source(BarReplaySource(bars, clock))
+        try:
+            assert market_data.get_current_price("SPY") == 404.0
+            assert market_data.get_current_prices(["SPY", "QQQ"]) == {"SPY": 404.0, "QQQ": 304.0}
+            assert len(market_data.get_price_history("SPY", 30)) == 5
+        finally:
+            assert market_data.set_price_source(previous) is not None
+        assert market_data._price_source is previous
+
+
+class TestStandInLLM:
+    def test_thresholds(self):
+        llm = StandInLLM()
+        decide = lambda score: asyncio.run(llm.make_decision("pm", "SPY", {"composite_score": score}, {}))
+        assert decide(0.5)["action"] == "BUY"
+        assert decide(-0.5)["action"] == "SELL"
+        assert decide(0.1)["action"] == "HOLD"
+        assert llm.calls == 3
+
+
+class TestReplayHarness:
+    def test_requires_warmup_bars(self, bars):
+        with pytest.raises(ValueError):
+            ReplayHarness(bars.iloc[:10])
+
+    def test_deterministic_replay(self):
+        first = asyncio.run(ReplayHarness.synthetic(days=1, seed=7).run(ticks=8))
+        second = asyncio.run(ReplayHarness.synthetic(days=1, seed=7).run(ticks=8))
+        assert first.ticks == 8
+        assert len(first.nav) == 9
+        assert first.ticks_per_sec > 0
+        assert first.nav == second.nav
+        assert first.trades == second.trades
+        # 가상 시각으로 NAV 기록
+        assert first.nav[1][0] - first.nav[0][0] == timedelta(minutes=5)
+
+    def test_restores_globals(self):
+        import app.engines.broker as broker_mod
+        import app.engines.trading_cycle as cycle_mod
+
+        llm, broker_fn = cycle_mod.llm_engine, broker_mod.get_broker_for_pm
+        asyncio.run(ReplayHarness.synthetic(days=1).run(ticks=1))
+        assert cycle_mod.llm_engine is llm
+        assert broker_mod.get_broker_for_pm is broker_fn
+        assert market_data._price_source is None
@@ -0,0 +1,146 @@
+"""데이터 버전 + 응답 캐시 미들웨어 유닛 테스트"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from app.core import data_version
+from app.core.response_cache import ResponseCacheMiddleware
+from app.db.base import Base
+from app.models.pm import PM
+from app.models.scheduler_lease import SchedulerLease
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+Session = sessionmaker(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    data_version.install()
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = Session()
+    yield session
+    session.close()
+
+
+def _pm(pm_id: str) -> PM:
+    return PM(id=pm_id, name=pm_id, emoji="🤖", strategy="t", llm_provider="mock",
+              current_capital=100_000.0, is_active=True)
+
+
+def _app():
+    app = FastAPI()
+    calls = {"n": 0}
+
+    @app.get("/api/fund/stats")
+    def stats(limit: int = 10):
+        calls["n"] += 1
+        return {"calls": calls["n"], "limit": limit}
+
+    @app.get("/api/fund/live")
+    def live():
+        calls["n"] += 1
+        return {"calls": calls["n"]}
+
+    app.add_middleware(ResponseCacheMiddleware, paths=["/api/fund/stats", "/api/fund/analytics/"], ttl=60)
+    return app, calls
+
+
+class TestDataVersion:
+    def test_commit_with_writes_bumps(self, db):
+        before = data_version.current()
+        db.add(_pm("a"))
+        db.commit()
+        assert data_version.current() > before
+
+    def test_read_only_commit_does_not_bump(self, db):
+        db.add(_pm("a"))
+        db.commit()
+        before = data_version.current()
+        db.query(PM).all()
+        db.commit()
+        assert data_version.current() == before
+
+    def test_bulk_update_bumps(self, db):
+        db.add(_pm("a"))
+        db.commit()
+        before = data_version.current()
+        db.execute(update(PM).where(PM.id == "a").values(current_capital=1.0))
+        db.commit()
+        assert data_version.current() > before
+
+    def test_ignored_tables_and_rollback(self, db):
+        before = data_version.current()
+        db.add(SchedulerLease(name="x", holder="w"))
+        db.commit()
+        db.add(_pm("b"))
+        db.flush()
+        db.rollback()
+        db.commit()
+        assert data_version.current() == before
+
+
+class TestResponseCacheMiddleware:
+    def test_repeat_request_served_from_cache(self):
+        app, calls = _app()
+        client = TestClient(app)
+        first = client.get("/api/fund/stats")
+        second = client.get("/api/fund/stats")
+        assert first.json() == second.json()
+        assert calls["n"] == 1
+        assert first.headers["etag"] == second.headers["etag"]
+
+    def test_if_none_match_returns_304(self):
+        app, _ = _app()
+        client = TestClient(app)
+        etag = client.get("/api/fund/stats").headers["etag"]
+        resp = client.get("/api/fund/stats", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_etag_is_weak_and_survives_gzip(self):
+        from starlette.middleware.gzip import GZipMiddleware
+
+        app, calls = _app()
+        app.add_middleware(GZipMiddleware, minimum_size=1)
+        client = TestClient(app)
+        plain = client.get("/api/fund/stats", headers={"Accept-Encoding": "identity"})
+        gzipped = client.get("/api/fund/stats", headers={"Accept-Encoding": "gzip"})
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert plain.headers["etag"].startswith('W/"')
+        assert gzipped.headers["etag"] == plain.headers["etag"]
+        resp = client.get("/api/fund/stats", headers={
+            "Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"][2:],
+        })
+        assert resp.status_code == 304
+        assert calls["n"] == 1
+
+    def test_version_bump_invalidates(self):
+        app, calls = _app()
+        client = TestClient(app)
+        client.get("/api/fund/stats")
+        data_version.bump()
+        assert client.get("/api/fund/stats").json()["calls"] == 2
+
+    def test_query_params_part_of_key(self):
+        app, calls = _app()
+        client = TestClient(app)
+        client.get("/api/fund/stats?limit=5")
+        client.get("/api/fund/stats?limit=6")
+        assert calls["n"] == 2
+
+    def test_uncached_paths_pass_through(self):
+        app, calls = _app()
+        client = TestClient(app)
+        client.get("/api/fund/live")
+        resp = client.get("/api/fund/live")
+        assert resp.json()["calls"] == 2
+        assert "etag" not in resp.headers
@@ -0,0 +1,60 @@
+"""FastJSONResponse + gzip 압축 유닛 테스트"""
+
+import json
+from datetime import datetime
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+from app.core.responses import FastJSONResponse, dumps
+
+
+def _app():
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/large")
+    def large():
+        return FastJSONResponse({"history": [{"nav": 1_000_000.0 + i, "i": i} for i in range(500)]})
+
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    return app
+
+
+class TestDumps:
+    def test_matches_stdlib_json(self):
+        payload = {"a": 1, "b": [1.5, None, "한글"], "c": {"d": True}}
+        assert json.loads(dumps(payload)) == payload
+
+    def test_serializes_numpy(self):
+        payload = {"arr": np.array([1.0, 2.5]), "x": np.float64(3.25), "n": np.int64(7)}
+        assert json.loads(dumps(payload)) == {"arr": [1.0, 2.5], "x": 3.25, "n": 7}
+
+    def test_serializes_datetime(self):
+        out = json.loads(dumps({"t": datetime(2024, 1, 2, 3, 4, 5)}))
+        assert out["t"].startswith("2024-01-02")
+
+
+class TestGzip:
+    def test_large_response_compressed(self):
+        client = TestClient(_app())
+        resp = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert len(resp.json()["history"]) == 500
+
+    def test_small_response_not_compressed(self):
+        client = TestClient(_app())
+        resp = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+        assert resp.json() == {"ok": True}
+
+    def test_no_accept_encoding_not_compressed(self):
+        client = TestClient(_app())
+        resp = client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+        assert resp.json()["history"][0]["i"] == 0
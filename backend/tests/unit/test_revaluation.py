@@ -0,0 +1,88 @@
+"""PM 자본 일괄 재평가 서비스 유닛 테스트"""
+
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.pm import PM
+from app.models.position import Position
+from app.services.revaluation import revalue_pms
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+Session = sessionmaker(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = Session()
+    yield session
+    session.close()
+
+
+def _pm(pm_id: str, capital: float = 100_000.0) -> PM:
+    return PM(id=pm_id, name=pm_id, emoji="🤖", strategy="t", llm_provider="mock",
+              current_capital=capital, is_active=True)
+
+
+class TestRevaluePms:
+    def test_cash_plus_market_value(self, db):
+        db.add_all([_pm("a"), Position(pm_id="a", symbol="SPY", quantity=10.0, avg_cost=100.0)])
+        db.commit()
+        result = revalue_pms(db, ["a"], prices={"SPY": 110.0})
+        # 현금 99,000 + 평가액 1,100
+        assert result == {"a": pytest.approx(100_100.0)}
+
+    def test_multiple_pms_single_bulk_update(self, db):
+        db.add_all([
+            _pm("a"), _pm("b", 50_000.0), _pm("c"),
+            Position(pm_id="a", symbol="SPY", quantity=10.0, avg_cost=100.0),
+            Position(pm_id="a", symbol="QQQ", quantity=5.0, avg_cost=200.0),
+            Position(pm_id="b", symbol="SPY", quantity=1.0, avg_cost=100.0),
+        ])
+        db.commit()
+
+        statements = []
+        listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            result = revalue_pms(db, ["a", "b", "c"], prices={"SPY": 120.0, "QQQ": 180.0})
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert result["a"] == pytest.approx(100_000.0 - 2_000.0 + 1_200.0 + 900.0)
+        assert result["b"] == pytest.approx(50_000.0 - 100.0 + 120.0)
+        assert result["c"] == pytest.approx(100_000.0)
+        assert sum(1 for s in statements if s.lstrip().upper().startswith("SELECT")) == 1
+        assert sum(1 for s in statements if s.lstrip().upper().startswith("UPDATE")) == 1
+
+    def test_loaded_instances_are_synced(self, db):
+        pm = _pm("a")
+        db.add_all([pm, Position(pm_id="a", symbol="SPY", quantity=10.0, avg_cost=100.0)])
+        db.commit()
+        revalue_pms(db, ["a"], prices={"SPY": 90.0})
+        assert pm.current_capital == pytest.approx(99_900.0)
+        db.commit()
+        assert db.query(PM).filter_by(id="a").one().current_capital == pytest.approx(99_900.0)
+
+    def test_missing_prices_fetched_in_one_batch(self, db):
+        db.add_all([
+            _pm("a"),
+            Position(pm_id="a", symbol="SPY", quantity=1.0, avg_cost=100.0),
+            Position(pm_id="a", symbol="TLT", quantity=1.0, avg_cost=100.0),
+        ])
+        db.commit()
+        with patch("app.engines.market_data.get_current_prices", return_value={"TLT": 100.0}) as mock_batch:
+            revalue_pms(db, ["a"], prices={"SPY": 100.0})
+        mock_batch.assert_called_once_with({"TLT"})
+
+    def test_empty_ids(self, db):
+        assert revalue_pms(db, []) == {}
@@ -0,0 +1,79 @@
+"""리스크 가드 유닛 테스트 (틱 내 미커밋 체결 반영)"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.engines.risk_guard import _trade_pnl, check_risk
+from app.models.pm import PM
+from app.models.trade import Trade
+from app.services.cycle_writer import CycleWriteBuffer
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+Session = sessionmaker(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def pm(db):
+    pm = PM(id="live", name="live", emoji="🤖", strategy="t", llm_provider="rule_based",
+            broker_type="kis", initial_capital=100_000.0, current_capital=100_000.0, is_active=True)
+    db.add(pm)
+    db.commit()
+    return pm
+
+
+def _sell(pm_id: str, pnl: float) -> dict:
+    return dict(pm_id=pm_id, symbol="SPY", action="SELL", quantity=1.0, price=100.0, conviction_score=0.7,
+                reasoning=f"[KISAdapter] SELL at $100.0000 (P&L: ${pnl:+.2f}, fee: $0.1000)", fee=0.1)
+
+
+def test_trade_pnl_parses_cycle_reasoning():
+    assert _trade_pnl("[PaperAdapter] SELL at $1.0000 (P&L: $-12.50, fee: $0.0100)") == -12.5
+    assert _trade_pnl("bench (P&L: $+3.00)") == 3.0
+    assert _trade_pnl("BUY at $1.0000 (fee: $0.0100)") is None
+
+
+def test_staged_losses_count_toward_daily_limit(db, pm):
+    buffer = CycleWriteBuffer()
+    writer = buffer.writer(db, pm.id)
+    assert check_risk(pm, "BUY", 1_000.0, db, staged_trades=writer.staged_trades(pm.id))[0]
+
+    # 같은 틱에서 이미 체결된 손실 매도 (DB에는 아직 없음)
+    writer.add_trade(**_sell(pm.id, -3_000.0))
+    writer.add_trade(**_sell(pm.id, -2_500.0))
+    assert db.query(Trade).count() == 0
+    allowed, reason = check_risk(pm, "BUY", 1_000.0, db, staged_trades=writer.staged_trades(pm.id))
+    assert not allowed
+    assert "Daily loss" in reason
+
+
+def test_staged_sells_extend_consecutive_losses(db, pm, monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "max_consecutive_losses", 3)
+    db.add_all([Trade(**_sell(pm.id, -10.0)), Trade(**_sell(pm.id, -10.0))])
+    db.commit()
+    assert check_risk(pm, "SELL", 1_000.0, db)[0]
+
+    staged = [_sell(pm.id, -10.0)]
+    allowed, reason = check_risk(pm, "SELL", 1_000.0, db, staged_trades=staged)
+    assert not allowed
+    assert "consecutive losses" in reason
+
+    # 가장 최근(틱 내) 매도가 이익이면 연속 손실 아님
+    assert check_risk(pm, "SELL", 1_000.0, db, staged_trades=staged + [_sell(pm.id, 5.0)])[0]
@@ -0,0 +1,56 @@
+"""가중치 렉시콘 감성 스코어러 유닛 테스트"""
+
+import pytest
+
+from app.engines.sentiment import SentimentScorer, score_headlines
+
+
+class TestSentimentScorer:
+    def test_word_boundaries(self):
+        scorer = SentimentScorer()
+        assert scorer.score("Company announces buyback") == 0.0
+        assert scorer.score("They belong together") == 0.0
+        assert scorer.score("Time to buy") > 0
+
+    def test_phrase_beats_single_words(self):
+        # "short squeeze"는 short(-) + squeeze(+)가 아닌 하나의 강세 구문
+        assert SentimentScorer().score("Massive short squeeze underway") == 1.0
+
+    def test_weights(self):
+        scorer = SentimentScorer({"up": 2.0, "down": -1.0})
+        assert scorer.score("up and down") == pytest.approx((2.0 - 1.0) / 3.0)
+
+    def test_extend_overrides_and_adds(self):
+        scorer = SentimentScorer({"up": 1.0}).extend({"halted": -1.0})
+        assert scorer.score("trading halted") == -1.0
+        assert scorer.score("up") == 1.0
+
+    def test_case_insensitive(self):
+        scorer = SentimentScorer()
+        assert scorer.score("MOON BUY") == scorer.score("moon buy")
+
+    def test_empty_lexicon(self):
+        assert SentimentScorer({}).score("buy buy buy") == 0.0
+
+
+class TestScoreBatch:
+    def test_per_headline_and_aggregate(self):
+        result = score_headlines(["Analysts upgrade NVDA", "Stock plunges after lawsuit", "Quiet day"])
+        assert result.scores[0] > 0
+        assert result.scores[1] < 0
+        assert result.scores[2] == 0.0
+        assert result.hits == [1, 2, 0]
+        assert result.aggregate == pytest.approx(sum(result.scores) / 3)
+
+    def test_matches_single_scoring(self):
+        headlines = ["buy the dip", "sell everything", "bullish calls and bearish puts", ""]
+        scorer = SentimentScorer()
+        batch = scorer.score_batch(headlines)
+        assert batch.scores == [scorer.score(h) for h in headlines]
+
+    def test_phrase_does_not_span_headlines(self):
+        result = SentimentScorer({"short squeeze": 1.0, "short": -1.0}).score_batch(["short", "squeeze"])
+        assert result.scores == [-1.0, 0.0]
+
+    def test_empty_batch(self):
+        assert score_headlines([]).aggregate == 0.0
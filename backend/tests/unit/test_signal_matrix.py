@@ -0,0 +1,135 @@
+"""틱 단위 시그널 매트릭스 유닛 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.engines.market_data import PM_WATCHLISTS
+from app.engines.signal_matrix import SignalMatrix
+from app.models.pm import PM
+from app.models.signal import Signal
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+Session = sessionmaker(bind=engine)
+
+CONTEXT = {"spy_price": 100.0, "vix": 15.0, "market_regime": "risk_on"}
+
+
+def _history(symbol: str, days: int = 60) -> pd.Series:
+    return pd.Series(np.linspace(90.0, 110.0, days))
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = Session()
+    yield session
+    session.close()
+
+
+class TestUniverse:
+    def test_union_is_deduplicated(self):
+        symbols = SignalMatrix.universe(["atlas", "drflow", "quantking"])
+        assert symbols.count("SPY") == 1
+        assert set(PM_WATCHLISTS["atlas"]) <= set(symbols)
+
+    def test_unknown_pm_defaults_to_spy(self):
+        assert SignalMatrix.universe(["nobody"]) == ["SPY"]
+
+
+class TestRefresh:
+    @pytest.mark.asyncio
+    async def test_fetches_each_symbol_once(self):
+        history_fn = MagicMock(side_effect=_history)
+        matrix = SignalMatrix()
+        with patch("app.engines.signal_matrix.get_market_context", return_value=CONTEXT):
+            await matrix.refresh(
+                SignalMatrix.universe(["satoshi", "crypto_quant", "bear_guard"]),
+                history_fn=history_fn,
+                price_fn=lambda s: 101.0,
+            )
+        fetched = [c.args[0] for c in history_fn.call_args_list]
+        assert len(fetched) == len(set(fetched))
+        assert matrix.get("BTC-USD").signals["symbol"] == "BTC-USD"
+        assert matrix.get("BTC-USD").current_price == 101.0
+        assert matrix.market_context == CONTEXT
+
+    @pytest.mark.asyncio
+    async def test_insufficient_or_failed_history_drops_entry(self):
+        matrix = SignalMatrix()
+        with patch("app.engines.signal_matrix.get_market_context", return_value=CONTEXT):
+            await matrix.refresh(["SPY"], history_fn=_history, price_fn=lambda s: 100.0)
+            assert matrix.get("SPY") is not None
+            await matrix.refresh(["SPY"], history_fn=lambda s, d: None, price_fn=lambda s: 100.0)
+        assert matrix.get("SPY") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_is_isolated(self):
+        def history_fn(symbol, days):
+            if symbol == "QQQ":
+                raise OSError("network")
+            return _history(symbol, days)
+
+        matrix = SignalMatrix()
+        with patch("app.engines.signal_matrix.get_market_context", return_value=CONTEXT):
+            await matrix.refresh(["SPY", "QQQ"], history_fn=history_fn, price_fn=lambda s: 100.0)
+        assert matrix.get("SPY") is not None
+        assert matrix.get("QQQ") is None
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_is_isolated(self):
+        def history_fn(symbol, days):
+            if symbol == "QQQ":
+                raise RuntimeError("bad ticker payload")
+            return _history(symbol, days)
+
+        matrix = SignalMatrix()
+        with patch("app.engines.signal_matrix.get_market_context", return_value=CONTEXT):
+            await matrix.refresh(["SPY", "QQQ"], history_fn=history_fn, price_fn=lambda s: 100.0)
+        assert matrix.get("SPY") is not None
+        assert matrix.get("QQQ") is None
+
+    @pytest.mark.asyncio
+    async def test_default_sources_resolved_at_call_time(self):
+        matrix = SignalMatrix()
+        with patch("app.engines.signal_matrix.get_market_context", return_value=CONTEXT), \
+             patch("app.engines.market_data.get_price_history", side_effect=_history), \
+             patch("app.engines.market_data.get_current_price", return_value=123.0):
+            await matrix.refresh(["SPY"])
+        assert matrix.get("SPY").current_price == 123.0
+
+
+class TestRunPmCycleWithMatrix:
+    @pytest.mark.asyncio
+    async def test_reads_signals_from_matrix(self, db):
+        from app.engines.trading_cycle import run_pm_cycle
+
+        pm = PM(id="quantking", name="QK", emoji="📊", strategy="q", llm_provider="rule_based",
+                current_capital=100_000.0, is_active=True)
+        db.add(pm)
+        db.commit()
+
+        matrix = SignalMatrix()
+        with patch("app.engines.signal_matrix.get_market_context", return_value=CONTEXT):
+            await matrix.refresh(PM_WATCHLISTS["quantking"], history_fn=_history, price_fn=lambda s: 100.0)
+
+        with patch("app.engines.trading_cycle.get_price_history") as mock_history, \
+             patch("app.engines.trading_cycle.get_prices_for_pm") as mock_prices, \
+             patch("app.engines.trading_cycle.get_market_context") as mock_context:
+            result = await run_pm_cycle(pm, db, matrix=matrix)
+            mock_history.assert_not_called()
+            mock_prices.assert_not_called()
+            mock_context.assert_not_called()
+
+        assert result["symbol"] in PM_WATCHLISTS["quantking"]
+        assert db.query(Signal).filter_by(pm_id="quantking").count() == 1
@@ -1,5 +1,10 @@
 """SocialEngine 추가 유닛 테스트"""
 
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
 from app.engines.social import SocialEngine
 
 
@@ -147,3 +152,41 @@ class TestGetVoxpopuliSignals:
         assert "reddit_mentions" in s
         assert "trends_interest" in s
         assert "trends_trending" in s
+
+
+class TestAsyncVoxpopuliSignals:
+    def setup_method(self):
+        self.engine = SocialEngine()
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_shape(self):
+        fgi = {"score": 40.0, "rating": "Fear"}
+        with patch.object(self.engine, "afetch_fear_greed_index", AsyncMock(return_value=fgi)), \
+             patch.object(self.engine, "fetch_yahoo_news", side_effect=self.engine._mock_yahoo_news):
+            result = await self.engine.aget_voxpopuli_signals(["GME", "AMC"])
+        assert {s["symbol"] for s in result} == {"GME", "AMC"}
+        assert all(s["fear_greed_score"] == 40.0 for s in result)
+
+    @pytest.mark.asyncio
+    async def test_repeat_calls_served_from_cache(self):
+        fgi = AsyncMock(return_value={"score": 50.0, "rating": "Neutral"})
+        with patch.object(self.engine, "afetch_fear_greed_index", fgi), \
+             patch.object(self.engine, "fetch_yahoo_news", side_effect=self.engine._mock_yahoo_news) as news:
+            await self.engine.aget_voxpopuli_signals(["GME", "AMC"])
+            await self.engine.aget_voxpopuli_signals(["GME", "AMC"])
+        assert fgi.await_count == 1
+        assert news.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sources_fetched_concurrently(self):
+        def slow_news(symbol):
+            time.sleep(0.2)
+            return self.engine._mock_yahoo_news(symbol)
+
+        fgi = AsyncMock(return_value={"score": 50.0, "rating": "Neutral"})
+        with patch.object(self.engine, "afetch_fear_greed_index", fgi), \
+             patch.object(self.engine, "fetch_yahoo_news", side_effect=slow_news):
+            started = time.perf_counter()
+            await self.engine.aget_voxpopuli_signals(["GME", "AMC", "TSLA", "NVDA"])
+            elapsed = time.perf_counter() - started
+        assert elapsed < 0.6
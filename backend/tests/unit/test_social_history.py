@@ -0,0 +1,110 @@
+"""소셜 언급량 시계열 / 지수가중 z-score 유닛 테스트"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.engines.social import SocialEngine
+from app.models.social_mention import SocialMention, SocialMentionStats
+from app.services.social_history import mention_history, record_mentions, running_zscore
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+Session = sessionmaker(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    session = Session()
+    yield session
+    session.close()
+
+
+def _obs(count: float, ts: str, symbol: str = "GME", source: str = "yahoo_finance") -> dict:
+    return {"symbol": symbol, "source": source, "mention_count": count, "sentiment": 0.5, "timestamp": ts}
+
+
+class TestRunningZscore:
+    def test_matches_calculate_zscore(self, db):
+        history = [10, 11, 9, 10, 12, 10, 9, 11, 10, 50]
+        result = {}
+        for i, v in enumerate(history):
+            result = record_mentions(db, [_obs(v, f"t{i}")])
+        expected = SocialEngine().calculate_zscore(history)
+        assert result["GME"] == pytest.approx(expected)
+
+    def test_baseline_adapts_to_level_shift(self, db, monkeypatch):
+        from app.config import settings
+        monkeypatch.setattr(settings, "social_zscore_window", 10)
+        values = [10, 11, 9, 10] * 25 + [100, 101, 99, 100] * 10
+        result = {}
+        for i, v in enumerate(values):
+            result = record_mentions(db, [_obs(v, f"t{i}")])
+        stats = db.query(SocialMentionStats).filter_by(symbol="GME").one()
+        assert stats.mean == pytest.approx(100.0, abs=1.0)
+        assert abs(result["GME"]) < 2.0
+
+    def test_short_history_is_zero(self):
+        assert running_zscore(1, 10.0, 0.0, 50.0) == 0.0
+
+    def test_flat_history_is_zero(self):
+        assert running_zscore(5, 10.0, 0.0, 50.0) == 0.0
+
+
+class TestRecordMentions:
+    def test_appends_rows_and_updates_stats(self, db):
+        record_mentions(db, [_obs(10, "t0"), _obs(3, "t0", symbol="AMC")])
+        record_mentions(db, [_obs(20, "t1")])
+        db.commit()
+        assert db.query(SocialMention).count() == 3
+        stats = db.query(SocialMentionStats).filter_by(symbol="GME").one()
+        assert stats.count == 2
+        assert stats.mean == pytest.approx(15.0)
+        assert mention_history(db, "GME", "yahoo_finance") == [10.0, 20.0]
+
+    def test_same_observation_not_recorded_twice(self, db):
+        for i, v in enumerate([10, 12, 11]):
+            record_mentions(db, [_obs(v, f"t{i}")])
+        first = record_mentions(db, [_obs(40, "t3")])
+        again = record_mentions(db, [_obs(40, "t3")])
+        assert again == first
+        assert db.query(SocialMention).count() == 4
+
+    def test_sources_tracked_separately(self, db):
+        record_mentions(db, [_obs(10, "t0"), _obs(99, "t0", source="yahoo_mock")])
+        assert db.query(SocialMentionStats).count() == 2
+
+
+class TestVoxpopuliWithHistory:
+    def test_zscore_from_recorded_history(self, db):
+        engine = SocialEngine()
+        for i, v in enumerate([10, 11, 9, 10, 12, 10, 9, 11, 10]):
+            record_mentions(db, [_obs(v, f"t{i}")])
+        db.commit()
+        engine.fetch_fear_greed_index = lambda: {"score": 50.0, "rating": "Neutral"}
+        engine.fetch_yahoo_news = lambda symbol: {**_obs(50, "t9", symbol=symbol), "sentiment": 0.8}
+
+        signals = engine.get_voxpopuli_signals(["GME"], db=db)
+        assert signals[0]["is_tipping_point"] is True
+        assert signals[0]["direction"] == "bullish"
+
+    def test_follower_reads_trends_stored_by_leader(self, db):
+        from app.engines.trends import trend_stats
+        from app.models.trend_snapshot import TrendSnapshot
+
+        db.add(TrendSnapshot(keyword="GME", timeframe="now 7-d", payload=trend_stats("GME", [10, 10, 90])))
+        db.commit()
+        engine = SocialEngine()  # 수집하지 않은 워커 — 프로세스 캐시 비어 있음
+        engine.fetch_fear_greed_index = lambda: {"score": 50.0, "rating": "Neutral"}
+        engine.fetch_yahoo_news = lambda symbol: _obs(10, "t0", symbol=symbol)
+
+        signals = {s["symbol"]: s for s in engine.get_voxpopuli_signals(["GME", "AMC"], db=db)}
+        assert signals["GME"]["trends_interest"] == 90
+        assert signals["GME"]["trends_trending"] is True
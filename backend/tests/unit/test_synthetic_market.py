@@ -0,0 +1,66 @@
+"""합성 시장 시뮬레이터 유닛 테스트"""
+
+import os
+import subprocess
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from app.engines.synthetic_market import AssetClass, SyntheticMarket, synthetic_market
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+DAY = 739_000
+
+
+class TestSyntheticMarket:
+    def test_shape_and_base_price(self):
+        paths = synthetic_market.simulate(["SPY", "BTC-USD"], 30, day=DAY)
+        assert paths.shape == (31, 2)
+        assert paths[0, 0] == 485.0
+        assert (paths > 0).all()
+
+    def test_stable_across_hash_seeds(self):
+        code = (
+            "from app.engines.synthetic_market import synthetic_market as m;"
+            f"print(repr(m.simulate(['SPY', 'GME'], 5, day={DAY})[-1].tolist()))"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout
+            for seed in ("1", "2")
+        }
+        assert len(outputs) == 1
+        assert outputs.pop().strip() == repr(synthetic_market.simulate(["SPY", "GME"], 5, day=DAY)[-1].tolist())
+
+    def test_single_symbol_matches_universe(self):
+        alone = synthetic_market.simulate(["AAPL"], 50, day=DAY)[:, 0]
+        together = synthetic_market.simulate(["SPY", "AAPL", "TLT"], 50, day=DAY)[:, 1]
+        assert (alone == together).all()
+
+    def test_correlation_structure(self):
+        frame = synthetic_market.frame(["SPY", "QQQ", "SQQQ"], 1_000, day=DAY)
+        corr = frame.pct_change().dropna().corr()
+        assert corr.loc["SPY", "QQQ"] > 0.7
+        assert corr.loc["SPY", "SQQQ"] < -0.5
+
+    def test_day_changes_path(self):
+        a = synthetic_market.simulate(["SPY"], 10, day=DAY)
+        b = synthetic_market.simulate(["SPY"], 10, day=DAY + 1)
+        assert (a != b).any()
+
+    def test_intraday_history(self):
+        series = synthetic_market.history("ETH-USD", 2, interval=timedelta(minutes=5), day=DAY)
+        assert len(series) == 2 * 288 + 1
+        assert series.index[1] - series.index[0] == timedelta(minutes=5)
+
+    def test_unknown_symbols_classified(self):
+        assert synthetic_market.asset_class("DOGE2-USD") == "crypto"
+        assert synthetic_market.asset_class("XYZ") == "equity"
+
+    def test_invalid_loadings_rejected(self):
+        with pytest.raises(ValueError):
+            SyntheticMarket(asset_classes={"equity": AssetClass(0.1, 0.2, beta=0.9, class_loading=0.9)})
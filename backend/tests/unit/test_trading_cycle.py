@@ -127,6 +127,13 @@ class TestRecordNav:
         result = record_nav(db)
         assert result["nav"] == 0.0
 
+    def test_recorded_at_override(self, db, pm):
+        from datetime import datetime
+
+        when = datetime(2024, 1, 2, 9, 35)
+        record_nav(db, recorded_at=when)
+        assert db.query(NAVHistory).one().recorded_at == when
+
 
 class TestSeedNavHistory:
     def test_seeds_correct_number_of_records(self, db, pm):
@@ -146,6 +153,51 @@ class TestSeedNavHistory:
         for r in records:
             assert r.nav > 0
 
+    def test_deterministic_path(self, db, pm):
+        seed_nav_history(db, days=10)
+        first = [r.nav for r in db.query(NAVHistory).order_by(NAVHistory.id).all()]
+        db.query(NAVHistory).delete()
+        db.commit()
+        seed_nav_history(db, days=10)
+        second = [r.nav for r in db.query(NAVHistory).order_by(NAVHistory.id).all()]
+        assert first == second
+
+    def test_intraday_interval_bulk(self, db, pm):
+        import time
+        from datetime import timedelta
+
+        t = time.perf_counter()
+        seed_nav_history(db, days=365, interval=timedelta(minutes=5))
+        elapsed = time.perf_counter() - t
+        assert db.query(NAVHistory).count() == 365 * 288 + 1
+        assert elapsed < 5.0
+
+    def test_last_record_is_current_capital(self, db, pm):
+        seed_nav_history(db, days=5)
+        last = db.query(NAVHistory).order_by(NAVHistory.id.desc()).first()
+        assert last.nav == 100_000.0
+        assert last.daily_return == 0.0
+
+
+class TestSeedPms:
+    def test_seeds_all_once(self, db):
+        from app.db.seed import PM_SEEDS, seed_pms
+
+        seed_pms(db)
+        seed_pms(db)
+        assert db.query(PM).count() == len(PM_SEEDS)
+
+    def test_keeps_existing_rows(self, db, pm):
+        from app.db.seed import PM_SEEDS, seed_pms
+
+        db.add(PM(id="atlas", name="Custom", emoji="x", strategy="s", llm_provider="mock",
+                  current_capital=5.0))
+        db.commit()
+        seed_pms(db)
+        db.expire_all()
+        assert db.get(PM, "atlas").current_capital == 5.0
+        assert db.query(PM).count() == len(PM_SEEDS) + 1
+
 
 class TestExecuteBuy:
     @pytest.mark.asyncio
@@ -253,6 +305,65 @@ class TestSeedNavHistoryNoPms:
 
 
 class TestRunPmCycleMocked:
+    @pytest.mark.asyncio
+    async def test_records_stage_metrics(self, db, pm):
+        import pandas as pd
+        import numpy as np
+        from app.core.metrics import metrics
+        from app.engines.trading_cycle import run_pm_cycle
+
+        metrics.reset()
+        prices = pd.Series(np.ones(60) * 100.0)
+        with patch("app.engines.trading_cycle.get_price_history", return_value=prices), \
+             patch("app.engines.trading_cycle.get_prices_for_pm", return_value={"SPY": 100.0}), \
+             patch("app.engines.trading_cycle.get_market_context", return_value={"spy_price": 100.0, "vix": 15.0}), \
+             patch("app.engines.trading_cycle.llm_engine.make_decision", new_callable=AsyncMock,
+                   return_value={"action": "BUY", "conviction": 0.9, "reasoning": "buy", "position_size": 0.03}):
+            result = await run_pm_cycle(pm, db)
+        assert result.get("trade_executed")
+        stages = metrics.stage_summaries(pm="testpm")
+        for stage in ("price_fetch", "signal_generation", "llm_decision", "broker_order", "db_commit"):
+            assert stages[stage]["count"] == 1
+        assert metrics.summary("cycle_seconds", pm="testpm")["count"] == 1
+        assert metrics.count_24h("orders_completed") == 1
+        assert metrics.gauge("orders_pending") == 0
+        assert metrics.gauge("orders_executing") == 0
+
+    @pytest.mark.asyncio
+    async def test_order_moves_from_pending_to_executing(self, db, pm):
+        import pandas as pd
+        import numpy as np
+        from app.core.metrics import metrics
+        from app.engines.broker import PaperAdapter
+        from app.engines.trading_cycle import _get_cash, run_pm_cycle
+
+        metrics.reset()
+        seen = {}
+
+        def cash(*args, **kwargs):
+            seen["checks"] = (metrics.gauge("orders_pending"), metrics.gauge("orders_executing"))
+            return _get_cash(*args, **kwargs)
+
+        class ObservedBroker(PaperAdapter):
+            async def place_order(self, *args, **kwargs):
+                seen["broker"] = (metrics.gauge("orders_pending"), metrics.gauge("orders_executing"))
+                return await super().place_order(*args, **kwargs)
+
+        prices = pd.Series(np.ones(60) * 100.0)
+        with patch("app.engines.trading_cycle.get_price_history", return_value=prices), \
+             patch("app.engines.trading_cycle.get_prices_for_pm", return_value={"SPY": 100.0}), \
+             patch("app.engines.trading_cycle.get_market_context", return_value={"spy_price": 100.0, "vix": 15.0}), \
+             patch("app.engines.trading_cycle._get_cash", side_effect=cash), \
+             patch("app.engines.broker.get_broker_for_pm", return_value=ObservedBroker()), \
+             patch("app.engines.trading_cycle.llm_engine.make_decision", new_callable=AsyncMock,
+                   return_value={"action": "BUY", "conviction": 0.9, "reasoning": "buy", "position_size": 0.03}):
+            result = await run_pm_cycle(pm, db)
+        assert result.get("trade_executed")
+        assert seen["checks"] == (1, 0)
+        assert seen["broker"] == (0, 1)
+        assert metrics.gauge("orders_pending") == 0
+        assert metrics.gauge("orders_executing") == 0
+
     @pytest.mark.asyncio
     async def test_skips_on_insufficient_price_data(self, db, pm):
         # 라인 40: prices가 짧을 때 skipped 반환
@@ -314,3 +425,133 @@ class TestRunPmCycleMocked:
             result = await run_pm_cycle(pm, db)
             # 매수 실행 시 자본이 업데이트되어야 함
             assert pm.current_capital >= 0.0
+
+
+class TestBatchDecisions:
+    @pytest.fixture
+    def batch_pm(self, db):
+        p = PM(id="atlas", name="Atlas", emoji="🌍", strategy="macro", llm_provider="claude",
+               current_capital=100_000.0, is_active=True)
+        db.add(p)
+        db.commit()
+        return p
+
+    @pytest.fixture
+    async def matrix(self):
+        import numpy as np
+        import pandas as pd
+        from app.engines.market_data import PM_WATCHLISTS
+        from app.engines.signal_matrix import SignalMatrix
+
+        m = SignalMatrix()
+        with patch("app.engines.signal_matrix.get_market_context", return_value={"vix": 15.0}):
+            await m.refresh(
+                PM_WATCHLISTS["atlas"],
+                history_fn=lambda s, d: pd.Series(np.linspace(90.0, 110.0, d)),
+                price_fn=lambda s: 100.0,
+            )
+        return m
+
+    @pytest.fixture
+    def batch_mode(self, monkeypatch):
+        from app.config import settings
+        monkeypatch.setattr(settings, "llm_batch_decisions", True)
+
+    @pytest.mark.asyncio
+    async def test_one_call_covers_whole_watchlist(self, db, batch_pm, matrix, batch_mode):
+        from app.engines.market_data import PM_WATCHLISTS
+        from app.engines.trading_cycle import run_pm_cycle
+
+        watchlist = PM_WATCHLISTS["atlas"]
+        decisions = {sym: {"action": "HOLD", "conviction": 0.0, "reasoning": "", "position_size": 0.0}
+                     for sym in watchlist}
+        decisions["SPY"] = {"action": "BUY", "conviction": 0.9, "reasoning": "buy", "position_size": 0.03}
+        decisions["GLD"] = {"action": "BUY", "conviction": 0.8, "reasoning": "buy", "position_size": 0.03}
+        with patch("app.engines.trading_cycle.llm_engine.make_batch_decision", new_callable=AsyncMock,
+                   return_value=decisions) as batch, \
+             patch("app.engines.trading_cycle.llm_engine.make_decision", new_callable=AsyncMock) as single, \
+             patch("app.engines.trading_cycle._rule_based_decision",
+                   return_value={"action": "HOLD", "conviction": 0.0}):
+            result = await run_pm_cycle(batch_pm, db, matrix=matrix)
+
+        batch.assert_awaited_once()
+        single.assert_not_called()
+        assert set(batch.call_args.kwargs["quant_signals"]) == set(watchlist)
+        assert result["trade_executed"] is True
+        assert [d["symbol"] for d in result["decisions"]] == watchlist
+        assert {t.symbol for t in db.query(Trade).all()} == {"SPY", "GLD"}
+        assert db.query(Signal).filter_by(pm_id="atlas").count() == len(watchlist)
+
+    @pytest.mark.asyncio
+    async def test_llm_error_falls_back_to_rules(self, db, batch_pm, matrix, batch_mode):
+        from app.engines.trading_cycle import run_pm_cycle
+
+        with patch("app.engines.trading_cycle.llm_engine.make_batch_decision", new_callable=AsyncMock,
+                   side_effect=RuntimeError("no key")):
+            result = await run_pm_cycle(batch_pm, db, matrix=matrix)
+        assert len(result["decisions"]) == 5
+        assert all(d["reasoning"] for d in result["decisions"])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("buffered", [False, True])
+    async def test_error_after_fill_logs_discarded_fill(self, db, batch_pm, matrix, batch_mode, buffered, caplog):
+        from app.engines import trading_cycle
+        from app.engines.market_data import PM_WATCHLISTS
+        from app.services.cycle_writer import CycleWriteBuffer
+
+        real_buy = trading_cycle._execute_buy
+
+        async def buy_then_fail(pm, symbol, *args, **kwargs):
+            if symbol == "GLD":
+                raise OSError("disk full")
+            return await real_buy(pm, symbol, *args, **kwargs)
+
+        decisions = {sym: {"action": "HOLD", "conviction": 0.0, "reasoning": "", "position_size": 0.0}
+                     for sym in PM_WATCHLISTS["atlas"]}
+        decisions["SPY"] = {"action": "BUY", "conviction": 0.9, "reasoning": "buy", "position_size": 0.03}
+        decisions["GLD"] = {"action": "BUY", "conviction": 0.8, "reasoning": "buy", "position_size": 0.03}
+        buffer = CycleWriteBuffer() if buffered else None
+        with patch("app.engines.trading_cycle.llm_engine.make_batch_decision", new_callable=AsyncMock,
+                   return_value=decisions), \
+             patch.object(trading_cycle, "_execute_buy", side_effect=buy_then_fail), \
+             caplog.at_level("ERROR"):
+            result = await trading_cycle.run_pm_cycle(batch_pm, db, matrix=matrix, buffer=buffer)
+
+        assert result["status"] == "error"
+        assert db.query(Trade).count() == 0
+        # SPY는 브로커에서 이미 체결 → 버리면서 대사 로그
+        assert "Unsaved fill — pm=atlas symbol=SPY side=BUY" in caplog.text
+        assert "reason=cycle error: disk full" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_disabled_uses_single_symbol(self, db, batch_pm, matrix):
+        from app.engines.trading_cycle import run_pm_cycle
+
+        with patch("app.engines.trading_cycle.llm_engine.make_batch_decision", new_callable=AsyncMock) as batch, \
+             patch("app.engines.trading_cycle.llm_engine.make_decision", new_callable=AsyncMock,
+                   return_value={"action": "HOLD", "conviction": 0.5, "reasoning": "", "position_size": 0.0}):
+            result = await run_pm_cycle(batch_pm, db, matrix=matrix)
+        batch.assert_not_called()
+        assert "decisions" not in result
+
+
+class TestLLMShortCircuit:
+    @pytest.mark.asyncio
+    async def test_unavailable_provider_uses_rules_without_warning(self, db, pm, caplog):
+        import logging
+
+        import numpy as np
+        import pandas as pd
+        from app.engines.llm import ProviderUnavailable
+        from app.engines.trading_cycle import run_pm_cycle
+
+        prices = pd.Series(np.linspace(90.0, 110.0, 60))
+        with patch("app.engines.trading_cycle.get_price_history", return_value=prices), \
+             patch("app.engines.trading_cycle.get_prices_for_pm", return_value={"SPY": 110.0}), \
+             patch("app.engines.trading_cycle.get_market_context", return_value={"vix": 15.0}), \
+             patch("app.engines.trading_cycle.llm_engine.make_decision", new_callable=AsyncMock,
+                   side_effect=ProviderUnavailable("claude circuit open")), \
+             caplog.at_level(logging.WARNING, logger="app.engines.trading_cycle"):
+            result = await run_pm_cycle(pm, db)
+        assert result["action"] in ("BUY", "SELL", "HOLD")
+        assert "LLM fallback" not in caplog.text
@@ -0,0 +1,134 @@
+"""Google Trends 배치 수집기 유닛 테스트"""
+
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.engines.trends import TrendsCollector
+from app.models.trend_snapshot import TrendSnapshot
+
+
+def _session(frames: list[pd.DataFrame]) -> MagicMock:
+    session = MagicMock()
+    session.interest_over_time.side_effect = frames
+    return session
+
+
+def _frame(columns: dict[str, list[float]]) -> pd.DataFrame:
+    return pd.DataFrame(columns)
+
+
+class TestBatching:
+    def test_four_keywords_plus_anchor_per_payload(self):
+        keywords = [f"K{i}" for i in range(9)]
+        frames = [
+            _frame({k: [10, 20] for k in keywords[i:i + 4] + ["anchor"]})
+            for i in range(0, 9, 4)
+        ]
+        session = _session(frames)
+        factory = MagicMock(return_value=session)
+        collector = TrendsCollector(session_factory=factory, anchor="anchor")
+
+        results = collector.fetch(keywords)
+        assert set(results) == set(keywords)
+        assert collector.requests_made == 3
+        factory.assert_called_once()  # 세션 재사용
+        payloads = [c.args[0] for c in session.build_payload.call_args_list]
+        assert all(len(p) <= 5 and p[-1] == "anchor" for p in payloads)
+
+    def test_anchor_normalizes_across_batches(self):
+        frames = [
+            _frame({"A": [10, 40], "B": [1, 1], "C": [1, 1], "D": [1, 1], "anchor": [50, 50]}),
+            _frame({"E": [20, 80], "anchor": [100, 100]}),
+        ]
+        collector = TrendsCollector(session_factory=lambda: _session(frames), anchor="anchor")
+        result = collector.fetch(["A", "B", "C", "D", "E"])["E"]
+        # 두 번째 배치는 앵커가 2배 → 값 절반으로 보정
+        assert result["current_interest"] == 40
+
+    def test_anchor_reference_recomputed_each_fetch(self):
+        frames = [
+            _frame({"A": [10, 40], "anchor": [0, 0]}),
+            _frame({"A": [10, 40], "B": [1, 1], "C": [1, 1], "D": [1, 1], "anchor": [25, 25]}),
+            _frame({"E": [20, 80], "anchor": [50, 50]}),
+        ]
+        collector = TrendsCollector(session_factory=lambda: _session(frames), anchor="anchor")
+        # 앵커 평균 0인 수집이 이후 수집의 스케일 보정을 막지 않음
+        assert collector.fetch(["A"])["A"]["current_interest"] == 40
+        assert collector.fetch(["A", "B", "C", "D", "E"])["E"]["current_interest"] == 40
+
+    def test_error_uses_fallback(self):
+        session = MagicMock()
+        session.interest_over_time.side_effect = ConnectionError("429")
+        collector = TrendsCollector(
+            session_factory=lambda: session, anchor="anchor",
+            fallback=lambda k: {"keyword": k, "source": "trends_mock"},
+        )
+        result = collector.fetch(["A", "B"])
+        assert result["A"]["source"] == "trends_mock"
+        assert "error" in result["B"]
+
+    def test_rate_limit_falls_back_for_that_batch_only(self):
+        from pytrends.exceptions import TooManyRequestsError
+
+        session = MagicMock()
+        session.interest_over_time.side_effect = [
+            TooManyRequestsError("The request failed: Google returned a response with code 429", None),
+            _frame({"E": [10, 30], "anchor": [50, 50]}),
+        ]
+        collector = TrendsCollector(
+            session_factory=lambda: session, anchor="anchor",
+            fallback=lambda k: {"keyword": k, "source": "trends_mock"},
+        )
+        result = collector.fetch(["A", "B", "C", "D", "E"])
+        assert result["A"]["source"] == "trends_mock"
+        assert result["E"]["source"] == "google_trends"
+        assert collector.cached("E") is not None
+
+
+class TestCache:
+    def test_cached_reads_without_network(self):
+        session = _session([_frame({"A": [10, 20], "anchor": [5, 5]})])
+        collector = TrendsCollector(session_factory=lambda: session, anchor="anchor")
+        assert collector.cached("A") is None
+        collector.fetch(["A"], timeframe="now 7-d")
+        assert collector.cached("A")["current_interest"] == 20
+        assert collector.cached("A", timeframe="today 3-m") is None
+        assert session.interest_over_time.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_background_refresh(self):
+        session = _session([_frame({"A": [10, 20], "anchor": [5, 5]})])
+        collector = TrendsCollector(session_factory=lambda: session, anchor="anchor")
+        assert await collector.refresh(["A"]) == 1
+        assert collector.get_status()["cached"] == {"now 7-d": 1}
+
+
+class TestSnapshots:
+    @pytest.fixture
+    def db_factory(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine, tables=[TrendSnapshot.__table__])
+        yield sessionmaker(bind=engine)
+        engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_refresh_persists_for_other_workers(self, db_factory):
+        session = _session([_frame({"A": [10, 20], "anchor": [5, 5]}), _frame({"A": [10, 30], "anchor": [5, 5]})])
+        leader = TrendsCollector(
+            session_factory=lambda: session, anchor="anchor",
+            fallback=lambda k: {"keyword": k, "source": "trends_mock"}, db_factory=db_factory,
+        )
+        assert await leader.refresh(["A", "B"]) == 1
+        assert await leader.refresh(["A"]) == 1
+
+        db = db_factory()
+        stored = TrendsCollector.snapshots(db, ["A", "B"])
+        db.close()
+        assert set(stored) == {"A"}  # mock 결과는 기록하지 않음
+        assert stored["A"]["current_interest"] == 30
+        assert stored["A"]["source"] == "google_trends"
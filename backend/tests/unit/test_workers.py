@@ -0,0 +1,101 @@
+"""CPU 워커 풀 + 오프로드 대상 엔진 유닛 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from app.config import settings
+from app.core import workers
+from app.core.workers import (
+    SharedArray,
+    load_array,
+    release_array,
+    run_cpu,
+    run_cpu_with_array,
+    share_array,
+    shutdown_pool,
+)
+from app.engines.backtest import simulate
+from app.engines.quant import QuantEngine
+
+
+def _prices(n: int = 120) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    return 100.0 * np.cumprod(1 + rng.normal(0.0005, 0.01, n))
+
+
+def _sum_worker(values) -> float:
+    shm, arr = load_array(values)
+    try:
+        return float(arr.sum())
+    finally:
+        if shm is not None:
+            shm.close()
+
+
+@pytest.fixture
+def pool_enabled():
+    with patch.object(settings, "worker_processes", 2), \
+         patch.object(settings, "shared_memory_min_length", 10):
+        yield
+    shutdown_pool()
+
+
+class TestSharedArray:
+    def test_roundtrip(self):
+        values = _prices(50)
+        shm, handle = share_array(values)
+        try:
+            assert isinstance(handle, SharedArray)
+            view_shm, view = handle.attach()
+            np.testing.assert_array_equal(view, values)
+            del view
+            view_shm.close()
+        finally:
+            release_array(shm)
+
+    def test_load_array_passthrough(self):
+        shm, arr = load_array([1.0, 2.0])
+        assert shm is None
+        assert arr.dtype == np.float64
+
+
+class TestRunCpu:
+    @pytest.mark.asyncio
+    async def test_inline_when_pool_disabled(self):
+        assert workers.get_pool() is None
+        assert await run_cpu(sum, [1, 2, 3]) == 6
+
+    @pytest.mark.asyncio
+    async def test_process_pool_with_shared_memory(self, pool_enabled):
+        values = _prices(1000)
+        result = await run_cpu_with_array(_sum_worker, values)
+        assert result == pytest.approx(values.sum())
+        assert workers.get_pool() is not None
+
+
+class TestOffloadedEngines:
+    @pytest.mark.asyncio
+    async def test_quant_async_matches_sync(self, pool_enabled):
+        prices = pd.Series(_prices(60))
+        qe = QuantEngine()
+        assert await qe.generate_signals_async(prices, "SPY") == qe.generate_signals(prices, "SPY")
+
+    @pytest.mark.asyncio
+    async def test_backtest_in_pool_matches_inline(self, pool_enabled):
+        values = _prices(110)
+        inline = simulate(values, "rsi_momentum", "SPY")
+        pooled = await run_cpu_with_array(simulate, values, "rsi_momentum", "SPY")
+        assert pooled["total_return_pct"] == inline["total_return_pct"]
+        assert [tuple(p) for p in pooled["chart_points"]] == inline["chart_points"]
+
+
+class TestSimulate:
+    def test_buy_hold_tracks_benchmark(self):
+        result = simulate(_prices(90), "buy_hold")
+        assert abs(result["total_return_pct"] - result["benchmark_return_pct"]) < 2.0
+
+    def test_chart_points_use_array_positions(self):
+        result = simulate(_prices(60), "trend_follow")
+        assert all(i % 3 == 0 and 20 <= i < 60 for i, _, _ in result["chart_points"])
@@ -69,8 +69,18 @@ interface PipelineStats {
   executing: number;
   completed_24h: number;
   rejected_24h: number;
+  worker_id: string;
+  is_leader: boolean;
+  leader: string | null;
 }
 
+const PIPELINE_COUNTERS = [
+  "pending",
+  "executing",
+  "completed_24h",
+  "rejected_24h",
+] as const;
+
 const SERVICE_ICONS: Record<string, string> = {
   backend: "🟢",
   database: "🗄️",
@@ -319,7 +329,8 @@ export function SystemTab() {
           </p>
           <div className="grid grid-cols-2 gap-3">
             {pipeline &&
-              Object.entries(pipeline).map(([key, value]) => {
+              PIPELINE_COUNTERS.map((key) => {
+                const value = pipeline[key];
                 const isActive = key === "pending" || key === "executing";
                 return (
                   <div
@@ -9,7 +9,7 @@ interface CryptoPrice {
   symbol: string;
   coin: string;
   price: number;
-  change_24h: number;
+  change_24h: number | null;
 }
 
 interface FearGreed {
@@ -171,12 +171,16 @@ export default function CryptoDashboard() {
                       maximumFractionDigits: p.price < 10 ? 4 : 2,
                     })}
                   </div>
-                  <div
-                    className={`text-xs font-mono mt-1 ${p.change_24h >= 0 ? "text-green-400" : "text-red-400"}`}
-                  >
-                    {p.change_24h >= 0 ? "+" : ""}
-                    {p.change_24h.toFixed(2)}% 24h
-                  </div>
+                  {p.change_24h === null ? (
+                    <div className="text-xs font-mono mt-1 text-gray-500">— 24h</div>
+                  ) : (
+                    <div
+                      className={`text-xs font-mono mt-1 ${p.change_24h >= 0 ? "text-green-400" : "text-red-400"}`}
+                    >
+                      {p.change_24h >= 0 ? "+" : ""}
+                      {p.change_24h.toFixed(2)}% 24h
+                    </div>
+                  )}
                 </div>
               ))}
         </div>
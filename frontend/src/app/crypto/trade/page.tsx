@@ -9,7 +9,7 @@ interface CryptoPrice {
   symbol: string;
   coin: string;
   price: number;
-  change_24h: number;
+  change_24h: number | null;
 }
 
 interface TradeResult {
@@ -210,12 +210,16 @@ export default function CryptoTrade() {
                   maximumFractionDigits: p.price < 10 ? 4 : 2,
                 })}
               </span>
-              <span
-                className={`text-[10px] font-mono ${p.change_24h >= 0 ? "text-green-400" : "text-red-400"}`}
-              >
-                {p.change_24h >= 0 ? "+" : ""}
-                {p.change_24h.toFixed(1)}%
-              </span>
+              {p.change_24h === null ? (
+                <span className="text-[10px] font-mono text-gray-500">—</span>
+              ) : (
+                <span
+                  className={`text-[10px] font-mono ${p.change_24h >= 0 ? "text-green-400" : "text-red-400"}`}
+                >
+                  {p.change_24h >= 0 ? "+" : ""}
+                  {p.change_24h.toFixed(1)}%
+                </span>
+              )}
             </div>
           ))}
         </div>